@@ -1,28 +1,61 @@
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-import time
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pathlib import Path
 from datetime import datetime
-from config import APPLICATION_SETTINGS, RESUME_PATH, SCREENSHOTS_DIR, USER_INFO
+from config import APPLICATION_SETTINGS, RESUME_PATH, USER_INFO
+from browser_pool import BrowserPool
+from request_filter import TrafficMeter
+from waits import Waiter
+from screenshots import get_screenshot_service
+from database import ApplicationDatabase
+from easy_apply_form import FormModel, STEP_JS, FILL_JS, ACTION_SELECTOR, field_selector
+
+# Readiness signals for the adaptive waits
+JOB_PAGE_READY_SELECTOR = "button:has-text('Easy Apply'), .jobs-unified-top-card, .top-card-layout"
+EASY_APPLY_MODAL_SELECTOR = ".jobs-easy-apply-modal, [role='dialog']"
 
 class ApplicationBot:
-    def __init__(self):
+    def __init__(self, pool=None):
+        """Initialize the bot
+        
+        Args:
+            pool: BrowserPool to borrow pages from (None creates one lazily)
+        """
         self.resume_path = RESUME_PATH
-        self.screenshots_dir = SCREENSHOTS_DIR
+        self.screenshots = get_screenshot_service()
         self.user_info = USER_INFO
+        self.pool = pool
+        self.waits = Waiter()
+        self.forms = FormModel(ApplicationDatabase())
+    
+    def warm_up(self):
+        """Start the browser pool ahead of the first application"""
+        if self.pool is None:
+            self.pool = BrowserPool()
+        self.pool.start()
+    
+    def close(self):
+        """Shut down the browser pool once pending screenshots are written"""
+        self.waits.log_summary()
+        self.forms.log_summary()
+        self.screenshots.flush()
+        self.screenshots.log_summary()
+        if self.pool is not None:
+            self.pool.close()
     
     def apply_to_job(self, job_url, job_details):
         """Apply to a single job posting"""
         print(f"\n📝 Applying to: {job_details['title']} at {job_details['company']}")
         
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False, slow_mo=1000)  # Visible for debugging
-            context = browser.new_context()
-            page = context.new_page()
-            
+        self.warm_up()
+        
+        with self.pool.page() as page:
+            meter = TrafficMeter(page)
             try:
                 # Go to job page
+                meter.begin(job_url)
                 page.goto(job_url, timeout=30000)
-                time.sleep(3)
+                meter.report()
+                self.waits.for_selector(page, "job_page", JOB_PAGE_READY_SELECTOR)
                 
                 # Check if Easy Apply is available
                 easy_apply_button = page.query_selector("button:has-text('Easy Apply')")
@@ -31,38 +64,54 @@ class ApplicationBot:
                     result = self._easy_apply(page, job_details)
                 else:
                     # Take screenshot for manual application
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    company_safe = job_details['company'].replace(' ', '_').replace('/', '_')
-                    screenshot_path = self.screenshots_dir / f"manual_{company_safe}_{timestamp}.png"
-                    page.screenshot(path=str(screenshot_path))
-                    print(f"   ℹ️  No Easy Apply available. Screenshot saved: {screenshot_path.name}")
+                    screenshot_path = self.screenshots.capture(page, "manual", job_details)
+                    print(f"   ℹ️  No Easy Apply available. Screenshot saved: {Path(screenshot_path).name}")
                     result = {
                         "status": "manual_required",
-                        "screenshot": str(screenshot_path),
+                        "screenshot": screenshot_path,
                         "message": "Job requires manual application"
                     }
                     
             except Exception as e:
                 print(f"   ❌ Error applying to job: {e}")
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                company_safe = job_details.get('company', 'unknown').replace(' ', '_').replace('/', '_')
-                screenshot_path = self.screenshots_dir / f"error_{company_safe}_{timestamp}.png"
+                screenshot_path = None
                 try:
-                    page.screenshot(path=str(screenshot_path))
+                    screenshot_path = self.screenshots.capture(page, "error", job_details)
                 except:
                     pass
-                result = {"status": "error", "error": str(e), "screenshot": str(screenshot_path)}
-            finally:
-                browser.close()
+                result = {"status": "error", "error": str(e), "screenshot": screenshot_path}
             
             return result
     
+    def _attach_resume(self, page, fields):
+        """Upload the resume to the step's empty file inputs
+        
+        Returns:
+            list: Indices of the file fields that received it
+        """
+        attached = []
+        if not self.resume_path.exists():
+            return attached
+        
+        for field in fields:
+            if field['type'] != 'file' or field['value']:
+                continue
+            try:
+                before = self.waits.snapshot(page, EASY_APPLY_MODAL_SELECTOR)
+                page.set_input_files(field_selector(field['index']), str(self.resume_path))
+                print(f"      ✓ Uploaded resume")
+                self.waits.for_content_change(page, "resume_upload", EASY_APPLY_MODAL_SELECTOR, before)
+                attached.append(field['index'])
+            except Exception:
+                pass
+        return attached
+    
     def _easy_apply(self, page, job_details):
         """Handle LinkedIn Easy Apply"""
         try:
             # Click Easy Apply
             page.click("button:has-text('Easy Apply')")
-            time.sleep(2)
+            self.waits.for_selector(page, "easy_apply_open", EASY_APPLY_MODAL_SELECTOR)
             
             # Handle multi-step application
             max_steps = 10
@@ -72,114 +121,74 @@ class ApplicationBot:
                 current_step += 1
                 print(f"   Processing step {current_step}...")
                 
-                # Check for phone number field
-                phone_input = page.query_selector("input[id*='phoneNumber'], input[name*='phone']")
-                if phone_input:
-                    try:
-                        phone_input.fill(self.user_info['phone'])
-                        print(f"      ✓ Filled phone number")
-                    except:
-                        pass
-                
-                # Check for city/location field
-                city_input = page.query_selector("input[id*='city'], input[name*='city']")
-                if city_input:
-                    try:
-                        city_input.fill(self.user_info['city'])
-                        print(f"      ✓ Filled city")
-                    except:
-                        pass
-                
-                # Check for resume upload
-                resume_upload = page.query_selector("input[type='file']")
-                if resume_upload and self.resume_path.exists():
-                    try:
-                        resume_upload.set_input_files(str(self.resume_path))
-                        print(f"      ✓ Uploaded resume")
-                        time.sleep(1)
-                    except:
-                        pass
+                # Read the whole step (filling it from a cached layout) in one call
+                plan = self.forms.plan_for(job_details['company'], current_step)
+                state = page.evaluate(STEP_JS, {'modal': EASY_APPLY_MODAL_SELECTOR, 'plan': plan})
+                if state['planApplied']:
+                    values, failed = plan['values'], state['failed']
+                else:
+                    values = self.forms.resolve(state['fields'])
+                    failed = page.evaluate(FILL_JS, {'modal': EASY_APPLY_MODAL_SELECTOR, 'values': values}) if values else []
+                if len(values) > len(failed):
+                    print(f"      ✓ Filled {len(values) - len(failed)} fields")
                 
-                # Look for required fields that we can't fill automatically
-                required_fields = page.query_selector_all("input[required]:not([type='file']):not([type='hidden'])")
-                unfilled_required = [field for field in required_fields if not field.input_value()]
+                attached = self._attach_resume(page, state['fields'])
+                missing = self.forms.settle(job_details['company'], current_step, state, values, failed, attached)
                 
-                if unfilled_required:
-                    print(f"      ⚠️  {len(unfilled_required)} required fields need manual input")
+                if missing:
+                    print(f"      ⚠️  {len(missing)} required fields need manual input")
                     # Take screenshot for manual completion
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    company_safe = job_details['company'].replace(' ', '_').replace('/', '_')
-                    screenshot_path = self.screenshots_dir / f"manual_input_{company_safe}_{timestamp}.png"
-                    page.screenshot(path=str(screenshot_path))
+                    screenshot_path = self.screenshots.capture(page, "manual_input", job_details, EASY_APPLY_MODAL_SELECTOR)
                     
                     return {
                         "status": "manual_required",
-                        "screenshot": str(screenshot_path),
-                        "message": f"Application requires manual input for {len(unfilled_required)} fields"
+                        "screenshot": screenshot_path,
+                        "message": f"Application requires manual input for {len(missing)} fields: "
+                                   + "; ".join(f['label'] or f['type'] for f in missing)
                     }
                 
-                # Look for next/review/submit button
-                next_button = (
-                    page.query_selector("button[aria-label*='Continue']:not([disabled])") or
-                    page.query_selector("button[aria-label*='Review']:not([disabled])") or
-                    page.query_selector("button[aria-label*='Next']:not([disabled])") or
-                    page.query_selector("button:has-text('Next'):not([disabled])") or
-                    page.query_selector("button:has-text('Review'):not([disabled])")
-                )
-                
-                submit_button = (
-                    page.query_selector("button[aria-label*='Submit application']:not([disabled])") or
-                    page.query_selector("button:has-text('Submit application'):not([disabled])")
-                )
-                
-                if submit_button:
+                if state['action'] == 'submit':
                     # Final submit
                     print(f"      🎯 Submitting application...")
-                    submit_button.click()
-                    time.sleep(3)
+                    before = self.waits.snapshot(page, EASY_APPLY_MODAL_SELECTOR)
+                    page.click(ACTION_SELECTOR)
+                    self.waits.for_content_change(page, "submit", EASY_APPLY_MODAL_SELECTOR, before)
                     
                     # Take success screenshot
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    company_safe = job_details['company'].replace(' ', '_').replace('/', '_')
-                    screenshot_path = self.screenshots_dir / f"success_{company_safe}_{timestamp}.png"
-                    page.screenshot(path=str(screenshot_path))
+                    screenshot_path = self.screenshots.capture(page, "success", job_details, EASY_APPLY_MODAL_SELECTOR)
                     
                     print(f"   ✅ Application submitted successfully!")
                     return {
                         "status": "applied",
-                        "screenshot": str(screenshot_path),
+                        "screenshot": screenshot_path,
                         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     }
                 
-                elif next_button:
-                    next_button.click()
-                    time.sleep(2)
+                elif state['action'] == 'next':
+                    before = self.waits.snapshot(page, EASY_APPLY_MODAL_SELECTOR)
+                    page.click(ACTION_SELECTOR)
+                    self.waits.for_content_change(page, "easy_apply_step", EASY_APPLY_MODAL_SELECTOR, before)
                 else:
                     # No more buttons, might be done or stuck
                     print(f"      ⚠️  No next or submit button found")
                     break
             
             # If we get here, something went wrong
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            company_safe = job_details['company'].replace(' ', '_').replace('/', '_')
-            screenshot_path = self.screenshots_dir / f"incomplete_{company_safe}_{timestamp}.png"
-            page.screenshot(path=str(screenshot_path))
+            screenshot_path = self.screenshots.capture(page, "incomplete", job_details, EASY_APPLY_MODAL_SELECTOR)
             
             return {
                 "status": "incomplete",
-                "screenshot": str(screenshot_path),
+                "screenshot": screenshot_path,
                 "message": "Application flow incomplete"
             }
                 
         except Exception as e:
             # Take error screenshot
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            company_safe = job_details.get('company', 'unknown').replace(' ', '_').replace('/', '_')
-            screenshot_path = self.screenshots_dir / f"error_{company_safe}_{timestamp}.png"
+            screenshot_path = None
             try:
-                page.screenshot(path=str(screenshot_path))
+                screenshot_path = self.screenshots.capture(page, "error", job_details)
             except:
                 pass
             
             print(f"   ❌ Application error: {e}")
-            return {"status": "error", "error": str(e), "screenshot": str(screenshot_path)}
+            return {"status": "error", "error": str(e), "screenshot": screenshot_path}
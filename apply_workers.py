@@ -0,0 +1,225 @@
+"""
+Concurrent Easy Apply workers behind one global rate governor
+
+Each worker thread owns an ApplicationBot with its own single-context
+BrowserPool (Playwright's sync API is bound to the thread that started it),
+so several Easy Apply flows run at once. Every attempt first goes through
+the shared RateGovernor:
+
+- Daily cap: a worker reserves one of the day's application slots before it
+  takes a job. A slot is kept only if the application is submitted and is
+  handed back otherwise, so the number submitted never exceeds
+  max_applications_per_day, however many workers run.
+- Token bucket: attempts across all workers are spread to
+  apply_rate_per_minute (0 = no limit), with up to apply_burst back to back.
+- Company spacing: two attempts at the same company are at least
+  company_spacing_seconds apart.
+
+The asyncio routine shares the same governor through reserve_async() and
+wait_turn_async().
+
+Outcomes are recorded by the caller's callback (update_status and
+update_screenshot in main.py) from the worker thread; the database pool is
+thread-safe.
+"""
+
+import asyncio
+import threading
+import time
+from config import APPLICATION_SETTINGS
+from application_bot import ApplicationBot
+from browser_pool import BrowserPool
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateGovernor:
+    def __init__(self, daily_cap=None, already_sent=0, rate_per_minute=None, burst=None, company_spacing=None):
+        """Initialize the governor
+        
+        Args:
+            daily_cap: Applications allowed today (None uses config value)
+            already_sent: Applications already submitted today by earlier runs
+            rate_per_minute: Attempts allowed per minute across all workers, 0 for no limit
+                (None uses config value)
+            burst: Attempts allowed back to back (None uses config value)
+            company_spacing: Min seconds between attempts at one company (None uses config value)
+        """
+        self.daily_cap = APPLICATION_SETTINGS['max_applications_per_day'] if daily_cap is None else daily_cap
+        rate_per_minute = APPLICATION_SETTINGS['apply_rate_per_minute'] if rate_per_minute is None else rate_per_minute
+        self.rate = max(0.0, rate_per_minute) / 60.0  # 0 = unlimited
+        self.burst = max(1, burst or APPLICATION_SETTINGS['apply_burst'])
+        self.company_spacing = (
+            APPLICATION_SETTINGS['company_spacing_seconds'] if company_spacing is None else company_spacing
+        )
+        
+        self.sent = already_sent
+        self.reserved = 0
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._company_next = {}
+        self._cond = threading.Condition()
+    
+    @property
+    def remaining(self):
+        with self._cond:
+            return max(0, self.daily_cap - self.sent)
+    
+    def reserve(self):
+        """Claim one of today's application slots
+        
+        Blocks while every free slot is held by an attempt in flight, since a
+        failed attempt hands its slot back.
+        
+        Returns:
+            bool: False once the daily cap has been reached
+        """
+        with self._cond:
+            while self.sent + self.reserved >= self.daily_cap:
+                if self.sent >= self.daily_cap:
+                    return False
+                self._cond.wait()
+            self.reserved += 1
+            return True
+    
+    def release(self, submitted):
+        """Settle a reserved slot: keep it if the application was submitted"""
+        with self._cond:
+            self.reserved -= 1
+            if submitted:
+                self.sent += 1
+            self._cond.notify_all()
+    
+    def _refill(self, now):
+        if self.rate <= 0:
+            self._tokens = float(self.burst)
+        else:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+    
+    def _try_turn(self, key):
+        """Take a rate token and the company's turn if both are free
+        
+        Returns:
+            float: 0 once the turn is taken, else seconds to wait before trying again
+        """
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            token_wait = 0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            company_wait = max(0, self._company_next.get(key, 0) - now)
+            delay = max(token_wait, company_wait)
+            if delay <= 0:
+                self._tokens -= 1
+                self._company_next[key] = now + self.company_spacing
+            return delay
+    
+    def wait_turn(self, company):
+        """Block until a rate token is free and the company's spacing has passed"""
+        key = (company or "").strip().lower()
+        while True:
+            delay = self._try_turn(key)
+            if delay <= 0:
+                return
+            time.sleep(delay)
+    
+    async def reserve_async(self, poll_interval=0.5):
+        """reserve() for asyncio callers: polls instead of blocking the event loop"""
+        while True:
+            with self._cond:
+                if self.sent >= self.daily_cap:
+                    return False
+                if self.sent + self.reserved < self.daily_cap:
+                    self.reserved += 1
+                    return True
+            await asyncio.sleep(poll_interval)
+    
+    async def wait_turn_async(self, company):
+        """wait_turn() for asyncio callers"""
+        key = (company or "").strip().lower()
+        while True:
+            delay = self._try_turn(key)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+
+class ApplyWorkerPool:
+    def __init__(self, record_result, governor=None, workers=None, bot_factory=None):
+        """Initialize the pool (threads start in run())
+        
+        Args:
+            record_result: Callable(job, result) -> bool storing an outcome, True if submitted
+            governor: Shared RateGovernor (None creates one from config)
+            workers: Concurrent Easy Apply flows (None uses config value)
+            bot_factory: Callable returning a fresh bot per worker (None uses
+                ApplicationBot on a single-context BrowserPool)
+        """
+        self.record_result = record_result
+        self.governor = governor or RateGovernor()
+        self.workers = max(1, workers or APPLICATION_SETTINGS['apply_concurrency'])
+        self.bot_factory = bot_factory or (lambda: ApplicationBot(BrowserPool(size=1)))
+        self.attempts = 0
+        self.applied = 0
+        self._lock = threading.Lock()
+    
+    def run(self, next_job):
+        """Apply to jobs from next_job() on every worker until jobs or slots run out
+        
+        Args:
+            next_job: Callable returning the next job, or None when there are no more
+        
+        Returns:
+            int: Applications submitted
+        """
+        if not self.governor.remaining:
+            print(f"\n✓ Already sent {self.governor.daily_cap} applications today")
+            return 0
+        
+        threads = [
+            threading.Thread(target=self._work, args=(next_job,), name=f"apply-worker-{n + 1}", daemon=True)
+            for n in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        logger.info(f"Apply workers: {self.applied} submitted from {self.attempts} attempts "
+                    f"({self.workers} workers)")
+        if not self.governor.remaining:
+            print(f"\n✓ Reached {self.governor.daily_cap} applications for today; remaining jobs are saved for review")
+        return self.applied
+    
+    def _work(self, next_job):
+        bot = self.bot_factory()
+        try:
+            bot.warm_up()
+            while self.governor.reserve():
+                submitted = False
+                try:
+                    job = next_job()
+                    if job is None:
+                        break
+                    submitted = self._apply(bot, job)
+                finally:
+                    self.governor.release(submitted)
+        except Exception as e:
+            logger.error(f"{threading.current_thread().name} stopped: {e}", exc_info=True)
+        finally:
+            bot.close()
+    
+    def _apply(self, bot, job):
+        self.governor.wait_turn(job['company'])
+        with self._lock:
+            self.attempts += 1
+            attempt = self.attempts
+        print(f"\n--- Application attempt {attempt} ({self.governor.remaining} slots left today) ---")
+        
+        result = bot.apply_to_job(job['url'], job)
+        submitted = self.record_result(job, result)
+        if submitted:
+            with self._lock:
+                self.applied += 1
+        return submitted
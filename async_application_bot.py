@@ -0,0 +1,201 @@
+from playwright.async_api import async_playwright
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from config import APPLICATION_SETTINGS, BROWSER_SETTINGS, SESSIONS_DIR
+from application_bot import ApplicationBot, JOB_PAGE_READY_SELECTOR, EASY_APPLY_MODAL_SELECTOR
+from easy_apply_form import STEP_JS, FILL_JS, ACTION_SELECTOR, field_selector
+from scraper import CONTEXT_OPTIONS, read_session
+from request_filter import RequestFilter, TrafficMeter
+from waits import AsyncWaiter
+
+
+class AsyncApplicationBot(ApplicationBot):
+    """asyncio backend for ApplicationBot
+    
+    One browser is shared by every apply_to_job call on the event loop; each
+    application still runs in its own context, seeded with the saved LinkedIn
+    session. Use as an async context manager:
+        
+        async with AsyncApplicationBot() as bot:
+            await asyncio.gather(*(bot.apply_to_job(j['url'], j) for j in jobs))
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.session_file = SESSIONS_DIR / "linkedin_session.json"
+        self._playwright = None
+        self._browser = None
+        self.request_filter = RequestFilter("apply")
+        self.waits = AsyncWaiter()
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def start(self):
+        """Launch the shared browser"""
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=BROWSER_SETTINGS['headless'],
+                slow_mo=BROWSER_SETTINGS['slow_mo']
+            )
+    
+    async def close(self):
+        """Close the shared browser"""
+        if self._browser is not None:
+            self.request_filter.log_summary()
+            self.waits.log_summary()
+            self.forms.log_summary()
+            await asyncio.to_thread(self.screenshots.flush)
+            self.screenshots.log_summary()
+            await self._browser.close()
+            await self._playwright.stop()
+            self._browser = None
+            self._playwright = None
+    
+    async def apply_to_job(self, job_url, job_details):
+        """Apply to a single job posting"""
+        print(f"\n📝 Applying to: {job_details['title']} at {job_details['company']}")
+        
+        await self.start()
+        options = dict(CONTEXT_OPTIONS)
+        session_data = read_session(self.session_file)
+        if session_data and session_data.get('storage'):
+            options['storage_state'] = session_data['storage']
+        context = await self._browser.new_context(**options)
+        await self.request_filter.install_async(context)
+        page = await context.new_page()
+        meter = TrafficMeter(page)
+        
+        try:
+            meter.begin(job_url)
+            await page.goto(job_url, timeout=30000)
+            meter.report()
+            await self.waits.for_selector(page, "job_page", JOB_PAGE_READY_SELECTOR)
+            
+            easy_apply_button = await page.query_selector("button:has-text('Easy Apply')")
+            
+            if easy_apply_button and APPLICATION_SETTINGS['auto_apply']:
+                result = await self._easy_apply(page, job_details)
+            else:
+                screenshot_path = await self.screenshots.capture_async(page, "manual", job_details)
+                print(f"   ℹ️  No Easy Apply available. Screenshot saved: {Path(screenshot_path).name}")
+                result = {
+                    "status": "manual_required",
+                    "screenshot": screenshot_path,
+                    "message": "Job requires manual application"
+                }
+        
+        except Exception as e:
+            print(f"   ❌ Error applying to job: {e}")
+            screenshot_path = None
+            try:
+                screenshot_path = await self.screenshots.capture_async(page, "error", job_details)
+            except:
+                pass
+            result = {"status": "error", "error": str(e), "screenshot": screenshot_path}
+        finally:
+            await context.close()
+        
+        return result
+    
+    async def _attach_resume(self, page, fields):
+        attached = []
+        if not self.resume_path.exists():
+            return attached
+        
+        for field in fields:
+            if field['type'] != 'file' or field['value']:
+                continue
+            try:
+                before = await self.waits.snapshot(page, EASY_APPLY_MODAL_SELECTOR)
+                await page.set_input_files(field_selector(field['index']), str(self.resume_path))
+                print("      ✓ Uploaded resume")
+                await self.waits.for_content_change(page, "resume_upload", EASY_APPLY_MODAL_SELECTOR, before)
+                attached.append(field['index'])
+            except Exception:
+                pass
+        return attached
+    
+    async def _easy_apply(self, page, job_details):
+        """Handle LinkedIn Easy Apply"""
+        try:
+            await page.click("button:has-text('Easy Apply')")
+            await self.waits.for_selector(page, "easy_apply_open", EASY_APPLY_MODAL_SELECTOR)
+            
+            max_steps = 10
+            current_step = 0
+            
+            while current_step < max_steps:
+                current_step += 1
+                print(f"   Processing step {current_step}...")
+                
+                plan = self.forms.plan_for(job_details['company'], current_step)
+                state = await page.evaluate(STEP_JS, {'modal': EASY_APPLY_MODAL_SELECTOR, 'plan': plan})
+                if state['planApplied']:
+                    values, failed = plan['values'], state['failed']
+                else:
+                    values = self.forms.resolve(state['fields'])
+                    failed = await page.evaluate(FILL_JS, {'modal': EASY_APPLY_MODAL_SELECTOR, 'values': values}) if values else []
+                if len(values) > len(failed):
+                    print(f"      ✓ Filled {len(values) - len(failed)} fields")
+                
+                attached = await self._attach_resume(page, state['fields'])
+                missing = self.forms.settle(job_details['company'], current_step, state, values, failed, attached)
+                
+                if missing:
+                    print(f"      ⚠️  {len(missing)} required fields need manual input")
+                    screenshot_path = await self.screenshots.capture_async(page, "manual_input", job_details, EASY_APPLY_MODAL_SELECTOR)
+                    
+                    return {
+                        "status": "manual_required",
+                        "screenshot": screenshot_path,
+                        "message": f"Application requires manual input for {len(missing)} fields: "
+                                   + "; ".join(f['label'] or f['type'] for f in missing)
+                    }
+                
+                if state['action'] == 'submit':
+                    print("      🎯 Submitting application...")
+                    before = await self.waits.snapshot(page, EASY_APPLY_MODAL_SELECTOR)
+                    await page.click(ACTION_SELECTOR)
+                    await self.waits.for_content_change(page, "submit", EASY_APPLY_MODAL_SELECTOR, before)
+                    
+                    screenshot_path = await self.screenshots.capture_async(page, "success", job_details, EASY_APPLY_MODAL_SELECTOR)
+                    
+                    print("   ✅ Application submitted successfully!")
+                    return {
+                        "status": "applied",
+                        "screenshot": screenshot_path,
+                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    }
+                
+                elif state['action'] == 'next':
+                    before = await self.waits.snapshot(page, EASY_APPLY_MODAL_SELECTOR)
+                    await page.click(ACTION_SELECTOR)
+                    await self.waits.for_content_change(page, "easy_apply_step", EASY_APPLY_MODAL_SELECTOR, before)
+                else:
+                    print("      ⚠️  No next or submit button found")
+                    break
+            
+            screenshot_path = await self.screenshots.capture_async(page, "incomplete", job_details, EASY_APPLY_MODAL_SELECTOR)
+            
+            return {
+                "status": "incomplete",
+                "screenshot": screenshot_path,
+                "message": "Application flow incomplete"
+            }
+        
+        except Exception as e:
+            screenshot_path = None
+            try:
+                screenshot_path = await self.screenshots.capture_async(page, "error", job_details)
+            except:
+                pass
+            
+            print(f"   ❌ Application error: {e}")
+            return {"status": "error", "error": str(e), "screenshot": screenshot_path}
@@ -0,0 +1,402 @@
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+import asyncio
+from datetime import datetime
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from config import RETRY_SETTINGS, BROWSER_SETTINGS, SCRAPER_SETTINGS
+from scraper import (
+    JobScraper, CONTEXT_OPTIONS, EXTRACT_CARDS_JS, CARD_SELECTOR, SCAN_CARDS_JS, SHOW_MORE_SELECTOR,
+    RESULTS_PER_PAGE
+)
+from request_filter import TrafficMeter
+from scrape_queue import ScrapeQueue
+from waits import AsyncWaiter
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncJobScraper(JobScraper):
+    """asyncio backend for JobScraper
+    
+    Same public methods as JobScraper, but browser work is awaited so many
+    searches can share one event loop. Filtering, session files and database
+    saving are inherited unchanged.
+    """
+    
+    def __init__(self, headless=None, use_cache=True):
+        super().__init__(headless, use_cache)
+        self.waits = AsyncWaiter()
+    
+    async def _human_delay(self, min_seconds=1, max_seconds=3, step="human"):
+        """Random delay to mimic human behavior (the politeness floor when waits are adaptive)"""
+        await self.waits.pause(step, min_seconds, max_seconds)
+    
+    async def _save_session(self, context):
+        """Save browser session (cookies) for reuse"""
+        try:
+            self._write_session(await context.cookies(), await context.storage_state())
+        except Exception as e:
+            logger.warning(f"Failed to save session: {e}")
+    
+    async def _load_session(self, context):
+        """Load saved browser session if available"""
+        session_data = self._read_session()
+        if not session_data:
+            return False
+        
+        try:
+            await context.add_cookies(session_data['cookies'])
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to load session: {e}")
+            return False
+    
+    async def _throttle(self, url):
+        """Wait for this host's next politeness slot"""
+        delay = self.throttle.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    @retry(
+        stop=stop_after_attempt(RETRY_SETTINGS['max_attempts']),
+        wait=wait_exponential(
+            multiplier=RETRY_SETTINGS['exponential_base'],
+            min=RETRY_SETTINGS['wait_min'],
+            max=RETRY_SETTINGS['wait_max']
+        ),
+        retry=retry_if_exception_type((PlaywrightTimeoutError, ConnectionError)),
+        reraise=True
+    )
+    async def scrape_linkedin_jobs(self):
+        """Scrape job listings from LinkedIn, running searches concurrently
+        
+        Uses the same durable ScrapeQueue as JobScraper, so finished searches
+        survive a crash and only failed ones are retried.
+        """
+        if not self.credentials['email'] or not self.credentials['password']:
+            logger.error("LinkedIn credentials not found in .env file")
+            logger.info("Please add LINKEDIN_EMAIL and LINKEDIN_PASSWORD to your .env file")
+            return []
+        
+        logger.info("Starting LinkedIn job scraping (async)...")
+        self._load_seen_index()
+        
+        queue = ScrapeQueue(self.db, self._search_units())
+        self._serve_from_cache(queue)
+        if not queue.pending():
+            print("\n⚡ Every search was answered from the result cache")
+            queue.finish()
+        else:
+            async with async_playwright() as p:
+                try:
+                    browser = await p.chromium.launch(
+                        headless=self.headless,
+                        slow_mo=BROWSER_SETTINGS['slow_mo']
+                    )
+                    context = await browser.new_context(**CONTEXT_OPTIONS)
+                    await self.request_filter.install_async(context)
+                    page = await context.new_page()
+                    
+                    session_loaded = await self._load_session(context)
+                    
+                    logger.info("🔐 Logging into LinkedIn...")
+                    if not await self._linkedin_login(page, skip_login=session_loaded):
+                        logger.error("Login failed")
+                        await browser.close()
+                        return []
+                    
+                    await self._save_session(context)
+                    await page.close()
+                    
+                    logger.info("✓ Login successful")
+                    
+                    await self._run_queue(queue, context)
+                    
+                    self.request_filter.log_summary()
+                    self.waits.log_summary()
+                    
+                    await browser.close()
+                
+                except Exception as e:
+                    print(f"❌ Error during scraping: {e}")
+                    print("   Searches finished so far are kept; the next scrape resumes the rest")
+        
+        filtered_jobs = self._filter_jobs(queue.results())
+        print(f"\n✓ Total unique jobs after filtering: {len(filtered_jobs)}")
+        return filtered_jobs
+    
+    async def _run_queue(self, queue, context):
+        """Search every pending unit concurrently, then retry failed ones in later rounds"""
+        # Each search gets its own page; the semaphore bounds open pages
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def run_search(keyword, location):
+            queue.start(keyword, location)
+            async with semaphore:
+                search_page = await context.new_page()
+                try:
+                    jobs = await self._search_keyword(search_page, keyword, location, TrafficMeter(search_page))
+                finally:
+                    await search_page.close()
+            if not isinstance(jobs, Exception):
+                jobs = await self._search_more_pages(context, keyword, location, jobs, semaphore)
+            self._record_search(queue, keyword, location, jobs)
+        
+        for attempt in range(queue.max_attempts):
+            searches = queue.pending()
+            if not searches:
+                break
+            if attempt:
+                delay = self._retry_delay(attempt)
+                logger.info(f"Retrying {len(searches)} failed searches in {delay:.0f}s")
+                await asyncio.sleep(delay)
+            await asyncio.gather(*(run_search(keyword, location) for keyword, location in searches))
+        
+        queue.finish()
+    
+    async def _linkedin_login(self, page, skip_login=False):
+        """Login to LinkedIn or verify existing session
+        
+        Args:
+            page: Playwright async page object
+            skip_login: If True, try to skip login if session is loaded
+        
+        Returns:
+            bool: True if login successful or session valid
+        """
+        try:
+            if skip_login:
+                logger.info("   → Verifying saved session...")
+                await page.goto("https://www.linkedin.com/feed/", timeout=BROWSER_SETTINGS['timeout'])
+                await self.waits.for_load(page, "session_check")
+                
+                try:
+                    await page.wait_for_selector("nav.global-nav", timeout=5000)
+                    logger.info("   ✓ Session is valid, skipping login!")
+                    return True
+                except PlaywrightTimeoutError:
+                    logger.warning("   ⚠️  Session expired, will login...")
+            
+            logger.info("   → Navigating to LinkedIn login page...")
+            await page.goto("https://www.linkedin.com/login", timeout=BROWSER_SETTINGS['timeout'])
+            await self.waits.for_selector(page, "login_form", "#username")
+            
+            logger.info("   → Filling credentials...")
+            await page.fill("#username", self.credentials['email'])
+            await self._human_delay(0.5, 1.5, step="typing")
+            await page.fill("#password", self.credentials['password'])
+            
+            logger.info("   → Submitting login form...")
+            await page.click("button[type='submit']")
+            await self.waits.for_load(page, "login_submit")
+            
+            logger.info("   → Waiting for login to complete...")
+            try:
+                await page.wait_for_selector("nav.global-nav", timeout=15000)
+                logger.info("   ✓ Login successful!")
+                await self._human_delay(step="after_login")
+                return True
+            except PlaywrightTimeoutError:
+                current_url = page.url
+                logger.warning(f"   ⚠️  Login timeout. Current URL: {current_url}")
+                
+                if "checkpoint" in current_url or "challenge" in current_url:
+                    logger.warning("=" * 60)
+                    logger.warning("⚠️  LINKEDIN SECURITY VERIFICATION REQUIRED")
+                    logger.warning("=" * 60)
+                    print("\nLinkedIn detected automation and requires verification.")
+                    print("Please check your email for a verification code or")
+                    print("complete the CAPTCHA in the browser window (if visible).")
+                    print("\nAfter completing verification, press Enter to continue...")
+                    print("=" * 60 + "\n")
+                    
+                    # Keep the event loop free while waiting on the terminal
+                    await asyncio.to_thread(input, "Press Enter after completing verification: ")
+                    
+                    try:
+                        await page.wait_for_selector("nav.global-nav", timeout=60000)
+                        logger.info("   ✓ Verification completed! Login successful!")
+                        return True
+                    except PlaywrightTimeoutError:
+                        logger.error("   ❌ Still can't detect successful login")
+                        logger.error(f"   Current URL: {page.url}")
+                        return False
+                
+                if "feed" in current_url or "mynetwork" in current_url:
+                    logger.info("   ✓ Appears to be logged in (on feed/network page)")
+                    return True
+                
+                error_elem = await page.query_selector(".form__label--error, .error-text, .alert")
+                if error_elem:
+                    error_msg = await error_elem.inner_text()
+                    logger.error(f"   ❌ Login error: {error_msg}")
+                else:
+                    logger.error("   ❌ Login failed - no navigation detected")
+                
+                return False
+        
+        except Exception as e:
+            logger.error(f"   ❌ Login error: {e}", exc_info=True)
+            return False
+    
+    async def _scan_cards(self, page):
+        """Card count and card URLs (without query) currently on the page"""
+        scan = await page.evaluate(SCAN_CARDS_JS, CARD_SELECTOR)
+        return scan['count'], [href.split('?')[0] for href in scan['hrefs'] if href]
+    
+    async def _scroll(self, page):
+        """Load the next chunk of results: "See more jobs" if shown, else scroll"""
+        show_more = await page.query_selector(SHOW_MORE_SELECTOR)
+        if show_more and await show_more.is_visible():
+            await show_more.click()
+        else:
+            await page.mouse.wheel(0, 10000)
+    
+    async def _load_results(self, page):
+        """Scroll one result page until it is saturated or stops growing"""
+        stall_rounds = max(1, SCRAPER_SETTINGS['scroll_stall_rounds'])
+        last_count = stalls = 0
+        
+        for _ in range(SCRAPER_SETTINGS['max_scrolls']):
+            try:
+                count, urls = await self._scan_cards(page)
+            except Exception as e:
+                logger.debug(f"Could not read result cards: {e}")
+                return
+            
+            stalls = stalls + 1 if count <= last_count else 0
+            last_count = count
+            if self._saturated(urls) or stalls >= stall_rounds:
+                return
+            
+            await self._scroll(page)
+            await self.waits.for_count_growth(page, "scroll", CARD_SELECTOR, count)
+    
+    async def _search_more_pages(self, context, keyword, location, jobs, semaphore):
+        """Fetch result pages 2..K of a search concurrently
+        
+        Same budget and early-stop rules as JobScraper._search_more_pages; each
+        extra page takes a slot from the shared semaphore.
+        """
+        if not self._more_pages_needed(jobs):
+            return jobs
+        
+        jobs = list(jobs)
+        offsets = [n * RESULTS_PER_PAGE for n in range(1, SCRAPER_SETTINGS['pages_per_search'])]
+        
+        async def fetch(start):
+            async with semaphore:
+                tab = await context.new_page()
+                try:
+                    return await self._search_keyword(tab, keyword, location, start=start)
+                finally:
+                    await tab.close()
+        
+        for first in range(0, len(offsets), self.concurrency):
+            wave = offsets[first:first + self.concurrency]
+            for page_jobs in await asyncio.gather(*(fetch(start) for start in wave)):
+                if isinstance(page_jobs, Exception) or self._merge_page_jobs(jobs, page_jobs):
+                    return jobs
+        
+        return jobs
+    
+    async def _search_keyword(self, page, keyword, location, meter=None, start=0):
+        """Search for jobs with specific keyword and location
+        
+        Returns:
+            list: New jobs, or the exception if the search failed
+        """
+        jobs = []
+        
+        try:
+            search_url = self._build_search_url(keyword, location, start)
+            await self._throttle(search_url)
+            if meter:
+                meter.begin(search_url)
+            await page.goto(search_url, timeout=30000)
+            
+            try:
+                await page.wait_for_selector(".jobs-search__results-list", timeout=10000)
+            except PlaywrightTimeoutError:
+                if not start:
+                    print(f"   No results found for {keyword} in {location}")
+                return []
+            if meter:
+                meter.report()
+            
+            # Scroll until there are enough new jobs or no more load
+            await self._load_results(page)
+            
+            jobs = await self._extract_jobs(page)
+        
+        except Exception as e:
+            print(f"   Search error: {e}")
+            return e
+        
+        return jobs
+    
+    async def _extract_jobs(self, page):
+        """Extract job cards from a loaded search results page"""
+        if SCRAPER_SETTINGS['extraction_mode'] == 'bulk':
+            return await self._extract_jobs_bulk(page)
+        return await self._extract_jobs_by_element(page)
+    
+    async def _extract_jobs_bulk(self, page):
+        """Extract every card with one page-side evaluation"""
+        cards = await page.eval_on_selector_all(CARD_SELECTOR, EXTRACT_CARDS_JS)
+        return self._cards_to_jobs(cards)
+    
+    async def _extract_jobs_by_element(self, page):
+        """Extract job cards one element lookup at a time"""
+        jobs = []
+        
+        try:
+            job_elements = await page.query_selector_all(".job-search-card")
+            
+            for job_elem in job_elements:
+                if len(jobs) >= self.max_jobs:  # Limit new jobs per search
+                    break
+                
+                try:
+                    link_elem = await job_elem.query_selector("a.base-card__full-link")
+                    if not link_elem:
+                        continue
+                    url = (await link_elem.get_attribute("href")).split('?')[0]  # Remove query params
+                    if self._is_known(url):
+                        continue
+                    
+                    title_elem = await job_elem.query_selector(".base-search-card__title")
+                    company_elem = await job_elem.query_selector(".base-search-card__subtitle")
+                    location_elem = await job_elem.query_selector(".job-search-card__location")
+                    
+                    if not all([title_elem, company_elem, location_elem]):
+                        continue
+                    
+                    job_data = {
+                        'title': (await title_elem.inner_text()).strip(),
+                        'company': (await company_elem.inner_text()).strip(),
+                        'location': (await location_elem.inner_text()).strip(),
+                        'url': url,
+                        'date': datetime.now().strftime('%Y-%m-%d')
+                    }
+                    
+                    time_elem = await job_elem.query_selector("time")
+                    if time_elem:
+                        job_data['date'] = await time_elem.get_attribute("datetime")
+                    
+                    salary_elem = await job_elem.query_selector(".job-search-card__salary-info")
+                    if salary_elem:
+                        job_data['salary'] = (await salary_elem.inner_text()).strip()
+                    else:
+                        job_data['salary'] = "Not specified"
+                    
+                    jobs.append(job_data)
+                
+                except Exception as e:
+                    print(f"   Error extracting job: {e}")
+                    continue
+        
+        except Exception as e:
+            print(f"   Extraction error: {e}")
+        
+        return jobs
@@ -0,0 +1,152 @@
+"""
+Long-lived browser/context pool for job applications
+
+One Chromium instance is launched and a few logged-in contexts are kept warm,
+so each application only pays for opening a page. Contexts are recycled after
+a number of uses or as soon as something goes wrong inside them.
+
+Playwright's sync API is bound to the thread that started it, so a pool must
+be used from a single thread.
+"""
+
+from contextlib import contextmanager
+from playwright.sync_api import sync_playwright
+from config import BROWSER_SETTINGS, BROWSER_POOL_SETTINGS, SESSIONS_DIR
+from scraper import CONTEXT_OPTIONS, read_session
+from request_filter import RequestFilter
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class _PooledContext:
+    """A browser context plus its usage bookkeeping"""
+    
+    def __init__(self, context):
+        self.context = context
+        self.uses = 0
+        self.broken = False
+
+
+class BrowserPool:
+    def __init__(self, size=None, max_uses=None, headless=None):
+        """Initialize the pool (nothing is launched until start())
+        
+        Args:
+            size: Contexts to pre-warm (None uses config value)
+            max_uses: Pages served by a context before it is replaced (None uses config value)
+            headless: Override config headless setting (None uses config value)
+        """
+        self.size = max(1, size or BROWSER_POOL_SETTINGS['size'])
+        self.max_uses = max(1, max_uses or BROWSER_POOL_SETTINGS['max_uses_per_context'])
+        self.headless = headless if headless is not None else BROWSER_SETTINGS['headless']
+        self.session_file = SESSIONS_DIR / "linkedin_session.json"
+        self._playwright = None
+        self._browser = None
+        self._idle = []
+        self.request_filter = RequestFilter("apply")
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    @property
+    def started(self):
+        return self._browser is not None
+    
+    def start(self):
+        """Launch the browser and pre-warm `size` contexts"""
+        if self.started:
+            return
+        
+        self._playwright = sync_playwright().start()
+        self._launch_browser()
+        self._idle = [self._new_context() for _ in range(self.size)]
+        logger.info(f"Browser pool ready ({self.size} contexts, recycle after {self.max_uses} uses)")
+    
+    def _launch_browser(self):
+        self._browser = self._playwright.chromium.launch(
+            headless=self.headless,
+            slow_mo=BROWSER_SETTINGS['slow_mo']
+        )
+    
+    def _new_context(self):
+        """Create a context carrying the saved LinkedIn session, if any"""
+        if not self._browser.is_connected():
+            logger.warning("Browser disconnected, relaunching")
+            self._launch_browser()
+        
+        options = dict(CONTEXT_OPTIONS)
+        session_data = read_session(self.session_file)
+        if session_data and session_data.get('storage'):
+            options['storage_state'] = session_data['storage']
+        
+        context = self._browser.new_context(**options)
+        context.set_default_timeout(BROWSER_SETTINGS['timeout'])
+        self.request_filter.install(context)
+        return _PooledContext(context)
+    
+    def _retire(self, pooled):
+        try:
+            pooled.context.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled context: {e}")
+    
+    @contextmanager
+    def page(self):
+        """Borrow a fresh page from a warm context
+        
+        The context is recycled if the page crashes, an exception escapes the
+        block, or it has reached max_uses.
+        """
+        self.start()
+        pooled = self._idle.pop() if self._idle else self._new_context()
+        page = None
+        
+        try:
+            page = pooled.context.new_page()
+            page.on("crash", lambda _: setattr(pooled, 'broken', True))
+            yield page
+        except Exception:
+            pooled.broken = True
+            raise
+        finally:
+            pooled.uses += 1
+            if page is not None:
+                try:
+                    page.close()
+                except Exception:
+                    pooled.broken = True
+            
+            if pooled.broken or pooled.uses >= self.max_uses:
+                logger.debug(f"Recycling context after {pooled.uses} uses (broken={pooled.broken})")
+                self._retire(pooled)
+                if len(self._idle) < self.size:
+                    try:
+                        self._idle.append(self._new_context())
+                    except Exception as e:
+                        # Will be retried lazily on the next page() call
+                        logger.warning(f"Could not replace pooled context: {e}")
+            else:
+                self._idle.append(pooled)
+    
+    def close(self):
+        """Close every context, the browser and Playwright"""
+        if not self.started:
+            return
+        
+        for pooled in self._idle:
+            self._retire(pooled)
+        self._idle = []
+        self.request_filter.log_summary()
+        
+        try:
+            self._browser.close()
+        finally:
+            self._playwright.stop()
+            self._browser = None
+            self._playwright = None
+        logger.info("Browser pool closed")
@@ -66,6 +66,10 @@ JOB_CRITERIA = {
 APPLICATION_SETTINGS = {
     "auto_apply": os.getenv("AUTO_APPLY_ENABLED", "false").lower() == "true",
     "max_applications_per_day": int(os.getenv("MAX_APPLICATIONS_PER_DAY", "10")),
+    "apply_concurrency": int(os.getenv("APPLY_CONCURRENCY", "2")),  # Easy Apply flows run at once (workers / async tasks)
+    "apply_rate_per_minute": float(os.getenv("APPLY_RATE_PER_MINUTE", "6")),  # Attempts per minute across all workers (0 = no limit)
+    "apply_burst": int(os.getenv("APPLY_BURST", "1")),  # Attempts allowed back to back before the rate applies
+    "company_spacing_seconds": float(os.getenv("APPLY_COMPANY_SPACING", "300")),  # Min gap between attempts at one company
     "cover_letter_template": TEMPLATES_DIR / "cover_letter.txt",
     "follow_up_days": 7,
     "avoid_quick_rejections": True
@@ -103,7 +107,122 @@ RETRY_SETTINGS = {
 BROWSER_SETTINGS = {
     "headless": os.getenv("HEADLESS_MODE", "true").lower() == "true",
     "slow_mo": 500,  # Slow down actions by milliseconds
-    "timeout": 30000  # Default timeout in milliseconds
+    "timeout": 30000,  # Default timeout in milliseconds
+    "viewport": os.getenv("BROWSER_VIEWPORT", "1280x800")  # WIDTHxHEIGHT of every page
+}
+
+# SQLite connection tuning (set DB_TUNED=false for a plain rollback-journal connection)
+DATABASE_SETTINGS = {
+    "tuned": os.getenv("DB_TUNED", "true").lower() == "true",
+    "journal_mode": os.getenv("DB_JOURNAL_MODE", "WAL"),  # WAL lets readers run alongside the writer
+    "synchronous": os.getenv("DB_SYNCHRONOUS", "NORMAL"),  # Safe with WAL, far fewer fsyncs than FULL
+    "cache_size_kb": int(os.getenv("DB_CACHE_SIZE_KB", "16384")),  # Page cache per connection
+    "mmap_size": int(os.getenv("DB_MMAP_SIZE", str(64 * 1024 * 1024))),  # Bytes of the file to memory-map
+    "temp_store": "MEMORY",
+    "busy_timeout_ms": int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000")),  # Wait this long on a locked database
+    "reader_connections": int(os.getenv("DB_READERS", "4")),  # Shared read connections per process
+    "search_candidates": int(os.getenv("SEARCH_CANDIDATES", "500"))  # search() ranks the newest N matches (0 = all)
+}
+
+# Browser pool used for applications (contexts are reused across jobs)
+BROWSER_POOL_SETTINGS = {
+    "size": int(os.getenv("BROWSER_POOL_SIZE", "2")),  # Contexts pre-warmed at startup
+    "max_uses_per_context": int(os.getenv("BROWSER_POOL_MAX_USES", "25"))  # Recycle a context after N jobs
+}
+
+# Scraper Settings
+SCRAPER_SETTINGS = {
+    "concurrency": int(os.getenv("SCRAPE_CONCURRENCY", "3")),  # Search pages open at once (1 = serial)
+    "host_min_interval": float(os.getenv("SCRAPE_HOST_INTERVAL", "2")),  # Min seconds between navigations to one host
+    "skip_known_jobs": os.getenv("SCRAPE_SKIP_KNOWN", "true").lower() == "true",  # Skip cards already in the database
+    "extraction_mode": os.getenv("SCRAPE_EXTRACTION", "bulk").lower(),  # "bulk" (one evaluate per page) or "element"
+    "max_jobs_per_search": int(os.getenv("SCRAPE_MAX_PER_SEARCH", "15")),  # New jobs kept per keyword/location
+    "scroll_stall_rounds": int(os.getenv("SCRAPE_STALL_ROUNDS", "2")),  # Stop scrolling after N scrolls with no new cards
+    "max_scrolls": int(os.getenv("SCRAPE_MAX_SCROLLS", "20")),  # Hard cap on scrolls per search page
+    "pages_per_search": int(os.getenv("SCRAPE_PAGES_PER_SEARCH", "3")),  # Result pages (25 jobs each) a search may read
+    "resume_max_age_hours": int(os.getenv("SCRAPE_RESUME_HOURS", "24")),  # Unfinished runs younger than this are resumed
+    "cache_ttl_minutes": int(os.getenv("SCRAPE_CACHE_TTL_MINUTES", "120")),  # Reuse search results this fresh (0 = off)
+    "cache_max_entries": int(os.getenv("SCRAPE_CACHE_MAX_ENTRIES", "500"))  # Least recently used searches evicted beyond this
+}
+
+# Pre-apply scoring: rank jobs against JOB_CRITERIA so the best ones are applied to first
+SCORING_SETTINGS = {
+    "enabled": os.getenv("SCORING_ENABLED", "true").lower() == "true",
+    "min_score": float(os.getenv("SCORE_MIN", "0.4")),  # Jobs scoring below this (0-1) are not applied to
+    "require_keyword": os.getenv("SCORE_REQUIRE_KEYWORD", "true").lower() == "true",  # Drop titles matching no keyword word
+    "weights": {  # Relative weight of each component in the total score
+        "keyword": 0.35,
+        "location": 0.2,
+        "salary": 0.15,
+        "recency": 0.15,
+        "experience": 0.15
+    },
+    "recency_half_life_days": 7,  # A posting's recency score halves every N days
+    "unknown_score": 0.5  # Score for a component the posting gives no data for (no salary, no date)
+}
+
+# Salary parsing: advertised pay is stored as a numeric annual range for filtering
+SALARY_SETTINGS = {
+    "default_period": os.getenv("SALARY_DEFAULT_PERIOD", "year"),  # Period assumed when the posting states none
+    "currency": os.getenv("SALARY_CURRENCY", "").upper(),  # Currency salary_range is in ("" matches any)
+    "periods_per_year": {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+}
+
+# Streaming daily routine: scrape -> save -> apply run concurrently
+PIPELINE_SETTINGS = {
+    "save_batch_size": int(os.getenv("PIPELINE_SAVE_BATCH", "10")),  # Jobs saved per database transaction
+    "apply_queue_size": int(os.getenv("PIPELINE_QUEUE_SIZE", "5"))  # Saved jobs waiting to be applied to before scraping pauses
+}
+
+# Screenshots: captured in memory, written on a background thread, deduplicated by content
+SCREENSHOT_SETTINGS = {
+    "format": os.getenv("SCREENSHOT_FORMAT", "jpeg").lower(),  # "jpeg" (compressed) or "png" (lossless)
+    "quality": int(os.getenv("SCREENSHOT_QUALITY", "70")),  # JPEG quality 0-100
+    "clip_to_modal": os.getenv("SCREENSHOT_CLIP_MODAL", "true").lower() == "true"  # Capture only the Easy Apply dialog when open
+}
+
+# Adaptive waits: block on readiness signals instead of fixed sleeps
+WAIT_SETTINGS = {
+    "adaptive": os.getenv("ADAPTIVE_WAITS", "true").lower() == "true",  # false = always sleep the full budget
+    "politeness_min": float(os.getenv("WAIT_POLITENESS_MIN", "0.3")),  # Every step takes at least this long (seconds)
+    "jitter": float(os.getenv("WAIT_JITTER", "0.5")),  # Random extra on top of the minimum (seconds)
+    "budgets": {  # Longest wait per step (seconds) - the fixed sleeps these replace
+        "session_check": 2.5,
+        "login_form": 2,
+        "login_submit": 3,
+        "scroll": 1,
+        "job_page": 3,
+        "easy_apply_open": 2,
+        "resume_upload": 1,
+        "easy_apply_step": 2,
+        "submit": 3
+    }
+}
+
+# Request interception: resource types and hosts aborted before they hit the network
+RESOURCE_BLOCKING = {
+    "enabled": os.getenv("BLOCK_RESOURCES", "true").lower() == "true",
+    "blocked_types": ["image", "media", "font", "texttrack", "manifest"],
+    "blocked_hosts": [  # Trackers and ad beacons (subdomains included)
+        "doubleclick.net", "googlesyndication.com", "google-analytics.com", "googletagmanager.com",
+        "ads.linkedin.com", "snap.licdn.com", "bat.bing.com", "connect.facebook.net"
+    ],
+    "allow": {  # Per-phase exceptions to blocked_types
+        "search": {"types": [], "hosts": []},
+        "apply": {"types": ["font"], "hosts": ["static.licdn.com"]}  # Keeps Easy Apply screenshots legible
+    }
+}
+
+# Near-duplicate detection: same role reposted or listed once per location
+DEDUPE_SETTINGS = {
+    "enabled": os.getenv("DEDUPE_ENABLED", "true").lower() == "true",
+    "title_similarity": float(os.getenv("DEDUPE_TITLE_SIMILARITY", "0.75")),  # Min title word overlap (Jaccard) for a match
+    "num_perm": 32,  # MinHash permutations per title
+    "bands": 16,  # LSH bands (num_perm / bands rows each); more bands = more candidates checked
+    "location_aliases": {  # Location word -> group; "*" matches any location
+        "nairobi": "kenya", "mombasa": "kenya", "nakuru": "kenya", "kisumu": "kenya",
+        "remote": "*", "anywhere": "*"
+    }
 }
 
 # Create necessary directories
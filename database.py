@@ -1,229 +1,952 @@
+import atexit
+import json
+import queue
+import re
 import sqlite3
-from datetime import datetime, timedelta
-from config import DB_PATH
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from config import DB_PATH, DATABASE_SETTINGS, SALARY_SETTINGS
 from logger import get_logger
+from migrations import FTS_PREFIX_LENGTHS, migrate, rebuild_status_rollup
+from salary import salary_columns
 
 logger = get_logger(__name__)
 
-class ApplicationDatabase:
-    def __init__(self):
-        self.conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row  # Enable column access by name
-        self.create_tables()
+INSERT_APPLICATION_SQL = '''
+INSERT OR IGNORE INTO applications 
+(job_title, company_name, job_url, location, salary_range, follow_up_date, date_posted,
+ salary_min, salary_max, currency, period)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def utc_date(days_ago=0):
+    """YYYY-MM-DD in UTC, the day basis of CURRENT_DATE and the stats triggers"""
+    return (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime('%Y-%m-%d')
+
+
+def fts_match(terms):
+    """FTS5 MATCH expression requiring every word, each as a prefix
     
-    def create_tables(self):
-        """Create all necessary database tables"""
-        cursor = self.conn.cursor()
-        
-        # Applications table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS applications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            job_title TEXT NOT NULL,
-            company_name TEXT NOT NULL,
-            job_url TEXT UNIQUE,
-            location TEXT,
-            salary_range TEXT,
-            date_applied DATE DEFAULT CURRENT_DATE,
-            application_status TEXT DEFAULT 'Applied',
-            status_updated DATE DEFAULT CURRENT_DATE,
-            follow_up_date DATE,
-            interview_date DATE,
-            notes TEXT,
-            resume_version TEXT,
-            cover_letter_sent BOOLEAN DEFAULT FALSE,
-            screenshot_path TEXT,
-            date_posted DATE
-        )
-        ''')
+    Args:
+        terms: Words from the search box
+    
+    Returns:
+        str: Quoted prefix phrases, so user input is never parsed as FTS syntax
+    """
+    # Longer prefixes than the index holds mean scanning every term sharing them
+    longest = FTS_PREFIX_LENGTHS[-1]
+    return " ".join(f'"{term[:longest]}"*' for term in terms)
+
+
+def connect(db_path=None, settings=None):
+    """Open a SQLite connection configured from DATABASE_SETTINGS
+    
+    Args:
+        db_path: Database file (None uses DB_PATH)
+        settings: Override DATABASE_SETTINGS (e.g. for benchmarks)
+    
+    Returns:
+        sqlite3.Connection with Row access by column name
+    """
+    settings = settings or DATABASE_SETTINGS
+    busy_timeout = settings['busy_timeout_ms'] / 1000
+    
+    conn = sqlite3.connect(str(db_path or DB_PATH), check_same_thread=False, timeout=busy_timeout)
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    
+    if settings['tuned']:
+        conn.execute(f"PRAGMA journal_mode = {settings['journal_mode']}")
+        conn.execute(f"PRAGMA synchronous = {settings['synchronous']}")
+        conn.execute(f"PRAGMA cache_size = -{int(settings['cache_size_kb'])}")  # Negative = KiB
+        conn.execute(f"PRAGMA mmap_size = {int(settings['mmap_size'])}")
+        conn.execute(f"PRAGMA temp_store = {settings['temp_store']}")
+        conn.execute(f"PRAGMA busy_timeout = {int(settings['busy_timeout_ms'])}")
+    
+    return conn
+
+
+class ConnectionPool:
+    """Process-wide SQLite connections: one writer plus a set of readers
+    
+    Writes are serialized on the writer connection behind a lock; reads
+    borrow one of the reader connections so they never queue behind the
+    writer in Python (WAL lets them proceed in SQLite too). Migrations run
+    once, when the pool is created.
+    """
+    
+    def __init__(self, db_path=None, settings=None, readers=None):
+        self.db_path = db_path or DB_PATH
+        self.settings = settings or DATABASE_SETTINGS
+        self.max_readers = max(1, readers or self.settings['reader_connections'])
         
-        # Company contacts table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS company_contacts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            company_name TEXT NOT NULL,
-            contact_name TEXT,
-            contact_email TEXT,
-            contact_phone TEXT,
-            linkedin_url TEXT,
-            last_contacted DATE
-        )
-        ''')
+        self.writer_conn = connect(self.db_path, self.settings)
+        self._write_lock = threading.RLock()
+        migrate(self.writer_conn)
         
-        # Daily stats table
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS daily_stats (
-            date DATE PRIMARY KEY,
-            applications_sent INTEGER DEFAULT 0,
-            interviews_scheduled INTEGER DEFAULT 0,
-            rejections_received INTEGER DEFAULT 0,
-            offers_received INTEGER DEFAULT 0
-        )
-        ''')
+        self._readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self._all_readers = []
+    
+    @contextmanager
+    def writer(self):
+        """Exclusive use of the writer connection
         
-        # Create indexes for performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_url ON applications(job_url)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_status ON applications(application_status)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_date_applied ON applications(date_applied)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_followup_date ON applications(follow_up_date)')
+        If the body raises, its open transaction is rolled back so the next
+        user of the shared connection starts clean.
+        """
+        with self._write_lock:
+            try:
+                yield self.writer_conn
+            except BaseException:
+                if self.writer_conn.in_transaction:
+                    self.writer_conn.rollback()
+                raise
+    
+    @contextmanager
+    def reader(self):
+        """Borrow a reader connection (opened lazily, up to max_readers)"""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._reader_lock:
+                if self._reader_count < self.max_readers:
+                    self._reader_count += 1
+                    conn = connect(self.db_path, self.settings)
+                    self._all_readers.append(conn)
+            if conn is None:
+                conn = self._readers.get()
+        
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    def close(self):
+        """Close every connection in the pool"""
+        with self._write_lock:
+            self.writer_conn.close()
+        for conn in self._all_readers:
+            conn.close()
+        self._all_readers = []
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path=None, settings=None):
+    """Return the shared ConnectionPool for a database file, creating it once"""
+    key = str(db_path or DB_PATH)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(db_path, settings)
+            _pools[key] = pool
+            logger.debug(f"Opened connection pool for {key}")
+        return pool
+
+
+def close_pool(db_path=None):
+    """Close and forget the shared pool for a database file"""
+    with _pools_lock:
+        pool = _pools.pop(str(db_path or DB_PATH), None)
+    if pool:
+        pool.close()
+
+
+@atexit.register
+def close_pools():
+    """Close every shared pool (runs automatically at exit)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+class ApplicationDatabase:
+    def __init__(self, db_path=None, settings=None):
+        """Attach to the shared connection pool for a database
         
-        self.conn.commit()
-        logger.debug("Database tables and indexes created successfully")
+        Args:
+            db_path: Database file (None uses DB_PATH)
+            settings: Override DATABASE_SETTINGS (only used when the pool is first created)
+        """
+        self.pool = get_pool(db_path, settings)
+    
+    @property
+    def conn(self):
+        """The pool's writer connection (prefer pool.writer()/pool.reader())"""
+        return self.pool.writer_conn
+    
+    def _fetch(self, sql, params=(), one=False):
+        """Run a read query on a reader connection"""
+        with self.pool.reader() as conn:
+            cursor = conn.execute(sql, params)
+            return cursor.fetchone() if one else cursor.fetchall()
+    
+    def create_tables(self):
+        """Bring the schema up to date (already done when the pool opened)"""
+        with self.pool.writer() as conn:
+            migrate(conn)
+    
+    def _application_row(self, job_data, follow_up_date):
+        """Column values for inserting a scraped job into applications"""
+        salary = job_data.get('salary', 'Not specified')
+        return (
+            job_data.get('title'),
+            job_data.get('company'),
+            job_data.get('url'),
+            job_data.get('location'),
+            salary,
+            follow_up_date,
+            job_data.get('date'),
+            *salary_columns(salary)
+        )
     
     def add_application(self, job_data):
         """Add a new job application to the database"""
-        cursor = self.conn.cursor()
-        
         # Calculate follow-up date (7 days from now)
         follow_up_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
         
-        try:
-            cursor.execute('''
-            INSERT OR IGNORE INTO applications 
-            (job_title, company_name, job_url, location, salary_range, follow_up_date, date_posted)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_data.get('title'),
-                job_data.get('company'),
-                job_data.get('url'),
-                job_data.get('location'),
-                job_data.get('salary', 'Not specified'),
-                follow_up_date,
-                job_data.get('date')
-            ))
-            
-            self.conn.commit()
-            logger.debug(f"Added application: {job_data.get('title')} at {job_data.get('company')}")
-            return cursor.lastrowid
-        except sqlite3.IntegrityError:
-            # Job already exists (duplicate URL)
-            logger.debug(f"Job already in database: {job_data.get('url')}")
-            return None
-        except Exception as e:
-            logger.error(f"Error adding application: {e}")
-            return None
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(INSERT_APPLICATION_SQL, self._application_row(job_data, follow_up_date))
+                
+                conn.commit()
+                if not cursor.rowcount:
+                    # Ignored: job already exists (duplicate URL) or lacks a title/company
+                    logger.debug(f"Job not added: {job_data.get('url')}")
+                    return None
+                logger.debug(f"Added application: {job_data.get('title')} at {job_data.get('company')}")
+                return cursor.lastrowid
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error adding application: {e}")
+                return None
+    
+    def add_applications(self, jobs):
+        """Add many job applications in a single transaction
+        
+        Args:
+            jobs: Iterable of scraped job dicts (same shape as add_application)
+        
+        Returns:
+            list: 'inserted', 'duplicate' or 'error' for each job, in input order
+                ('error' when the row was not stored: it lacks a title or company,
+                or the whole batch failed and was rolled back)
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        
+        follow_up_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
+        
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            try:
+                # Take the write lock up front so the duplicate check and the
+                # insert see the same table
+                cursor.execute('BEGIN IMMEDIATE')
+                
+                urls = list({job.get('url') for job in jobs if job.get('url')})
+                known_urls = set()
+                for start in range(0, len(urls), 500):
+                    chunk = urls[start:start + 500]
+                    cursor.execute(
+                        f"SELECT job_url FROM applications WHERE job_url IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    )
+                    known_urls.update(row['job_url'] for row in cursor.fetchall())
+                
+                outcomes = []
+                for job in jobs:
+                    url = job.get('url')
+                    if url in known_urls:
+                        outcomes.append('duplicate')
+                        continue
+                    if url:
+                        known_urls.add(url)
+                    # OR IGNORE also skips rows breaking NOT NULL (a card with no
+                    # title or company), so only a changed row counts as inserted
+                    cursor.execute(INSERT_APPLICATION_SQL, self._application_row(job, follow_up_date))
+                    outcomes.append('inserted' if cursor.rowcount else 'error')
+                
+                conn.commit()
+                logger.debug(
+                    f"Bulk insert: {outcomes.count('inserted')} added, {outcomes.count('duplicate')} duplicates, "
+                    f"{outcomes.count('error')} incomplete"
+                )
+                return outcomes
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Error adding applications: {e}")
+                return ['error'] * len(jobs)
     
     def update_status(self, job_url, status, notes=""):
         """Update application status"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-        UPDATE applications 
-        SET application_status = ?, status_updated = CURRENT_DATE, notes = ?
-        WHERE job_url = ?
-        ''', (status, notes, job_url))
-        self.conn.commit()
+        with self.pool.writer() as conn:
+            conn.execute('''
+            UPDATE applications 
+            SET application_status = ?, status_updated = CURRENT_DATE, notes = ?
+            WHERE job_url = ?
+            ''', (status, notes, job_url))
+            conn.commit()
     
     def update_screenshot(self, job_url, screenshot_path):
         """Update screenshot path for an application"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-        UPDATE applications 
-        SET screenshot_path = ?
-        WHERE job_url = ?
-        ''', (screenshot_path, job_url))
-        self.conn.commit()
+        with self.pool.writer() as conn:
+            conn.execute('''
+            UPDATE applications 
+            SET screenshot_path = ?
+            WHERE job_url = ?
+            ''', (screenshot_path, job_url))
+            conn.commit()
+    
+    def schedule_interview(self, job_url, interview_date, notes=""):
+        """Set the interview date and move the application to 'Interview Scheduled'"""
+        with self.pool.writer() as conn:
+            conn.execute('''
+            UPDATE applications 
+            SET interview_date = ?, application_status = 'Interview Scheduled', notes = ?
+            WHERE job_url = ?
+            ''', (interview_date, notes, job_url))
+            conn.commit()
+    
+    def iter_job_urls(self):
+        """Yield every stored job URL"""
+        with self.pool.reader() as conn:
+            for row in conn.execute('SELECT job_url FROM applications WHERE job_url IS NOT NULL'):
+                yield row['job_url']
     
     def get_pending_followups(self):
         """Get applications that need follow-up"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self._fetch('''
         SELECT * FROM applications 
         WHERE follow_up_date <= DATE('now') 
         AND application_status IN ('Applied', 'Interview Scheduled')
         ORDER BY follow_up_date ASC
         ''')
-        return cursor.fetchall()
     
     def get_upcoming_interviews(self, days=7):
         """Get interviews happening within specified days"""
-        cursor = self.conn.cursor()
         future_date = (datetime.now() + timedelta(days=days)).strftime('%Y-%m-%d')
-        cursor.execute('''
+        return self._fetch('''
         SELECT * FROM applications 
         WHERE interview_date <= ? 
         AND interview_date >= DATE('now')
         AND application_status = 'Interview Scheduled'
         ORDER BY interview_date ASC
         ''', (future_date,))
-        return cursor.fetchall()
     
     def get_daily_stats(self, date=None):
-        """Get statistics for a specific date"""
+        """Get statistics for a specific date (UTC day; None is today)"""
         if not date:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = utc_date()
         
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM daily_stats WHERE date = ?', (date,))
-        return cursor.fetchone()
+        return self._fetch('SELECT * FROM daily_stats WHERE date = ?', (date,), one=True)
     
     def update_daily_stats(self, date=None, **kwargs):
-        """Update daily statistics"""
+        """Add manual adjustments on top of the trigger-maintained daily statistics
+        
+        Adjustments are stored separately too, so rebuild_rollups() keeps them.
+        """
         if not date:
-            date = datetime.now().strftime('%Y-%m-%d')
-        
-        cursor = self.conn.cursor()
-        
-        # Insert or update
-        cursor.execute('''
-        INSERT INTO daily_stats (date, applications_sent, interviews_scheduled, 
-                                rejections_received, offers_received)
-        VALUES (?, ?, ?, ?, ?)
-        ON CONFLICT(date) DO UPDATE SET
-            applications_sent = applications_sent + ?,
-            interviews_scheduled = interviews_scheduled + ?,
-            rejections_received = rejections_received + ?,
-            offers_received = offers_received + ?
-        ''', (
-            date,
-            kwargs.get('applications_sent', 0),
-            kwargs.get('interviews_scheduled', 0),
-            kwargs.get('rejections_received', 0),
-            kwargs.get('offers_received', 0),
-            kwargs.get('applications_sent', 0),
-            kwargs.get('interviews_scheduled', 0),
-            kwargs.get('rejections_received', 0),
-            kwargs.get('offers_received', 0)
-        ))
-        
-        self.conn.commit()
+            date = utc_date()
+        counts = [kwargs.get(column, 0) for column in
+                  ('applications_sent', 'interviews_scheduled', 'rejections_received', 'offers_received')]
+        
+        with self.pool.writer() as conn:
+            try:
+                # Both tables or neither, so a rebuild gives the same totals
+                conn.execute('BEGIN IMMEDIATE')
+                for table in ('daily_stats_adjustments', 'daily_stats'):
+                    conn.execute(f'''
+                    INSERT INTO {table} (date, applications_sent, interviews_scheduled, 
+                                         rejections_received, offers_received)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(date) DO UPDATE SET
+                        applications_sent = applications_sent + excluded.applications_sent,
+                        interviews_scheduled = interviews_scheduled + excluded.interviews_scheduled,
+                        rejections_received = rejections_received + excluded.rejections_received,
+                        offers_received = offers_received + excluded.offers_received
+                    ''', [date] + counts)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
     
     def get_all_applications(self, limit=100):
         """Get all applications with optional limit"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self._fetch('''
         SELECT * FROM applications 
         ORDER BY date_applied DESC 
         LIMIT ?
         ''', (limit,))
-        return cursor.fetchall()
     
     def get_applications_by_status(self, status):
         """Get applications filtered by status"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        return self._fetch('''
         SELECT * FROM applications 
         WHERE application_status = ?
         ORDER BY date_applied DESC
         ''', (status,))
-        return cursor.fetchall()
+    
+    def get_applications_on(self, date):
+        """Get applications added on a given date, newest first"""
+        return self._fetch('''
+        SELECT * FROM applications 
+        WHERE date_applied = ? 
+        ORDER BY id DESC
+        ''', (date,))
+    
+    def get_applications_since(self, date):
+        """Get applications added on or after a given date"""
+        return self._fetch('''
+        SELECT * FROM applications 
+        WHERE date_applied >= ? 
+        ORDER BY date_applied DESC
+        ''', (date,))
+    
+    def get_applications_in_salary_range(self, min_salary=None, max_salary=None, currency=None,
+                                         include_unknown=False, limit=100):
+        """Applications whose annual salary range overlaps [min_salary, max_salary]
+        
+        Args:
+            min_salary: Lowest acceptable annual pay (None is unbounded)
+            max_salary: Highest annual pay of interest (None is unbounded)
+            currency: Only this currency, plus postings without one (None uses SALARY_SETTINGS)
+            include_unknown: Also return postings that state no salary
+            limit: Maximum rows to return
+        
+        Returns:
+            list: Application rows, best paid first (unknown salaries last)
+        """
+        currency = SALARY_SETTINGS['currency'] if currency is None else currency.upper()
+        conditions = ["salary_max IS NOT NULL"]
+        params = []
+        if min_salary is not None:
+            conditions.append("salary_max >= ?")
+            params.append(min_salary)
+        if max_salary is not None:
+            conditions.append("salary_min <= ?")
+            params.append(max_salary)
+        if currency:
+            conditions.append("(currency = ? OR currency IS NULL)")
+            params.append(currency)
+        
+        where = " AND ".join(conditions)
+        if include_unknown:
+            where = f"({where}) OR salary_max IS NULL"
+        
+        # NULLs sort first in SQLite, so DESC walks idx_salary_range with unknowns last
+        return self._fetch(f'''
+        SELECT * FROM applications
+        WHERE {where}
+        ORDER BY salary_max DESC
+        LIMIT ?
+        ''', params + [limit])
+    
+    def iter_salary_rows(self, batch_size=500):
+        """Yield id and salary_range of every application with salary text"""
+        last_id = 0
+        while True:
+            rows = self._fetch('''
+            SELECT id, salary_range FROM applications
+            WHERE id > ? AND salary_range IS NOT NULL
+            ORDER BY id
+            LIMIT ?
+            ''', (last_id, batch_size))
+            if not rows:
+                return
+            yield from rows
+            last_id = rows[-1]['id']
+    
+    def update_salaries(self, rows):
+        """Store parsed salaries: (salary_min, salary_max, currency, period, id) tuples"""
+        with self.pool.writer() as conn:
+            conn.executemany(
+                'UPDATE applications SET salary_min = ?, salary_max = ?, currency = ?, period = ? WHERE id = ?',
+                rows
+            )
+            conn.commit()
+    
+    def search(self, query, filters=None, limit=20):
+        """Ranked full-text search over title, company, location and notes
+        
+        Only the newest search_candidates matches (DATABASE_SETTINGS) are
+        ranked: scoring every match of a common word is what made it slow.
+        Words longer than the longest indexed prefix match on that prefix.
+        
+        Args:
+            query: Free text; every word must match (words match as prefixes)
+            filters: Optional dict with 'status', 'company', 'location' and/or
+                'since' (minimum date_applied, YYYY-MM-DD)
+            limit: Maximum rows to return
+        
+        Returns:
+            list: Application rows, best match first
+        """
+        terms = re.findall(r"\w+", query or "")
+        if not terms:
+            return []
+        
+        filters = filters or {}
+        conditions = []
+        params = []
+        for column, key in [('application_status', 'status'), ('company_name', 'company'), ('location', 'location')]:
+            if filters.get(key):
+                conditions.append(f"a.{column} = ? COLLATE NOCASE")
+                params.append(filters[key])
+        if filters.get('since'):
+            conditions.append("a.date_applied >= ?")
+            params.append(filters['since'])
+        extra = "".join(f" AND {condition}" for condition in conditions)
+        
+        match = fts_match(terms)
+        
+        candidates = self.pool.settings.get('search_candidates', 0)
+        try:
+            with self.pool.reader() as conn:
+                # Lowest rowid among the newest matches; the index returns
+                # rowids in order without scoring them
+                low = 0
+                if candidates > 0:
+                    low = conn.execute(f'''
+                    SELECT MIN(rowid) FROM (
+                        SELECT applications_fts.rowid FROM applications_fts
+                        JOIN applications a ON a.id = applications_fts.rowid
+                        WHERE applications_fts MATCH ?{extra}
+                        ORDER BY applications_fts.rowid DESC LIMIT ?
+                    )
+                    ''', [match] + params + [candidates]).fetchone()[0] or 0
+                
+                if not conditions:
+                    # Rank inside the index and only join the rows we return
+                    return conn.execute('''
+                    SELECT a.* FROM (
+                        SELECT rowid, rank FROM applications_fts
+                        WHERE applications_fts MATCH ? AND rowid >= ?
+                        ORDER BY rank LIMIT ?
+                    ) hits
+                    JOIN applications a ON a.id = hits.rowid
+                    ORDER BY hits.rank
+                    ''', (match, low, limit)).fetchall()
+                
+                return conn.execute(f'''
+                SELECT a.* FROM applications_fts
+                JOIN applications a ON a.id = applications_fts.rowid
+                WHERE applications_fts MATCH ? AND applications_fts.rowid >= ?{extra}
+                ORDER BY applications_fts.rank
+                LIMIT ?
+                ''', [match, low] + params + [limit]).fetchall()
+        except sqlite3.OperationalError as e:
+            # No FTS5 table, or a query the FTS5 parser rejects
+            if "no such table" not in str(e) and "fts5" not in str(e):
+                raise
+            logger.debug(f"Full-text search unavailable, using LIKE: {e}")
+        
+        # Unranked substring match
+        like = " AND ".join(
+            "(a.job_title LIKE ? OR a.company_name LIKE ? OR a.location LIKE ? OR a.notes LIKE ?)"
+            for _ in terms
+        )
+        like_params = [f"%{term}%" for term in terms for _ in range(4)]
+        return self._fetch(f'''
+        SELECT a.* FROM applications a
+        WHERE {like}{extra}
+        ORDER BY a.date_applied DESC
+        LIMIT ?
+        ''', like_params + params + [limit])
+    
+    def start_scrape_run(self, units, max_age_hours=24):
+        """Resume the latest unfinished scrape run, or start a new one
+        
+        A run still marked 'running' that started within max_age_hours is
+        picked up again: units left 'running' by a crash go back to
+        'pending', and any units added to the search grid since are queued.
+        Older unfinished runs are marked 'abandoned'.
+        
+        Args:
+            units: (keyword, location) pairs to search
+            max_age_hours: Oldest unfinished run that is resumed
+        
+        Returns:
+            tuple: (run_id, resumed)
+        """
+        with self.pool.writer() as conn:
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                row = conn.execute('''
+                SELECT id FROM scrape_runs
+                WHERE status = 'running' AND started_at >= DATETIME('now', ?)
+                ORDER BY id DESC LIMIT 1
+                ''', (f'-{max_age_hours} hours',)).fetchone()
+                
+                conn.execute('''
+                UPDATE scrape_runs SET status = 'abandoned', finished_at = CURRENT_TIMESTAMP
+                WHERE status = 'running' AND id != ?
+                ''', (row['id'] if row else -1,))
+                
+                if row:
+                    run_id = row['id']
+                    conn.execute('''
+                    UPDATE scrape_units SET status = 'pending', updated_at = CURRENT_TIMESTAMP
+                    WHERE run_id = ? AND status = 'running'
+                    ''', (run_id,))
+                else:
+                    run_id = conn.execute('INSERT INTO scrape_runs DEFAULT VALUES').lastrowid
+                
+                conn.executemany(
+                    'INSERT OR IGNORE INTO scrape_units (run_id, keyword, location) VALUES (?, ?, ?)',
+                    [(run_id, keyword, location) for keyword, location in units]
+                )
+                conn.commit()
+                return run_id, row is not None
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def get_scrape_units(self, run_id):
+        """Every unit of a scrape run with its status and attempt count"""
+        return self._fetch('''
+        SELECT id, keyword, location, status, attempts, error FROM scrape_units
+        WHERE run_id = ?
+        ORDER BY id
+        ''', (run_id,))
+    
+    def mark_scrape_unit(self, run_id, keyword, location, status, jobs=None, error=None):
+        """Record a unit's progress
+        
+        Args:
+            status: 'running', 'done' or 'failed' ('failed' counts an attempt)
+            jobs: Scraped jobs to persist with a 'done' unit
+            error: Error message for a 'failed' unit
+        """
+        with self.pool.writer() as conn:
+            conn.execute('''
+            UPDATE scrape_units
+            SET status = ?, results = COALESCE(?, results), error = ?,
+                attempts = attempts + (? = 'failed'), updated_at = CURRENT_TIMESTAMP
+            WHERE run_id = ? AND keyword = ? AND location = ?
+            ''', (status, json.dumps(jobs) if jobs is not None else None, error, status,
+                  run_id, keyword, location))
+            conn.commit()
+    
+    def get_scrape_results(self, run_id):
+        """All jobs persisted by a run's completed units, in unit order"""
+        rows = self._fetch('''
+        SELECT results FROM scrape_units
+        WHERE run_id = ? AND status = 'done' AND results IS NOT NULL
+        ORDER BY id
+        ''', (run_id,))
+        return [job for row in rows for job in json.loads(row['results'])]
+    
+    def finish_scrape_run(self, run_id, status='finished'):
+        """Close a scrape run so the next scrape starts a fresh one"""
+        with self.pool.writer() as conn:
+            conn.execute('''
+            UPDATE scrape_runs SET status = ?, finished_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+            ''', (status, run_id))
+            conn.commit()
+    
+    def get_application_ids(self, urls):
+        """Map job URLs to application ids (URLs not stored are left out)"""
+        urls = list(urls)
+        ids = {}
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            rows = self._fetch(
+                f"SELECT id, job_url FROM applications WHERE job_url IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            ids.update((row['job_url'], row['id']) for row in rows)
+        return ids
+    
+    def iter_dedupe_rows(self, batch_size=500):
+        """Yield id, title, company and location of every application, oldest first"""
+        last_id = 0
+        while True:
+            rows = self._fetch('''
+            SELECT id, job_title, company_name, location FROM applications
+            WHERE id > ?
+            ORDER BY id
+            LIMIT ?
+            ''', (last_id, batch_size))
+            if not rows:
+                return
+            yield from rows
+            last_id = rows[-1]['id']
+    
+    def get_dedupe_candidates(self, band_hashes, exclude_id=None):
+        """Canonical (non-duplicate) applications sharing any LSH band hash"""
+        band_hashes = list(band_hashes)
+        if not band_hashes:
+            return []
+        return self._fetch(f'''
+        SELECT id, job_title, company_name, location FROM applications
+        WHERE id IN (
+            SELECT application_id FROM dedupe_bands
+            WHERE band_hash IN ({','.join('?' * len(band_hashes))})
+        )
+        AND duplicate_of IS NULL AND id != ?
+        ORDER BY id
+        ''', band_hashes + [exclude_id if exclude_id is not None else -1])
+    
+    def has_dedupe_index(self):
+        """True once any application has been indexed for near-duplicate lookup"""
+        return self._fetch('SELECT 1 FROM dedupe_bands LIMIT 1', one=True) is not None
+    
+    def index_dedupe_bands(self, application_id, band_hashes):
+        """Register an application's LSH band hashes"""
+        with self.pool.writer() as conn:
+            conn.executemany(
+                'INSERT OR IGNORE INTO dedupe_bands (band_hash, application_id) VALUES (?, ?)',
+                [(band_hash, application_id) for band_hash in band_hashes]
+            )
+            conn.commit()
+    
+    def mark_duplicate(self, application_id, original_id):
+        """Link an application to the posting it near-duplicates"""
+        with self.pool.writer() as conn:
+            conn.execute(
+                'UPDATE applications SET duplicate_of = ? WHERE id = ?',
+                (original_id, application_id)
+            )
+            conn.commit()
+    
+    def reset_dedupe(self):
+        """Forget every duplicate link and band hash (before a full backfill)"""
+        with self.pool.writer() as conn:
+            conn.execute('DELETE FROM dedupe_bands')
+            conn.execute('UPDATE applications SET duplicate_of = NULL WHERE duplicate_of IS NOT NULL')
+            conn.commit()
+    
+    def get_form_answers(self, label_hashes):
+        """Stored answers for Easy Apply questions, as {label_hash: answer}"""
+        label_hashes = list(label_hashes)
+        if not label_hashes:
+            return {}
+        rows = self._fetch(f'''
+        SELECT label_hash, answer FROM form_answers
+        WHERE answer IS NOT NULL AND label_hash IN ({','.join('?' * len(label_hashes))})
+        ''', label_hashes)
+        return {row['label_hash']: row['answer'] for row in rows}
+    
+    def record_form_questions(self, questions):
+        """Register questions the bot could not answer (counting repeat sightings)
+        
+        Args:
+            questions: (label_hash, label, field_type, options_json) tuples
+        """
+        with self.pool.writer() as conn:
+            conn.executemany('''
+            INSERT INTO form_answers (label_hash, label, field_type, options, times_seen)
+            VALUES (?, ?, ?, ?, 1)
+            ON CONFLICT(label_hash) DO UPDATE SET times_seen = times_seen + 1
+            ''', questions)
+            conn.commit()
+    
+    def get_unanswered_questions(self, limit=50):
+        """Questions still waiting for an answer, most frequently seen first"""
+        return self._fetch('''
+        SELECT label_hash, label, field_type, options, times_seen FROM form_answers
+        WHERE answer IS NULL
+        ORDER BY times_seen DESC
+        LIMIT ?
+        ''', (limit,))
+    
+    def set_form_answer(self, label_hash_prefix, answer, source='manual'):
+        """Answer a stored question (matched by label hash prefix)
+        
+        Cached form layouts are dropped, since their planned values may change.
+        
+        Returns:
+            int: Questions updated (0 if the prefix matched nothing)
+        """
+        with self.pool.writer() as conn:
+            cursor = conn.execute('''
+            UPDATE form_answers
+            SET answer = ?, source = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE label_hash LIKE ? || '%'
+            ''', (answer, source, label_hash_prefix))
+            if cursor.rowcount:
+                conn.execute('DELETE FROM form_layouts')
+            conn.commit()
+            return cursor.rowcount
+    
+    def get_form_layout(self, company_key, step):
+        """Cached Easy Apply layout for a company's form step, or None"""
+        row = self._fetch(
+            'SELECT fingerprint, plan FROM form_layouts WHERE company_key = ? AND step = ?',
+            (company_key, step), one=True
+        )
+        if row is None:
+            return None
+        return {'fingerprint': row['fingerprint'], 'values': json.loads(row['plan'])}
+    
+    def put_form_layout(self, company_key, step, fingerprint, values):
+        """Cache a fully answered form step for the company"""
+        with self.pool.writer() as conn:
+            conn.execute('''
+            INSERT OR REPLACE INTO form_layouts (company_key, step, fingerprint, plan)
+            VALUES (?, ?, ?, ?)
+            ''', (company_key, step, fingerprint, json.dumps(values)))
+            conn.commit()
+    
+    def delete_form_layout(self, company_key, step):
+        with self.pool.writer() as conn:
+            conn.execute('DELETE FROM form_layouts WHERE company_key = ? AND step = ?', (company_key, step))
+            conn.commit()
+    
+    def get_cached_search(self, cache_key, max_age_minutes):
+        """Cached jobs for a search, or None if missing or older than max_age_minutes
+        
+        A hit refreshes the entry's last_accessed time for LRU eviction.
+        """
+        with self.pool.writer() as conn:
+            row = conn.execute('''
+            SELECT results FROM search_cache
+            WHERE cache_key = ? AND fetched_at >= DATETIME('now', ?)
+            ''', (cache_key, f'-{max_age_minutes} minutes')).fetchone()
+            if row is None:
+                return None
+            
+            conn.execute(
+                'UPDATE search_cache SET last_accessed = CURRENT_TIMESTAMP WHERE cache_key = ?',
+                (cache_key,)
+            )
+            conn.commit()
+            return json.loads(row['results'])
+    
+    def put_cached_search(self, cache_key, keyword, location, filters, jobs, max_entries):
+        """Store a search's jobs, then evict least recently used entries past max_entries
+        
+        Args:
+            filters: JSON text of the options that shaped the search
+            max_entries: Most entries kept after eviction
+        """
+        with self.pool.writer() as conn:
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.execute('''
+                INSERT OR REPLACE INTO search_cache (cache_key, keyword, location, filters, results)
+                VALUES (?, ?, ?, ?, ?)
+                ''', (cache_key, keyword, location, filters, json.dumps(jobs)))
+                conn.execute('''
+                DELETE FROM search_cache WHERE cache_key IN (
+                    SELECT cache_key FROM search_cache
+                    ORDER BY last_accessed DESC
+                    LIMIT -1 OFFSET ?
+                )
+                ''', (max_entries,))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def clear_search_cache(self):
+        """Drop every cached search; returns the number of entries removed"""
+        with self.pool.writer() as conn:
+            removed = conn.execute('DELETE FROM search_cache').rowcount
+            conn.commit()
+            return removed
     
     def get_stats_summary(self, days=30):
-        """Get summary statistics for the past N days"""
-        cursor = self.conn.cursor()
-        start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        """Get summary statistics for the past N days (one daily_stats row per day)"""
+        start_date = utc_date(days)
         
-        cursor.execute('''
+        return self._fetch('''
         SELECT 
-            COUNT(*) as total_applications,
-            SUM(CASE WHEN application_status = 'Interview Scheduled' THEN 1 ELSE 0 END) as interviews,
-            SUM(CASE WHEN application_status = 'Rejected' THEN 1 ELSE 0 END) as rejections,
-            SUM(CASE WHEN application_status = 'Offer' THEN 1 ELSE 0 END) as offers
-        FROM applications
-        WHERE date_applied >= ?
+            COALESCE(SUM(applications_sent), 0) as total_applications,
+            COALESCE(SUM(interviews_scheduled), 0) as interviews,
+            COALESCE(SUM(rejections_received), 0) as rejections,
+            COALESCE(SUM(offers_received), 0) as offers,
+            (
+                -- Applications that entered the interview stage, including
+                -- ones that went straight to an offer
+                SELECT COALESCE(SUM(transitions), 0) FROM status_rollup
+                WHERE day >= ?
+                AND (to_status = 'Interview Scheduled' OR (
+                    to_status IN ('Offer', 'Accepted', 'Declined')
+                    AND from_status NOT IN ('Interview Scheduled', 'Offer', 'Accepted', 'Declined')
+                ))
+            ) as interviews_reached
+        FROM daily_stats
+        WHERE date >= ?
+        ''', (start_date, start_date), one=True)
+    
+    def get_status_transitions(self, days=30):
+        """Status transition counts for the past N days, read from status_rollup
+        
+        Returns:
+            list: Rows of from_status ('' for newly saved jobs), to_status and transitions
+        """
+        start_date = utc_date(days)
+        return self._fetch('''
+        SELECT from_status, to_status, SUM(transitions) as transitions
+        FROM status_rollup
+        WHERE day >= ?
+        GROUP BY from_status, to_status
+        ORDER BY transitions DESC
         ''', (start_date,))
+    
+    def rebuild_rollups(self):
+        """Recompute status_rollup from the status_events log, then daily_stats
+        from the rollup plus manual adjustments (update_daily_stats)
+        
+        Returns:
+            int: Days with statistics after the rebuild
+        """
+        with self.pool.writer() as conn:
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                rebuild_status_rollup(conn)
+                days = conn.execute('SELECT COUNT(*) FROM daily_stats').fetchone()[0]
+                conn.commit()
+                return days
+            except Exception:
+                conn.rollback()
+                raise
+    
+    def get_status_history(self, application_id):
+        """Every status transition of one application, oldest first"""
+        return self._fetch('''
+        SELECT from_status, to_status, notes, ts FROM status_events
+        WHERE application_id = ?
+        ORDER BY ts, id
+        ''', (application_id,))
+    
+    def get_stage_reach_times(self, stage_ranks):
+        """First time each application entered each funnel stage
         
-        return cursor.fetchone()
+        Args:
+            stage_ranks: Dict of status -> stage number (statuses left out are
+                ignored); the event saving a job is always stage 0
+        
+        Returns:
+            list: (application_id, stage, first_ts) rows, one per stage entered
+        """
+        cases = " ".join(f"WHEN ? THEN {int(rank)}" for rank in stage_ranks.values())
+        return self._fetch(f'''
+        SELECT application_id, stage, MIN(ts) as first_ts FROM (
+            SELECT application_id, ts,
+                CASE
+                    WHEN from_status = '' THEN 0
+                    ELSE CASE to_status {cases} ELSE NULL END
+                END AS stage
+            FROM status_events
+        )
+        WHERE stage IS NOT NULL
+        GROUP BY application_id, stage
+        ''', list(stage_ranks))
     
     def close(self):
-        """Close database connection"""
-        self.conn.close()
+        """Release this handle; shared connections stay open until close_pools()"""
+        self.pool = None
@@ -0,0 +1,115 @@
+"""
+Concurrent read/write benchmark for the applications table
+
+Runs the same workload against a throwaway database twice - once with a plain
+rollback-journal connection and once with the tuned DATABASE_SETTINGS - and
+prints operations per second for each:
+
+    python main.py dbbench [seconds]
+
+One writer thread inserts applications (one commit each, like the apply loop)
+while reader threads run the report queries, all through the shared
+connection pool.
+"""
+
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from config import DATABASE_SETTINGS
+from database import ApplicationDatabase, close_pool
+
+
+def _profiles():
+    """The untuned baseline and the configured profile"""
+    plain = dict(DATABASE_SETTINGS, tuned=False)
+    tuned = dict(DATABASE_SETTINGS, tuned=True)
+    return [("default", plain), ("tuned", tuned)]
+
+
+def _fake_job(n):
+    return {
+        'title': f"Engineer {n}",
+        'company': f"Company {n % 50}",
+        'url': f"https://example.com/jobs/{n}",
+        'location': "Remote",
+        'date': "2024-01-01"
+    }
+
+
+def _run_profile(db_path, settings, duration, readers, seed_rows):
+    setup = ApplicationDatabase(db_path, settings)
+    setup.add_applications(_fake_job(n) for n in range(seed_rows))
+    setup.close()
+    
+    counts = {'writes': 0, 'reads': 0, 'errors': 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+    
+    def writer():
+        db = ApplicationDatabase(db_path, settings)
+        n = seed_rows
+        while time.monotonic() < deadline:
+            try:
+                # add_application logs failures (e.g. "database is locked") and returns None
+                written = db.add_application(_fake_job(n)) is not None
+            except sqlite3.OperationalError:
+                written = False
+            with lock:
+                counts['writes' if written else 'errors'] += 1
+            n += 1
+        db.close()
+    
+    def reader():
+        db = ApplicationDatabase(db_path, settings)
+        while time.monotonic() < deadline:
+            try:
+                db.get_stats_summary(30)
+                db.get_all_applications(50)
+                with lock:
+                    counts['reads'] += 1
+            except sqlite3.OperationalError:
+                with lock:
+                    counts['errors'] += 1
+        db.close()
+    
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    close_pool(db_path)
+    
+    return {key: value / duration for key, value in counts.items()}
+
+
+def run_benchmark(duration=3.0, readers=2, seed_rows=2000):
+    """Compare default and tuned connections under concurrent load
+    
+    Args:
+        duration: Seconds each profile runs
+        readers: Reader threads running alongside the writer
+        seed_rows: Applications inserted before timing starts
+    
+    Returns:
+        dict: Profile name -> {'writes', 'reads', 'errors'} per second
+    """
+    results = {}
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, settings in _profiles():
+            db_path = Path(tmp) / f"bench_{name}.db"
+            results[name] = _run_profile(db_path, settings, duration, readers, seed_rows)
+    
+    print(f"\n📊 SQLite concurrency benchmark ({duration:.0f}s, 1 writer + {readers} readers)")
+    print(f"   {'profile':<10}{'writes/s':>12}{'reads/s':>12}{'errors/s':>12}")
+    for name, stats in results.items():
+        print(f"   {name:<10}{stats['writes']:>12.1f}{stats['reads']:>12.1f}{stats['errors']:>12.1f}")
+    
+    base, tuned = results['default'], results['tuned']
+    if base['writes'] and base['reads']:
+        print(f"\n   Write throughput x{tuned['writes'] / base['writes']:.1f}, "
+              f"read throughput x{tuned['reads'] / base['reads']:.1f}")
+    
+    return results
@@ -0,0 +1,163 @@
+"""
+Near-duplicate job detection
+
+The same role often shows up under several URLs: reposted, or listed once per
+location ("Remote", "Kenya", "Nairobi"). Exact URL checks miss these, so each
+job also gets a signature built from its normalized title, company and
+location:
+
+- Title words are MinHashed and split into LSH bands; every band hash is
+  folded with the normalized company, so only postings from the same company
+  can ever collide.
+- Band hashes live in the indexed dedupe_bands table, so finding candidates
+  is one indexed lookup however large the table grows.
+- Candidates are confirmed by title word overlap (Jaccard) and compatible
+  locations. Location aliases in DEDUPE_SETTINGS map cities onto a country
+  and "Remote" onto a wildcard.
+
+A confirmed match is recorded in applications.duplicate_of; the earliest
+posting stays canonical. New jobs are checked in save_jobs_to_db and the
+whole table can be re-checked with `python main.py dedupe`.
+"""
+
+import random
+import re
+from hashlib import blake2b
+from config import DEDUPE_SETTINGS
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+_COMPANY_SUFFIXES = {"inc", "ltd", "llc", "plc", "limited", "corp", "corporation", "co", "company", "group", "gmbh"}
+_TITLE_NOISE = {"remote", "hybrid", "onsite", "urgent", "hiring", "job", "the", "a", "an", "and", "of", "m", "f", "d"}
+WILDCARD_LOCATION = "*"
+
+
+def _hash64(text):
+    """Stable signed 64-bit hash (fits an SQLite INTEGER)"""
+    return int.from_bytes(blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+
+def _tokens(text):
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def normalize_company(company):
+    return " ".join(token for token in _tokens(company) if token not in _COMPANY_SUFFIXES)
+
+
+def title_tokens(title):
+    return frozenset(token for token in _tokens(title) if token not in _TITLE_NOISE)
+
+
+def location_group(location, aliases=None):
+    """Collapse a location onto its alias group ("*" matches any location)"""
+    aliases = DEDUPE_SETTINGS['location_aliases'] if aliases is None else aliases
+    tokens = _tokens(location)
+    for token in tokens:
+        if token in aliases:
+            return aliases[token]
+    return " ".join(tokens)
+
+
+def locations_compatible(first, second):
+    return first == second or WILDCARD_LOCATION in (first, second) or not first or not second
+
+
+def jaccard(first, second):
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+class DuplicateDetector:
+    def __init__(self, db, settings=None):
+        """Initialize the detector
+        
+        Args:
+            db: ApplicationDatabase holding applications and dedupe_bands
+            settings: Override DEDUPE_SETTINGS (None uses config value)
+        """
+        settings = settings or DEDUPE_SETTINGS
+        self.db = db
+        self.enabled = settings['enabled']
+        self.threshold = settings['title_similarity']
+        self.aliases = settings['location_aliases']
+        self.bands = settings['bands']
+        self.rows_per_band = max(1, settings['num_perm'] // self.bands)
+        
+        # Fixed seed: signatures must be identical across runs
+        rng = random.Random(1729)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(self.bands * self.rows_per_band)
+        ]
+    
+    def _minhash(self, tokens):
+        hashes = [_hash64(token) & 0xFFFFFFFFFFFFFFFF for token in tokens] or [0]
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms]
+    
+    def band_hashes(self, title, company):
+        """LSH band hashes for a posting, scoped to its company"""
+        company_key = normalize_company(company)
+        signature = self._minhash(sorted(title_tokens(title)))
+        hashes = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows_per_band:(band + 1) * self.rows_per_band]
+            hashes.append(_hash64(f"{company_key}|{band}|{','.join(map(str, rows))}"))
+        return hashes
+    
+    def is_match(self, row, title, company, location):
+        """Confirm an LSH candidate against a posting"""
+        return (
+            normalize_company(row['company_name']) == normalize_company(company)
+            and jaccard(title_tokens(row['job_title']), title_tokens(title)) >= self.threshold
+            and locations_compatible(
+                location_group(row['location'], self.aliases),
+                location_group(location, self.aliases)
+            )
+        )
+    
+    def find_original(self, title, company, location, band_hashes=None, exclude_id=None):
+        """Earliest canonical application this posting duplicates, or None"""
+        band_hashes = band_hashes or self.band_hashes(title, company)
+        for row in self.db.get_dedupe_candidates(band_hashes, exclude_id):
+            if self.is_match(row, title, company, location):
+                return row['id']
+        return None
+    
+    def register(self, application_id, title, company, location):
+        """Check a stored application and either link it or index it
+        
+        Returns:
+            int: id of the posting it duplicates, or None if it is canonical
+        """
+        band_hashes = self.band_hashes(title, company)
+        original_id = self.find_original(title, company, location, band_hashes, application_id)
+        if original_id is not None:
+            self.db.mark_duplicate(application_id, original_id)
+        else:
+            self.db.index_dedupe_bands(application_id, band_hashes)
+        return original_id
+    
+    def ensure_index(self):
+        """Build the band index on first use so existing rows can be matched"""
+        if self.enabled and not self.db.has_dedupe_index():
+            self.backfill()
+    
+    def backfill(self):
+        """Re-check every application from scratch, oldest first
+        
+        Returns:
+            int: Applications linked as near-duplicates
+        """
+        self.db.reset_dedupe()
+        checked = duplicates = 0
+        for row in self.db.iter_dedupe_rows():
+            checked += 1
+            if self.register(row['id'], row['job_title'], row['company_name'], row['location']) is not None:
+                duplicates += 1
+        logger.info(f"Near-duplicate backfill: {duplicates} of {checked} applications are duplicates")
+        return duplicates
@@ -0,0 +1,281 @@
+"""
+Easy Apply form model: one-call step snapshots, an answer store and layout cache
+
+Each Easy Apply step is read in a single page.evaluate(STEP_JS): every
+input, select, textarea and radio group in the dialog is tagged with a
+data-jat-field index and returned with its normalized question label, type,
+options and current value, and the next/submit button is tagged too. Empty
+fields are then resolved and filled in one more call (FILL_JS):
+
+- Answers come from the form_answers table, keyed on a hash of the
+  normalized question label, then from USER_INFO for common profile
+  questions (phone, city, website).
+- Required questions nobody can answer are recorded with an empty answer;
+  `python main.py answers` lists them and `python main.py answer` fills
+  them in, so the next form asking the same question goes through.
+- Once a company's step is fully answered, its layout fingerprint and
+  planned values are cached in form_layouts. When the same step shows up
+  again, STEP_JS checks the fingerprint and fills it in the same call, so
+  a repeat form needs one round trip per step.
+"""
+
+import hashlib
+import json
+from config import USER_INFO
+from dedupe import normalize_company
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Shared by STEP_JS and FILL_JS: set values the way a user would, so
+# React-controlled inputs register the change
+_FILL_FN = r"""
+const norm = t => (t || '').replace(/\*/g, '').replace(/\s+/g, ' ').trim().toLowerCase();
+const optionLabel = el => {
+    if (el.id) {
+        const label = document.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+        if (label) return label.innerText;
+    }
+    const wrap = el.closest('label');
+    return wrap ? wrap.innerText : (el.getAttribute('aria-label') || el.value);
+};
+const pick = (candidates, value, text) => {
+    const wanted = norm(value);
+    return candidates.find(c => norm(text(c)) === wanted)
+        || candidates.find(c => norm(text(c)).includes(wanted));
+};
+const fillFields = (root, values) => {
+    const failed = [];
+    for (const {index, value} of values) {
+        const els = [...root.querySelectorAll(`[data-jat-field="${index}"]`)];
+        const el = els[0];
+        try {
+            if (!el) throw new Error('missing');
+            if (el.type === 'radio') {
+                const choice = pick(els, value, optionLabel);
+                if (!choice) throw new Error('no option');
+                choice.click();
+            } else if (el.type === 'checkbox') {
+                const wanted = /^(yes|true|1|checked)$/i.test(String(value));
+                if (el.checked !== wanted) el.click();
+            } else if (el.tagName === 'SELECT') {
+                const choice = pick([...el.options], value, o => o.text);
+                if (!choice) throw new Error('no option');
+                el.value = choice.value;
+                el.dispatchEvent(new Event('change', {bubbles: true}));
+            } else {
+                const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+                Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+                el.dispatchEvent(new Event('input', {bubbles: true}));
+                el.dispatchEvent(new Event('change', {bubbles: true}));
+            }
+        } catch (e) {
+            failed.push(index);
+        }
+    }
+    return failed;
+};
+"""
+
+STEP_JS = "({modal, plan}) => {" + _FILL_FN + r"""
+    const root = document.querySelector(modal) || document;
+    const isRequired = el => el.required || el.getAttribute('aria-required') === 'true';
+    const questionLabel = el => {
+        if (el.id) {
+            const label = root.querySelector(`label[for="${CSS.escape(el.id)}"]`);
+            if (label) return label.innerText;
+        }
+        if (el.getAttribute('aria-label')) return el.getAttribute('aria-label');
+        const wrap = el.closest('label');
+        if (wrap) return wrap.innerText;
+        const legend = el.closest('fieldset') && el.closest('fieldset').querySelector('legend');
+        return legend ? legend.innerText : (el.name || el.id || '');
+    };
+    
+    root.querySelectorAll('[data-jat-field], [data-jat-action]').forEach(el => {
+        el.removeAttribute('data-jat-field');
+        el.removeAttribute('data-jat-action');
+    });
+    
+    const fields = [];
+    const radioGroups = {};
+    root.querySelectorAll('input, select, textarea').forEach(el => {
+        const type = el.tagName === 'SELECT' ? 'select'
+            : el.tagName === 'TEXTAREA' ? 'textarea' : (el.type || 'text').toLowerCase();
+        if (el.disabled || ['hidden', 'submit', 'button', 'image', 'reset'].includes(type)) return;
+        
+        if (type === 'radio') {
+            const key = el.name || questionLabel(el);
+            let group = radioGroups[key];
+            if (!group) {
+                const legend = el.closest('fieldset') && el.closest('fieldset').querySelector('legend');
+                group = radioGroups[key] = {
+                    index: fields.length, type, label: norm(legend ? legend.innerText : key),
+                    required: false, value: '', options: []
+                };
+                fields.push(group);
+            }
+            const option = norm(optionLabel(el));
+            group.options.push(option);
+            group.required = group.required || isRequired(el);
+            if (el.checked) group.value = option;
+            el.setAttribute('data-jat-field', group.index);
+            return;
+        }
+        
+        const field = {index: fields.length, type, label: norm(questionLabel(el)), required: isRequired(el), value: '', options: []};
+        if (type === 'select') {
+            field.options = [...el.options].map(o => norm(o.text));
+            const selected = el.selectedIndex >= 0 ? norm(el.options[el.selectedIndex].text) : '';
+            field.value = el.value && !selected.startsWith('select') ? selected : '';
+        } else if (type === 'checkbox') {
+            field.value = el.checked ? 'yes' : '';
+        } else if (type === 'file') {
+            field.value = el.files && el.files.length ? 'attached' : '';
+        } else {
+            field.value = el.value;
+        }
+        el.setAttribute('data-jat-field', field.index);
+        fields.push(field);
+    });
+    
+    const buttons = [...root.querySelectorAll('button:not([disabled])')];
+    const buttonText = b => norm(b.getAttribute('aria-label') || b.innerText);
+    const submit = buttons.find(b => buttonText(b).includes('submit application'));
+    const next = buttons.find(b => /continue|review|next/.test(buttonText(b)));
+    const action = submit ? 'submit' : next ? 'next' : null;
+    if (action) (submit || next).setAttribute('data-jat-action', action);
+    
+    const fingerprint = fields.map(f => `${f.type}:${f.label}:${f.options.join('|')}`).join('\n');
+    let planApplied = false;
+    let failed = [];
+    if (plan && plan.fingerprint === fingerprint) {
+        failed = fillFields(root, plan.values);
+        planApplied = true;
+    }
+    return {fields, action, fingerprint, planApplied, failed};
+}
+"""
+
+FILL_JS = "({modal, values}) => {" + _FILL_FN + r"""
+    return fillFields(document.querySelector(modal) || document, values);
+}
+"""
+
+ACTION_SELECTOR = "[data-jat-action]"
+TEXT_TYPES = {"text", "tel", "email", "url", "number", "search", "textarea"}
+
+# Profile answers for common questions: label keywords -> USER_INFO key
+PROFILE_RULES = [
+    (("phone", "mobile"), "phone"),
+    (("city", "location"), "city"),
+    (("website", "portfolio"), "website"),
+]
+
+
+def label_hash(label):
+    """Stable key for a normalized question label"""
+    return hashlib.sha1(label.encode('utf-8')).hexdigest()[:16]
+
+
+def field_selector(index):
+    return f"[data-jat-field='{index}']"
+
+
+class FormModel:
+    def __init__(self, db, user_info=None):
+        """Initialize the model
+        
+        Args:
+            db: ApplicationDatabase holding form_answers and form_layouts
+            user_info: Profile answers (None uses USER_INFO)
+        """
+        self.db = db
+        self.user_info = user_info or USER_INFO
+        self.stats = {'steps': 0, 'layout_hits': 0, 'filled': 0, 'unanswered': 0}
+    
+    def plan_for(self, company, step):
+        """Cached layout for a company's step ({fingerprint, values}) or None"""
+        return self.db.get_form_layout(normalize_company(company), step)
+    
+    def _profile_answer(self, field):
+        if field['type'] not in TEXT_TYPES:
+            return None
+        for keywords, key in PROFILE_RULES:
+            if any(keyword in field['label'] for keyword in keywords):
+                return self.user_info.get(key) or None
+        return None
+    
+    def resolve(self, fields):
+        """Values for the empty fields this model can answer
+        
+        Returns:
+            list: {'index', 'value'} dicts, ready for FILL_JS
+        """
+        empty = [f for f in fields if not f['value'] and f['type'] != 'file' and f['label']]
+        stored = self.db.get_form_answers(label_hash(f['label']) for f in empty)
+        
+        values = []
+        for field in empty:
+            answer = stored.get(label_hash(field['label'])) or self._profile_answer(field)
+            if answer is not None:
+                values.append({'index': field['index'], 'value': answer})
+        return values
+    
+    def unanswered(self, fields, values, failed, attached=()):
+        """Required fields left empty after filling (file inputs count once attached)"""
+        filled = {v['index'] for v in values} - set(failed)
+        return [
+            f for f in fields
+            if f['required'] and not f['value']
+            and f['index'] not in filled and f['index'] not in attached
+        ]
+    
+    def settle(self, company, step, state, values, failed, attached=()):
+        """Book-keep a step after filling: record open questions or cache the layout
+        
+        Args:
+            company: Company the form belongs to
+            step: 1-based step number
+            state: STEP_JS result
+            values: Values that were filled
+            failed: Indices FILL_JS could not set
+            attached: Indices of file inputs that received the resume
+        
+        Returns:
+            list: Required fields that still need a human
+        """
+        missing = self.unanswered(state['fields'], values, failed, attached)
+        company_key = normalize_company(company)
+        
+        self.stats['steps'] += 1
+        self.stats['layout_hits'] += 1 if state['planApplied'] else 0
+        self.stats['filled'] += len(values) - len(failed)
+        self.stats['unanswered'] += len(missing)
+        
+        if missing:
+            self.db.record_form_questions([
+                (label_hash(f['label']), f['label'], f['type'], json.dumps(f['options']))
+                for f in missing if f['label'] and f['type'] != 'file'
+            ])
+            if state['planApplied']:
+                self.db.delete_form_layout(company_key, step)
+        elif not state['planApplied'] and not failed:
+            self.db.put_form_layout(company_key, step, state['fingerprint'], values)
+        return missing
+    
+    def answer(self, label_hash_prefix, answer):
+        """Store a human answer for a recorded question
+        
+        Returns:
+            int: Questions updated
+        """
+        if len(label_hash_prefix) < 4:
+            raise ValueError("Use at least 4 characters of the question id")
+        return self.db.set_form_answer(label_hash_prefix, answer)
+    
+    def log_summary(self):
+        s = self.stats
+        if s['steps']:
+            logger.info(f"Easy Apply forms: {s['steps']} steps, {s['layout_hits']} from cached layouts, "
+                        f"{s['filled']} fields filled, {s['unanswered']} left for manual input")
@@ -0,0 +1,96 @@
+"""
+Application funnel: conversion rates and time between stages
+
+Built on the status_events log. One grouped query returns the first time each
+application entered each stage (Saved, Applied, Interview, Offer, Accepted);
+everything after that is vectorized pandas/NumPy, so a funnel over hundreds of
+thousands of events costs one pass over the table.
+
+A later stage implies the earlier ones, so an application has reached a stage
+if it ever entered that stage or any later one, whatever its current status.
+An interview that turned into a rejection or an offer still counts as an
+interview. The time it reached a stage is the earliest such entry.
+"""
+
+import numpy as np
+import pandas as pd
+from database import ApplicationDatabase
+
+STAGES = ["Saved", "Applied", "Interview", "Offer", "Accepted"]
+
+# Status entered -> stage index in STAGES (saving a job is always stage 0).
+# Statuses left out, like 'Manual Review Needed', do not move an application.
+STAGE_RANKS = {
+    'Applied': 1,
+    'Rejected': 1,
+    'Interview Scheduled': 2,
+    'Offer': 3,
+    'Declined': 3,
+    'Accepted': 4,
+}
+
+
+class FunnelAnalyzer:
+    def __init__(self, db=None):
+        """Initialize the analyzer
+        
+        Args:
+            db: ApplicationDatabase (None opens the default database)
+        """
+        self.db = db or ApplicationDatabase()
+    
+    def reach_times(self):
+        """When each application reached each stage
+        
+        Returns:
+            DataFrame: One row per application (indexed by application_id) with
+                a datetime column per stage, NaT where it never got there
+        """
+        rows = self.db.get_stage_reach_times(STAGE_RANKS)
+        if not rows:
+            return pd.DataFrame({stage: pd.Series(dtype='datetime64[ns]') for stage in STAGES})
+        
+        events = pd.DataFrame([tuple(row) for row in rows], columns=['application_id', 'stage', 'ts'])
+        events['seconds'] = (pd.to_datetime(events['ts'], errors='coerce') - pd.Timestamp(0)).dt.total_seconds()
+        wide = events.pivot(index='application_id', columns='stage', values='seconds')
+        seconds = wide.reindex(columns=range(len(STAGES))).to_numpy(dtype=float)
+        
+        # Earliest entry into this stage or any later one (NaN = never)
+        reached = np.fmin.accumulate(seconds[:, ::-1], axis=1)[:, ::-1]
+        return pd.DataFrame(
+            {stage: pd.to_datetime(reached[:, i], unit='s') for i, stage in enumerate(STAGES)},
+            index=wide.index
+        )
+    
+    def funnel(self, since=None, cohort="Saved"):
+        """Conversion and median time per stage
+        
+        Args:
+            since: Only applications that reached the cohort stage on or after
+                this date (YYYY-MM-DD; None keeps all)
+            cohort: Stage the since date applies to
+        
+        Returns:
+            DataFrame: One row per stage with 'reached' (applications), 'conversion'
+                (share of the previous stage), 'overall' (share of the first stage)
+                and 'median_days' (median time from the previous stage)
+        """
+        times = self.reach_times()
+        if since is not None:
+            times = times[times[cohort] >= pd.Timestamp(since)]
+        
+        reached = times.notna().sum().astype(int)
+        first = reached.iloc[0]
+        median_days = pd.Series(
+            [np.nan] + [
+                (times[stage] - times[previous]).dt.total_seconds().median() / 86400
+                for previous, stage in zip(STAGES, STAGES[1:])
+            ],
+            index=STAGES
+        )
+        return pd.DataFrame({
+            'reached': reached,
+            'conversion': reached / reached.shift(1).replace(0, np.nan),
+            'overall': reached / first if first else np.nan,
+            'median_days': median_days,
+        }, index=STAGES)
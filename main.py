@@ -1,32 +1,83 @@
 import schedule
 import time
+import asyncio
+import json
 from datetime import datetime, timedelta
 from scraper import JobScraper
-from application_bot import ApplicationBot
+from async_scraper import AsyncJobScraper
+from async_application_bot import AsyncApplicationBot
 from tracker import ApplicationTracker
 from notifications import NotificationManager
 from reports import ReportGenerator
 from database import ApplicationDatabase
-from config import APPLICATION_SETTINGS
+from pipeline import JobPipeline
+from apply_workers import ApplyWorkerPool, RateGovernor
+from easy_apply_form import FormModel
+from scoring import JobScorer
+from config import APPLICATION_SETTINGS, JOB_CRITERIA
 
 class JobApplicationManager:
-    def __init__(self):
-        self.scraper = JobScraper(headless=False)  # Set to True for production
-        self.bot = ApplicationBot()
+    def __init__(self, use_cache=True):
+        self.scraper = JobScraper(headless=False, use_cache=use_cache)  # Set to True for production
         self.tracker = ApplicationTracker()
         self.notifier = NotificationManager()
         self.reporter = ReportGenerator()
         self.db = ApplicationDatabase()
+        self.scorer = JobScorer()
     
     def daily_routine(self):
-        """Complete daily job search and application routine"""
+        """Complete daily job search and application routine
+        
+        Scraping, saving and applying overlap: jobs are saved in micro-batches
+        as each search completes and applications start on the first ones
+        while the remaining searches run (see JobPipeline).
+        """
         print(f"\n{'='*60}")
         print(f"🚀 Starting Daily Routine - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*60}")
         
-        # Step 1: Scrape new jobs
+        max_apps = APPLICATION_SETTINGS['max_applications_per_day']
+        print("\n[1-3/5] 🔍 Scraping, saving and applying as jobs come in...")
+        print(f"Auto-apply enabled: {APPLICATION_SETTINGS['auto_apply']}")
+        
+        if APPLICATION_SETTINGS['auto_apply']:
+            already_sent = self._applications_sent_today()
+            governor = RateGovernor(daily_cap=max_apps, already_sent=already_sent)
+            workers = ApplyWorkerPool(self._record_result, governor)
+            print(f"Attempting to apply to up to {governor.remaining} more jobs today "
+                  f"({workers.workers} workers, {APPLICATION_SETTINGS['apply_rate_per_minute']}/min)...")
+            pipeline = JobPipeline(self.scraper, applier=workers, scorer=self.scorer).run()
+        else:
+            pipeline = JobPipeline(self.scraper).run()
+            print("ℹ️  Auto-apply disabled. Jobs saved for manual review.")
+        
+        print(f"\n✓ Found {pipeline.found} new jobs")
+        if not pipeline.found:
+            print("\nNo new jobs found. Skipping application step.")
+            self._run_maintenance_tasks()
+            return
+        
+        self._finish_routine(pipeline.found, pipeline.saved, pipeline.applied)
+    
+    def _applications_sent_today(self):
+        """Applications already counted in today's daily stats"""
+        stats = self.db.get_daily_stats()
+        return stats['applications_sent'] if stats else 0
+    
+    async def async_daily_routine(self):
+        """Daily routine on the asyncio backend
+        
+        Searches run concurrently inside one browser, then up to
+        `apply_concurrency` Easy Apply flows run side by side on the same
+        event loop.
+        """
+        print(f"\n{'='*60}")
+        print(f"🚀 Starting Daily Routine (async) - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"{'='*60}")
+        
         print("\n[1/5] 🔍 Scraping new jobs from LinkedIn...")
-        jobs = self.scraper.scrape_linkedin_jobs()
+        scraper = AsyncJobScraper(headless=self.scraper.headless, use_cache=self.scraper.use_cache)
+        jobs = await scraper.scrape_linkedin_jobs()
         print(f"\n✓ Found {len(jobs)} new jobs")
         
         if not jobs:
@@ -34,11 +85,9 @@ class JobApplicationManager:
             self._run_maintenance_tasks()
             return
         
-        # Step 2: Save to database
         print("\n[2/5] 💾 Saving jobs to database...")
         saved_count = self.scraper.save_jobs_to_db(jobs)
         
-        # Step 3: Apply to eligible jobs (if auto-apply enabled)
         print(f"\n[3/5] 📝 Processing applications...")
         print(f"Auto-apply enabled: {APPLICATION_SETTINGS['auto_apply']}")
         
@@ -46,44 +95,76 @@ class JobApplicationManager:
         max_apps = APPLICATION_SETTINGS['max_applications_per_day']
         
         if APPLICATION_SETTINGS['auto_apply']:
-            print(f"Attempting to apply to up to {max_apps} jobs...")
+            concurrency = max(1, APPLICATION_SETTINGS['apply_concurrency'])
+            governor = RateGovernor(daily_cap=max_apps, already_sent=self._applications_sent_today())
+            print(f"Attempting to apply to up to {governor.remaining} more jobs today ({concurrency} at a time)...")
+            semaphore = asyncio.Semaphore(concurrency)
             
-            for job in jobs[:max_apps]:
-                if applications_today >= max_apps:
-                    break
-                
-                print(f"\n--- Application {applications_today + 1}/{max_apps} ---")
-                result = self.bot.apply_to_job(job['url'], job)
-                
-                if result['status'] == 'applied':
-                    applications_today += 1
-                    self.db.update_status(job['url'], 'Applied')
-                    if result.get('screenshot'):
-                        self.db.update_screenshot(job['url'], result['screenshot'])
-                    print(f"✅ Successfully applied!")
-                    time.sleep(5)  # Be polite between applications
-                
-                elif result['status'] == 'manual_required':
-                    self.db.update_status(job['url'], 'Manual Review Needed')
-                    if result.get('screenshot'):
-                        self.db.update_screenshot(job['url'], result['screenshot'])
-                
-                elif result['status'] == 'error':
-                    self.db.update_status(job['url'], 'Application Error', result.get('error', ''))
+            async with AsyncApplicationBot() as bot:
+                async def apply(job):
+                    async with semaphore:
+                        # Same daily cap, rate and company spacing as the sync workers
+                        if not await governor.reserve_async():
+                            return False
+                        applied = False
+                        try:
+                            await governor.wait_turn_async(job['company'])
+                            result = await bot.apply_to_job(job['url'], job)
+                            applied = self._record_result(job, result)
+                        finally:
+                            governor.release(applied)
+                        return applied
                 
-                time.sleep(3)  # Delay between attempts
+                # Rank every job: a failed attempt hands its slot to the next one
+                results = await asyncio.gather(*(apply(job) for job in self._applicable(jobs, None)))
+            applications_today = sum(results)
         else:
             print("ℹ️  Auto-apply disabled. Jobs saved for manual review.")
         
-        # Update daily stats
-        self.tracker.update_daily_stats(applications_sent=applications_today)
-        
+        self._finish_routine(len(jobs), saved_count, applications_today)
+    
+    def _applicable(self, jobs, top_n):
+        """The top_n jobs worth applying to, best first
+        
+        Near-duplicates of earlier postings are skipped and the rest are
+        ranked by JobScorer (jobs below its minimum score are dropped).
+        """
+        applicable = [job for job in jobs if job.get('duplicate_of') is None]
+        skipped = len(jobs) - len(applicable)
+        if skipped:
+            print(f"Skipping {skipped} near-duplicate postings")
+        ranked = self.scorer.rank(applicable, top_n=top_n)
+        for job in ranked:
+            print(f"   ★ {job.get('score', '-')}: {job['title']} at {job['company']}")
+        return ranked
+    
+    def _record_result(self, job, result):
+        """Store an application attempt's outcome; True if it was submitted"""
+        if result['status'] == 'applied':
+            self.db.update_status(job['url'], 'Applied')
+            if result.get('screenshot'):
+                self.db.update_screenshot(job['url'], result['screenshot'])
+            print(f"✅ Successfully applied!")
+            return True
+        
+        elif result['status'] == 'manual_required':
+            self.db.update_status(job['url'], 'Manual Review Needed')
+            if result.get('screenshot'):
+                self.db.update_screenshot(job['url'], result['screenshot'])
+        
+        elif result['status'] == 'error':
+            self.db.update_status(job['url'], 'Application Error', result.get('error', ''))
+        
+        return False
+    
+    def _finish_routine(self, jobs_found, saved_count, applications_today):
+        """Run maintenance and print the routine summary (daily stats are kept by database triggers)"""
         # Run maintenance tasks
         self._run_maintenance_tasks()
         
         print(f"\n{'='*60}")
         print(f"✓ Daily Routine Completed!")
-        print(f"  🔍 Jobs scraped: {len(jobs)}")
+        print(f"  🔍 Jobs scraped: {jobs_found}")
         print(f"  💾 Jobs saved: {saved_count}")
         print(f"  📝 Applications sent: {applications_today}")
         print(f"{'='*60}\n")
@@ -145,6 +226,52 @@ class JobApplicationManager:
             apps = self.db.get_all_applications(limit)
             print(f"\n📋 Recent applications (limit {limit}):")
         
+        self._print_applications(apps)
+    
+    def search_applications(self, query, status=None, limit=20):
+        """Full-text search over saved applications"""
+        filters = {'status': status} if status else None
+        apps = self.db.search(query, filters, limit)
+        print(f"\n🔎 Results for '{query}' (limit {limit}):")
+        self._print_applications(apps)
+    
+    def list_by_salary(self, min_salary=None, max_salary=None, limit=20):
+        """List applications paying within a range (defaults to JOB_CRITERIA['salary_range'])"""
+        salary_range = JOB_CRITERIA['salary_range']
+        low = salary_range['min'] if min_salary is None else min_salary
+        high = salary_range['max'] if max_salary is None else max_salary
+        apps = self.db.get_applications_in_salary_range(low, high, limit=limit)
+        print(f"\n💰 Applications paying {low:,.0f}-{high:,.0f} a year (limit {limit}):")
+        self._print_applications(apps)
+    
+    def list_form_questions(self, limit=50):
+        """Show Easy Apply questions the bot could not answer"""
+        questions = self.db.get_unanswered_questions(limit)
+        if not questions:
+            print("✓ Every Easy Apply question seen so far has an answer")
+            return
+        
+        print(f"\n❓ {len(questions)} Easy Apply questions need an answer:\n")
+        for q in questions:
+            options = json.loads(q['options'] or '[]')
+            print(f"  [{q['label_hash'][:8]}] {q['label']} ({q['field_type']}, seen {q['times_seen']}x)")
+            if options:
+                print(f"             options: {', '.join(options)}")
+        print('\nAnswer with: python main.py answer <id> "<answer>"')
+    
+    def answer_form_question(self, question_id, answer):
+        """Store the answer to an Easy Apply question for future forms"""
+        try:
+            updated = FormModel(self.db).answer(question_id, answer)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        if updated:
+            print(f"✓ Saved answer for {updated} question(s)")
+        else:
+            print(f"❌ No question with id {question_id}")
+    
+    def _print_applications(self, apps):
         if not apps:
             print("   No applications found")
             return
@@ -152,6 +279,8 @@ class JobApplicationManager:
         for app in apps:
             print(f"\n   • {app['job_title']} at {app['company_name']}")
             print(f"     Status: {app['application_status']} | Applied: {app['date_applied']}")
+            if app['salary_max'] is not None:
+                print(f"     Salary: {app['salary_range']}")
             print(f"     URL: {app['job_url']}")
 
 def run_scheduler():
@@ -259,40 +388,92 @@ if __name__ == "__main__":
     
     if len(sys.argv) > 1:
         # Command-line mode
-        manager = JobApplicationManager()
+        manager = JobApplicationManager(use_cache="--no-cache" not in sys.argv)
         
         command = sys.argv[1].lower()
+        use_async = "--async" in sys.argv
         
         if command == "scrape":
-            jobs = manager.scraper.scrape_linkedin_jobs()
+            if use_async:
+                scraper = AsyncJobScraper(headless=manager.scraper.headless, use_cache=manager.scraper.use_cache)
+                jobs = asyncio.run(scraper.scrape_linkedin_jobs())
+            else:
+                jobs = manager.scraper.scrape_linkedin_jobs()
             manager.scraper.save_jobs_to_db(jobs)
-            
+        
         elif command == "apply":
-            manager.daily_routine()
-            
+            if use_async:
+                asyncio.run(manager.async_daily_routine())
+            else:
+                manager.daily_routine()
+        
         elif command == "followups":
             manager.tracker.check_followups()
-            
+        
         elif command == "interviews":
             manager.monitor_interviews()
-            
+        
         elif command == "report":
             manager.reporter.generate_daily_report()
-            
+        
         elif command == "weekly":
             manager.weekly_review()
-            
+        
         elif command == "stats":
             days = int(sys.argv[2]) if len(sys.argv) > 2 else 30
             manager.show_stats(days)
-            
+        
         elif command == "list":
             limit = int(sys.argv[2]) if len(sys.argv) > 2 else 20
             manager.list_applications(limit=limit)
-            
+        
+        elif command == "search":
+            if len(sys.argv) < 3:
+                print('Usage: python main.py search "<query>" [--status STATUS] [--limit N]')
+            else:
+                status = sys.argv[sys.argv.index("--status") + 1] if "--status" in sys.argv else None
+                limit = int(sys.argv[sys.argv.index("--limit") + 1]) if "--limit" in sys.argv else 20
+                manager.search_applications(sys.argv[2], status=status, limit=limit)
+        
         elif command == "scheduler":
             run_scheduler()
-            
+        
+        elif command == "dedupe":
+            from dedupe import DuplicateDetector
+            duplicates = DuplicateDetector(manager.db).backfill()
+            print(f"🔁 Linked {duplicates} near-duplicate applications to their first posting")
+        
+        elif command == "salaries":
+            if "--reparse" in sys.argv:
+                from salary import backfill
+                parsed = backfill(manager.db)
+                print(f"💰 Parsed a salary for {parsed} applications")
+            else:
+                bounds = [float(arg) for arg in sys.argv[2:4]]
+                manager.list_by_salary(*bounds)
+        
+        elif command == "funnel":
+            days = int(sys.argv[2]) if len(sys.argv) > 2 else None
+            manager.tracker.show_funnel(days)
+        
+        elif command == "rebuild-stats":
+            days = manager.db.rebuild_rollups()
+            print(f"📊 Rebuilt daily statistics for {days} days from the status history")
+        
+        elif command == "answers":
+            manager.list_form_questions()
+        
+        elif command == "answer":
+            if len(sys.argv) < 4:
+                print('Usage: python main.py answer <question id> "<answer>"')
+            else:
+                manager.answer_form_question(sys.argv[2], sys.argv[3])
+        
+        elif command == "dbbench":
+            from db_benchmark import run_benchmark
+            seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+            run_benchmark(duration=seconds)
+        
         else:
             print("Usage:")
             print("  python main.py scrape      - Scrape jobs only")
@@ -303,7 +484,18 @@ if __name__ == "__main__":
             print("  python main.py weekly      - Generate weekly report")
             print("  python main.py stats [days] - View statistics")
             print("  python main.py list [limit] - List applications")
+            print('  python main.py search "<query>" [--status S] [--limit N] - Search applications')
             print("  python main.py scheduler   - Run automated scheduler")
+            print("  python main.py dedupe     - Re-check every application for near-duplicates")
+            print("  python main.py salaries [min] [max] - List applications by annual salary (default: salary_range)")
+            print("  python main.py salaries --reparse - Re-parse stored salary text into numeric ranges")
+            print("  python main.py funnel [days] - Conversion and median days between stages")
+            print("  python main.py rebuild-stats - Recompute daily statistics from the status history")
+            print("  python main.py answers    - List Easy Apply questions waiting for an answer")
+            print('  python main.py answer <id> "<text>" - Answer an Easy Apply question')
+            print("  python main.py dbbench [seconds] - Benchmark SQLite connection settings")
+            print("\n  Add --async to scrape/apply to use the asyncio browser backend")
+            print("  Add --no-cache to scrape/apply to re-run searches even if recently cached")
     else:
         # Interactive mode
         interactive_menu()
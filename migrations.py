@@ -0,0 +1,548 @@
+"""
+Versioned schema migrations keyed on PRAGMA user_version
+
+Each migration runs once, in order, inside its own transaction together with
+the user_version bump, so a failure leaves the database at the previous
+version. When the database is already current, migrate() is a single pragma
+read.
+
+To change the schema, append a new (version, description, function) entry to
+MIGRATIONS - never edit one that has shipped.
+"""
+
+import sqlite3
+from logger import get_logger
+from salary import salary_columns
+
+logger = get_logger(__name__)
+
+
+def _columns(conn, table):
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+# Prefix lengths applications_fts indexes; search() cuts longer words to the last one
+FTS_PREFIX_LENGTHS = range(2, 9)
+
+# Transitions reconstructed from current statuses: saved on date_applied, sent
+# (implied by any later status) and moved to the current status on status_updated
+STATUS_HISTORY_SQL = '''
+SELECT id, '' AS from_status, 'Applied' AS to_status, datetime(date_applied) AS ts, 0 AS step
+FROM applications
+UNION ALL
+SELECT id, 'Applied', 'Applied', datetime(date_applied), 1 FROM applications
+WHERE application_status IN ('Interview Scheduled', 'Rejected', 'Offer', 'Accepted', 'Declined')
+UNION ALL
+SELECT id, 'Applied', application_status, datetime(status_updated), 2 FROM applications
+WHERE application_status != 'Applied' OR screenshot_path IS NOT NULL
+'''
+
+# daily_stats counters per day derived from status_rollup (the same counts the triggers keep)
+DAILY_COUNTS_SQL = '''
+SELECT day AS date,
+    SUM(CASE WHEN to_status = 'Applied' AND from_status != '' THEN transitions ELSE 0 END) AS applications_sent,
+    SUM(CASE WHEN to_status = 'Interview Scheduled' THEN transitions ELSE 0 END) AS interviews_scheduled,
+    SUM(CASE WHEN to_status = 'Rejected' THEN transitions ELSE 0 END) AS rejections_received,
+    SUM(CASE WHEN to_status = 'Offer' THEN transitions ELSE 0 END) AS offers_received
+FROM status_rollup
+GROUP BY day
+'''
+
+
+def refresh_daily_stats(conn):
+    """Recompute daily_stats from status_rollup plus the manual adjustments"""
+    conn.execute('DELETE FROM daily_stats')
+    conn.execute(f'''
+    INSERT INTO daily_stats (date, applications_sent, interviews_scheduled, rejections_received, offers_received)
+    SELECT date, SUM(applications_sent), SUM(interviews_scheduled), SUM(rejections_received), SUM(offers_received)
+    FROM (
+        {DAILY_COUNTS_SQL}
+        UNION ALL
+        SELECT date, applications_sent, interviews_scheduled, rejections_received, offers_received
+        FROM daily_stats_adjustments
+    )
+    GROUP BY date
+    ''')
+
+
+def _initial_schema(conn):
+    """Baseline tables and indexes (safe on databases created before versioning)"""
+    # Applications table
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS applications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_title TEXT NOT NULL,
+        company_name TEXT NOT NULL,
+        job_url TEXT UNIQUE,
+        location TEXT,
+        salary_range TEXT,
+        date_applied DATE DEFAULT CURRENT_DATE,
+        application_status TEXT DEFAULT 'Applied',
+        status_updated DATE DEFAULT CURRENT_DATE,
+        follow_up_date DATE,
+        interview_date DATE,
+        notes TEXT,
+        resume_version TEXT,
+        cover_letter_sent BOOLEAN DEFAULT FALSE,
+        screenshot_path TEXT,
+        date_posted DATE
+    )
+    ''')
+    
+    # Company contacts table
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS company_contacts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_name TEXT NOT NULL,
+        contact_name TEXT,
+        contact_email TEXT,
+        contact_phone TEXT,
+        linkedin_url TEXT,
+        last_contacted DATE
+    )
+    ''')
+    
+    # Daily stats table
+    conn.execute('''
+    CREATE TABLE IF NOT EXISTS daily_stats (
+        date DATE PRIMARY KEY,
+        applications_sent INTEGER DEFAULT 0,
+        interviews_scheduled INTEGER DEFAULT 0,
+        rejections_received INTEGER DEFAULT 0,
+        offers_received INTEGER DEFAULT 0
+    )
+    ''')
+    
+    # Columns added after the first release
+    existing = _columns(conn, 'applications')
+    for column, definition in [('screenshot_path', 'TEXT'), ('date_posted', 'DATE')]:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE applications ADD COLUMN {column} {definition}")
+    
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_status ON applications(application_status)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_date_applied ON applications(date_applied)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_followup_date ON applications(follow_up_date)')
+
+
+def _drop_redundant_url_index(conn):
+    """job_url is UNIQUE, so SQLite already keeps an index on it"""
+    conn.execute('DROP INDEX IF EXISTS idx_job_url')
+
+
+def _full_text_index(conn):
+    """FTS5 index over the searchable text columns, kept in sync by triggers"""
+    try:
+        conn.execute('''
+        CREATE VIRTUAL TABLE applications_fts USING fts5(
+            job_title, company_name, location, notes,
+            content='applications', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        ''')
+    except sqlite3.OperationalError as e:
+        # SQLite built without FTS5: search() falls back to LIKE
+        logger.warning(f"Full-text search unavailable: {e}")
+        return
+    
+    conn.execute('''
+    CREATE TRIGGER applications_fts_insert AFTER INSERT ON applications BEGIN
+        INSERT INTO applications_fts(rowid, job_title, company_name, location, notes)
+        VALUES (new.id, new.job_title, new.company_name, new.location, new.notes);
+    END
+    ''')
+    conn.execute('''
+    CREATE TRIGGER applications_fts_delete AFTER DELETE ON applications BEGIN
+        INSERT INTO applications_fts(applications_fts, rowid, job_title, company_name, location, notes)
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.location, old.notes);
+    END
+    ''')
+    conn.execute('''
+    CREATE TRIGGER applications_fts_update
+    AFTER UPDATE OF job_title, company_name, location, notes ON applications BEGIN
+        INSERT INTO applications_fts(applications_fts, rowid, job_title, company_name, location, notes)
+        VALUES ('delete', old.id, old.job_title, old.company_name, old.location, old.notes);
+        INSERT INTO applications_fts(rowid, job_title, company_name, location, notes)
+        VALUES (new.id, new.job_title, new.company_name, new.location, new.notes);
+    END
+    ''')
+    
+    # Default ranking: title matches weigh most, then company, location, notes
+    conn.execute("INSERT INTO applications_fts(applications_fts, rank) VALUES ('rank', 'bm25(10.0, 5.0, 2.0, 1.0)')")
+    
+    # Index rows that existed before this migration
+    conn.execute("INSERT INTO applications_fts(applications_fts) VALUES ('rebuild')")
+
+
+def _scrape_queue(conn):
+    """Durable work queue of keyword/location search units per scrape run"""
+    conn.execute('''
+    CREATE TABLE scrape_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        finished_at TIMESTAMP,
+        status TEXT DEFAULT 'running'
+    )
+    ''')
+    conn.execute('''
+    CREATE TABLE scrape_units (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id INTEGER NOT NULL REFERENCES scrape_runs(id),
+        keyword TEXT NOT NULL,
+        location TEXT NOT NULL,
+        status TEXT DEFAULT 'pending',
+        attempts INTEGER DEFAULT 0,
+        results TEXT,
+        error TEXT,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (run_id, keyword, location)
+    )
+    ''')
+    conn.execute('CREATE INDEX idx_scrape_units_run_status ON scrape_units(run_id, status)')
+
+
+def _search_cache(conn):
+    """Cached search results keyed on keyword, location and filters"""
+    conn.execute('''
+    CREATE TABLE search_cache (
+        cache_key TEXT PRIMARY KEY,
+        keyword TEXT NOT NULL,
+        location TEXT NOT NULL,
+        filters TEXT,
+        results TEXT NOT NULL,
+        fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    conn.execute('CREATE INDEX idx_search_cache_last_accessed ON search_cache(last_accessed)')
+
+
+def _near_duplicates(conn):
+    """duplicate_of link plus the LSH band index used to find near-duplicate jobs"""
+    if 'duplicate_of' not in _columns(conn, 'applications'):
+        conn.execute('ALTER TABLE applications ADD COLUMN duplicate_of INTEGER REFERENCES applications(id)')
+    conn.execute('CREATE INDEX idx_duplicate_of ON applications(duplicate_of)')
+    conn.execute('''
+    CREATE TABLE dedupe_bands (
+        band_hash INTEGER NOT NULL,
+        application_id INTEGER NOT NULL REFERENCES applications(id),
+        PRIMARY KEY (band_hash, application_id)
+    ) WITHOUT ROWID
+    ''')
+
+
+def _easy_apply_forms(conn):
+    """Answer store for Easy Apply questions plus cached per-company form layouts"""
+    conn.execute('''
+    CREATE TABLE form_answers (
+        label_hash TEXT PRIMARY KEY,
+        label TEXT NOT NULL,
+        field_type TEXT,
+        options TEXT,
+        answer TEXT,
+        source TEXT,
+        times_seen INTEGER DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    conn.execute('CREATE INDEX idx_form_answers_unanswered ON form_answers(times_seen) WHERE answer IS NULL')
+    conn.execute('''
+    CREATE TABLE form_layouts (
+        company_key TEXT NOT NULL,
+        step INTEGER NOT NULL,
+        fingerprint TEXT NOT NULL,
+        plan TEXT NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (company_key, step)
+    )
+    ''')
+
+
+def _salary_range_columns(conn):
+    """Annual salary range parsed from salary_range, indexed for range queries"""
+    existing = _columns(conn, 'applications')
+    for column, definition in [('salary_min', 'REAL'), ('salary_max', 'REAL'), ('currency', 'TEXT'), ('period', 'TEXT')]:
+        if column not in existing:
+            conn.execute(f"ALTER TABLE applications ADD COLUMN {column} {definition}")
+    
+    # Overlap with a wanted range is "salary_max >= low AND salary_min <= high":
+    # a range scan on salary_max, with salary_min checked from the index
+    conn.execute('CREATE INDEX idx_salary_range ON applications(salary_max, salary_min)')
+    
+    # Parse rows saved before this migration
+    _parse_stored_salaries(conn)
+
+
+def _parse_stored_salaries(conn):
+    """Re-parse every application's salary_range into the numeric columns"""
+    rows = conn.execute("SELECT id, salary_range FROM applications WHERE salary_range IS NOT NULL").fetchall()
+    conn.executemany(
+        'UPDATE applications SET salary_min = ?, salary_max = ?, currency = ?, period = ? WHERE id = ?',
+        [salary_columns(row[1]) + (row[0],) for row in rows]
+    )
+
+
+def rebuild_status_rollup(conn):
+    """Recompute status_rollup from the status_events log, then daily_stats"""
+    conn.execute('DELETE FROM status_rollup')
+    conn.execute('''
+    INSERT INTO status_rollup (day, from_status, to_status, transitions)
+    SELECT date(ts), from_status, to_status, COUNT(*) FROM status_events
+    GROUP BY date(ts), from_status, to_status
+    ''')
+    refresh_daily_stats(conn)
+
+
+def _status_rollups(conn):
+    """Per-day status transition counts and daily_stats, maintained by triggers"""
+    conn.execute('''
+    CREATE TABLE status_rollup (
+        day DATE NOT NULL,
+        from_status TEXT NOT NULL,
+        to_status TEXT NOT NULL,
+        transitions INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, from_status, to_status)
+    ) WITHOUT ROWID
+    ''')
+    
+    # Counts added by hand (update_daily_stats), kept across rebuilds
+    conn.execute('''
+    CREATE TABLE daily_stats_adjustments (
+        date DATE PRIMARY KEY,
+        applications_sent INTEGER DEFAULT 0,
+        interviews_scheduled INTEGER DEFAULT 0,
+        rejections_received INTEGER DEFAULT 0,
+        offers_received INTEGER DEFAULT 0
+    )
+    ''')
+    
+    # Days are UTC (CURRENT_DATE), like date_applied and status_updated.
+    # A saved job enters its first status from ''
+    conn.execute('''
+    CREATE TRIGGER status_rollup_insert AFTER INSERT ON applications BEGIN
+        INSERT INTO status_rollup (day, from_status, to_status, transitions)
+        VALUES (CURRENT_DATE, '', new.application_status, 1)
+        ON CONFLICT (day, from_status, to_status) DO UPDATE SET transitions = transitions + 1;
+    END
+    ''')
+    
+    # Jobs are saved as 'Applied', so setting 'Applied' again is the application being sent
+    conn.execute('''
+    CREATE TRIGGER status_rollup_update AFTER UPDATE OF application_status ON applications
+    WHEN new.application_status IS NOT old.application_status OR new.application_status = 'Applied'
+    BEGIN
+        INSERT INTO status_rollup (day, from_status, to_status, transitions)
+        VALUES (CURRENT_DATE, old.application_status, new.application_status, 1)
+        ON CONFLICT (day, from_status, to_status) DO UPDATE SET transitions = transitions + 1;
+        
+        INSERT INTO daily_stats (date, applications_sent, interviews_scheduled, rejections_received, offers_received)
+        VALUES (
+            CURRENT_DATE,
+            new.application_status = 'Applied',
+            new.application_status = 'Interview Scheduled',
+            new.application_status = 'Rejected',
+            new.application_status = 'Offer'
+        )
+        ON CONFLICT (date) DO UPDATE SET
+            applications_sent = applications_sent + excluded.applications_sent,
+            interviews_scheduled = interviews_scheduled + excluded.interviews_scheduled,
+            rejections_received = rejections_received + excluded.rejections_received,
+            offers_received = offers_received + excluded.offers_received;
+    END
+    ''')
+    
+    # Seed transitions from current statuses
+    conn.execute(f'''
+    INSERT INTO status_rollup (day, from_status, to_status, transitions)
+    SELECT date(ts), from_status, to_status, COUNT(*) FROM ({STATUS_HISTORY_SQL})
+    WHERE ts IS NOT NULL
+    GROUP BY date(ts), from_status, to_status
+    ''')
+    
+    # Keep what earlier runs counted by hand beyond what the statuses explain
+    conn.execute(f'''
+    INSERT INTO daily_stats_adjustments
+        (date, applications_sent, interviews_scheduled, rejections_received, offers_received)
+    SELECT old.date,
+        MAX(COALESCE(old.applications_sent, 0) - COALESCE(derived.applications_sent, 0), 0),
+        MAX(COALESCE(old.interviews_scheduled, 0) - COALESCE(derived.interviews_scheduled, 0), 0),
+        MAX(COALESCE(old.rejections_received, 0) - COALESCE(derived.rejections_received, 0), 0),
+        MAX(COALESCE(old.offers_received, 0) - COALESCE(derived.offers_received, 0), 0)
+    FROM daily_stats old
+    LEFT JOIN ({DAILY_COUNTS_SQL}) derived ON derived.date = old.date
+    ''')
+    refresh_daily_stats(conn)
+
+
+def _status_events(conn):
+    """Append-only log of status transitions, written by triggers"""
+    conn.execute('''
+    CREATE TABLE status_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        application_id INTEGER NOT NULL REFERENCES applications(id),
+        from_status TEXT NOT NULL,
+        to_status TEXT NOT NULL,
+        notes TEXT,
+        ts TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    conn.execute('CREATE INDEX idx_status_events_application_ts ON status_events(application_id, ts)')
+    
+    # Same transitions status_rollup counts, so rollups can be rebuilt from the log
+    conn.execute('''
+    CREATE TRIGGER status_events_insert AFTER INSERT ON applications BEGIN
+        INSERT INTO status_events (application_id, from_status, to_status, notes)
+        VALUES (new.id, '', new.application_status, new.notes);
+    END
+    ''')
+    conn.execute('''
+    CREATE TRIGGER status_events_update AFTER UPDATE OF application_status ON applications
+    WHEN new.application_status IS NOT old.application_status OR new.application_status = 'Applied'
+    BEGIN
+        INSERT INTO status_events (application_id, from_status, to_status, notes)
+        VALUES (new.id, old.application_status, new.application_status, new.notes);
+    END
+    ''')
+    
+    # Seed from current statuses, as status_rollup was (UTC timestamps like the triggers)
+    conn.execute(f'''
+    INSERT INTO status_events (application_id, from_status, to_status, ts)
+    SELECT id, from_status, to_status, ts FROM ({STATUS_HISTORY_SQL})
+    WHERE ts IS NOT NULL
+    ORDER BY id, step
+    ''')
+
+
+
+def _send_counted_once(conn):
+    """Count an application as sent only the first time it is set to 'Applied'"""
+    conn.execute('DROP TRIGGER status_rollup_update')
+    conn.execute('DROP TRIGGER status_events_update')
+    
+    # Jobs are saved as 'Applied', so the first 'Applied' write is the send;
+    # writing 'Applied' again (a retried callback, a manual update) changes
+    # nothing. One trigger so the send check runs before the event is logged.
+    conn.execute('''
+    CREATE TRIGGER status_transition_update AFTER UPDATE OF application_status ON applications
+    WHEN new.application_status IS NOT old.application_status
+        OR (new.application_status = 'Applied' AND NOT EXISTS (
+            SELECT 1 FROM status_events
+            WHERE application_id = new.id AND to_status = 'Applied' AND from_status != ''
+        ))
+    BEGIN
+        INSERT INTO status_rollup (day, from_status, to_status, transitions)
+        VALUES (CURRENT_DATE, old.application_status, new.application_status, 1)
+        ON CONFLICT (day, from_status, to_status) DO UPDATE SET transitions = transitions + 1;
+        
+        INSERT INTO daily_stats (date, applications_sent, interviews_scheduled, rejections_received, offers_received)
+        VALUES (
+            CURRENT_DATE,
+            new.application_status = 'Applied',
+            new.application_status = 'Interview Scheduled',
+            new.application_status = 'Rejected',
+            new.application_status = 'Offer'
+        )
+        ON CONFLICT (date) DO UPDATE SET
+            applications_sent = applications_sent + excluded.applications_sent,
+            interviews_scheduled = interviews_scheduled + excluded.interviews_scheduled,
+            rejections_received = rejections_received + excluded.rejections_received,
+            offers_received = offers_received + excluded.offers_received;
+        
+        INSERT INTO status_events (application_id, from_status, to_status, notes)
+        VALUES (new.id, old.application_status, new.application_status, new.notes);
+    END
+    ''')
+    
+    # Drop repeat sends the old triggers logged, then recount from the log
+    conn.execute('''
+    DELETE FROM status_events
+    WHERE from_status = 'Applied' AND to_status = 'Applied'
+    AND id NOT IN (
+        SELECT MIN(id) FROM status_events
+        WHERE to_status = 'Applied' AND from_status != ''
+        GROUP BY application_id
+    )
+    ''')
+    rebuild_status_rollup(conn)
+
+
+
+def _full_text_prefixes(conn):
+    """Rebuild applications_fts with prefix indexes, so "word"* is one lookup"""
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'applications_fts'").fetchone():
+        return  # No FTS5 in this build
+    
+    # The sync triggers refer to the table by name and keep working
+    conn.execute('DROP TABLE applications_fts')
+    conn.execute(f'''
+    CREATE VIRTUAL TABLE applications_fts USING fts5(
+        job_title, company_name, location, notes,
+        content='applications', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='{" ".join(str(length) for length in FTS_PREFIX_LENGTHS)}'
+    )
+    ''')
+    conn.execute("INSERT INTO applications_fts(applications_fts, rank) VALUES ('rank', 'bm25(10.0, 5.0, 2.0, 1.0)')")
+    conn.execute("INSERT INTO applications_fts(applications_fts) VALUES ('rebuild')")
+
+
+MIGRATIONS = [
+    (1, "Initial schema", _initial_schema),
+    (2, "Drop duplicate job_url index", _drop_redundant_url_index),
+    (3, "Full-text search index", _full_text_index),
+    (4, "Scrape work queue", _scrape_queue),
+    (5, "Search result cache", _search_cache),
+    (6, "Near-duplicate job index", _near_duplicates),
+    (7, "Easy Apply answer store and form layouts", _easy_apply_forms),
+    (8, "Numeric salary range columns", _salary_range_columns),
+    (9, "Trigger-maintained status rollups", _status_rollups),
+    (10, "Status history event log", _status_events),
+    (11, "Count each application as sent once", _send_counted_once),
+    (12, "Re-parse salaries without benefit amounts", _parse_stored_salaries),
+    (13, "Prefix index for full-text search", _full_text_prefixes),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_version(conn):
+    """Current schema version stored in the database header"""
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def migrate(conn):
+    """Apply any pending migrations
+    
+    Args:
+        conn: sqlite3 connection (not inside a transaction)
+    
+    Returns:
+        int: Schema version after migrating
+    """
+    version = get_version(conn)
+    if version >= LATEST_VERSION:
+        return version
+    
+    for target, description, apply in MIGRATIONS:
+        if target <= version:
+            continue
+        
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Another process may have migrated while we waited for the lock
+            version = get_version(conn)
+            if target <= version:
+                conn.rollback()
+                continue
+            
+            apply(conn)
+            conn.execute(f'PRAGMA user_version = {target}')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            logger.error(f"Migration {target} ({description}) failed, schema left at version {version}")
+            raise
+        
+        version = target
+        logger.info(f"Applied migration {target}: {description}")
+    
+    return version
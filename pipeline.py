@@ -0,0 +1,136 @@
+"""
+Streaming scrape -> save -> apply pipeline for the daily routine
+
+A producer thread drives JobScraper.iter_linkedin_jobs(), saving jobs in
+micro-batches as searches complete and handing eligible ones to the apply
+stage (an ApplyWorkerPool) through a bounded queue. Applications run while
+scraping carries on, so the first one starts as soon as the first search is
+saved rather than after the last one.
+
+Only jobs a batch newly inserted go on to the apply stage; ones already in
+the database were handled by an earlier run. Each saved batch is ranked by a
+JobScorer (below min_score is dropped) and the queue is a priority queue, so
+workers always take the best-scoring job waiting. The queue gives
+back-pressure: when applying falls behind, the producer blocks until a slot
+frees up. Once the daily cap is reached the apply stage closes and the
+producer just finishes scraping and saving. Only the current batch and the
+queued jobs are held in memory.
+
+Playwright's sync API is bound to the thread that started it, so the scraper
+(producer thread) and each apply worker run their own browser.
+"""
+
+import itertools
+import queue
+import threading
+import time
+from config import PIPELINE_SETTINGS
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+_DONE = object()  # End-of-stream marker (sorts after every job)
+
+
+class JobPipeline:
+    def __init__(self, scraper, applier=None, scorer=None, batch_size=None, queue_size=None):
+        """Initialize the pipeline
+        
+        Args:
+            scraper: JobScraper providing iter_linkedin_jobs() and save_jobs_to_db()
+            applier: ApplyWorkerPool consuming eligible jobs (None only scrapes and saves)
+            scorer: JobScorer ranking each batch before it is queued (None keeps scrape order)
+            batch_size: Jobs saved per transaction (None uses config value)
+            queue_size: Saved jobs buffered for the apply stage (None uses config value)
+        """
+        self.scraper = scraper
+        self.applier = applier
+        self.scorer = scorer
+        self.batch_size = max(1, batch_size or PIPELINE_SETTINGS['save_batch_size'])
+        self.jobs = queue.PriorityQueue(maxsize=max(1, queue_size or PIPELINE_SETTINGS['apply_queue_size']))
+        self._sequence = itertools.count()  # Tie-breaker: equal scores keep arrival order
+        self._apply_closed = threading.Event()
+        
+        self.found = 0
+        self.saved = 0
+        self.applied = 0
+        self.first_application_after = None  # Seconds from start to the first job handed to the apply stage
+        self.error = None
+        self._started = None
+    
+    def run(self):
+        """Scrape, save and apply until scraping is finished
+        
+        Returns:
+            JobPipeline: self, with found/saved/applied counts filled in
+        """
+        self._started = time.monotonic()
+        if self.applier is None:
+            self._apply_closed.set()
+            self._produce()
+            return self
+        
+        producer = threading.Thread(target=self._produce, name="scrape-producer", daemon=True)
+        producer.start()
+        try:
+            self.applied = self.applier.run(self._next_job)
+        finally:
+            # Never leave the producer blocked on a full queue
+            self._apply_closed.set()
+        
+        producer.join()
+        return self
+    
+    def _produce(self):
+        """Scrape and save in micro-batches, handing eligible jobs to the apply stage"""
+        batch = []
+        try:
+            for jobs in self.scraper.iter_linkedin_jobs():
+                self.found += len(jobs)
+                batch.extend(jobs)
+                if len(batch) >= self.batch_size:
+                    self._save(batch)
+                    batch = []
+            if batch:
+                self._save(batch)
+        except Exception as e:
+            self.error = e
+            logger.error(f"Scrape/save stage failed: {e}", exc_info=True)
+        finally:
+            self._offer(_DONE, float('inf'))
+    
+    def _save(self, batch):
+        self.saved += self.scraper.save_jobs_to_db(batch)
+        eligible = [job for job in batch if job.get('saved') and job.get('duplicate_of') is None]
+        if self.scorer is not None:
+            eligible = self.scorer.rank(eligible)
+        for job in eligible:
+            self._offer(job, -job.get('score', 0))
+    
+    def _offer(self, item, priority):
+        """Queue an item for the apply stage (lowest priority first), blocking while it is full
+        
+        Returns:
+            bool: False if the apply stage has closed and the item was dropped
+        """
+        while not self._apply_closed.is_set():
+            try:
+                self.jobs.put((priority, next(self._sequence), item), timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _next_job(self):
+        """Next job for an apply worker (None once scraping is finished)"""
+        entry = self.jobs.get()
+        job = entry[2]
+        if job is _DONE:
+            # Leave the marker for the other workers
+            self.jobs.put_nowait(entry)
+            return None
+        
+        if self.first_application_after is None:
+            self.first_application_after = time.monotonic() - self._started
+            logger.info(f"First job reached the apply stage {self.first_application_after:.1f}s into the routine")
+        return job
@@ -16,16 +16,10 @@ class ReportGenerator:
         today = datetime.now().strftime('%Y-%m-%d')
         
         # Get today's applications
-        cursor = self.db.conn.cursor()
-        cursor.execute('''
-        SELECT * FROM applications 
-        WHERE date_applied = ? 
-        ORDER BY id DESC
-        ''', (today,))
-        todays_apps = cursor.fetchall()
+        todays_apps = self.db.get_applications_on(today)
         
         # Get today's stats
-        stats = self.db.get_daily_stats(today)
+        stats = self.db.get_daily_stats()  # Counters are kept per UTC day
         
         # Get pending follow-ups
         followups = self.db.get_pending_followups()
@@ -56,13 +50,7 @@ class ReportGenerator:
         week_ago = today - timedelta(days=7)
         
         # Get week's applications
-        cursor = self.db.conn.cursor()
-        cursor.execute('''
-        SELECT * FROM applications 
-        WHERE date_applied >= ? 
-        ORDER BY date_applied DESC
-        ''', (week_ago.strftime('%Y-%m-%d'),))
-        weeks_apps = cursor.fetchall()
+        weeks_apps = self.db.get_applications_since(week_ago.strftime('%Y-%m-%d'))
         
         # Get statistics
         stats = self.db.get_stats_summary(7)
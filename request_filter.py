@@ -0,0 +1,150 @@
+"""
+Request interception for scraping and application pages
+
+A RequestFilter is installed on a browser context and aborts requests the bot
+never needs (images, media, fonts, trackers and ad beacons), with a separate
+allowlist per phase - "search" for result pages, "apply" for job pages and the
+Easy Apply modal. Rules live in RESOURCE_BLOCKING in config.py.
+
+TrafficMeter watches a single page and logs, per navigation, how long the page
+took to become ready, what was transferred and what was blocked.
+"""
+
+import time
+from collections import Counter
+from urllib.parse import urlparse
+from config import RESOURCE_BLOCKING
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _host_matches(host, patterns):
+    """True if host is one of patterns or a subdomain of one"""
+    return any(host == pattern or host.endswith('.' + pattern) for pattern in patterns)
+
+
+class RequestFilter:
+    def __init__(self, phase, settings=None):
+        """Build the filter for one phase
+        
+        Args:
+            phase: "search" or "apply" (selects the allowlist)
+            settings: Override RESOURCE_BLOCKING (None uses config value)
+        """
+        settings = settings or RESOURCE_BLOCKING
+        allow = settings['allow'].get(phase, {})
+        self.phase = phase
+        self.enabled = settings['enabled']
+        self.blocked_types = set(settings['blocked_types']) - set(allow.get('types', []))
+        self.blocked_hosts = settings['blocked_hosts']
+        self.allowed_hosts = allow.get('hosts', [])
+        self.blocked = Counter()
+    
+    def should_block(self, request):
+        """Decide whether a request is aborted
+        
+        Allowed hosts always load; blocked hosts never do; everything else is
+        judged by resource type. The page document itself is never blocked.
+        """
+        if request.resource_type == 'document':
+            return False
+        
+        host = urlparse(request.url).hostname or ''
+        if _host_matches(host, self.allowed_hosts):
+            return False
+        if _host_matches(host, self.blocked_hosts):
+            return True
+        return request.resource_type in self.blocked_types
+    
+    def _count(self, request):
+        self.blocked[request.resource_type] += 1
+    
+    def _route(self, route):
+        if self.should_block(route.request):
+            self._count(route.request)
+            route.abort('blockedbyclient')
+        else:
+            route.continue_()
+    
+    async def _route_async(self, route):
+        if self.should_block(route.request):
+            self._count(route.request)
+            await route.abort('blockedbyclient')
+        else:
+            await route.continue_()
+    
+    def install(self, context):
+        """Route every request of a sync API context through the filter"""
+        if self.enabled:
+            context.route("**/*", self._route)
+        return self
+    
+    async def install_async(self, context):
+        """Route every request of an async API context through the filter"""
+        if self.enabled:
+            await context.route("**/*", self._route_async)
+        return self
+    
+    def log_summary(self):
+        """Log how many requests were blocked over the filter's lifetime"""
+        if self.blocked:
+            breakdown = ", ".join(f"{kind} {count}" for kind, count in self.blocked.most_common())
+            logger.info(f"Blocked {sum(self.blocked.values())} {self.phase} requests ({breakdown})")
+
+
+class TrafficMeter:
+    """Per-navigation load time and traffic for one page
+    
+    Transferred bytes come from Content-Length headers, so compressed or
+    chunked responses without one are counted as requests but not bytes.
+    Aborted requests never reach the network, so only their count is known.
+    """
+    
+    def __init__(self, page):
+        self.page = page
+        self._reset(None)
+        page.on("response", self._on_response)
+        page.on("requestfailed", self._on_failed)
+    
+    def _reset(self, url):
+        self.url = url
+        self.started = time.monotonic()
+        self.responses = 0
+        self.bytes = 0
+        self.blocked = Counter()
+    
+    def _on_response(self, response):
+        self.responses += 1
+        try:
+            self.bytes += int(response.headers.get('content-length', 0))
+        except ValueError:
+            pass
+    
+    def _on_failed(self, request):
+        if 'BLOCKED_BY_CLIENT' in (request.failure or ''):
+            self.blocked[request.resource_type] += 1
+    
+    def begin(self, url):
+        """Start timing a navigation to url"""
+        self._reset(url)
+    
+    def report(self):
+        """Log the navigation started by begin()
+        
+        Returns:
+            dict: url, seconds, responses, bytes and blocked request count
+        """
+        stats = {
+            'url': self.url,
+            'seconds': time.monotonic() - self.started,
+            'responses': self.responses,
+            'bytes': self.bytes,
+            'blocked': sum(self.blocked.values())
+        }
+        breakdown = ", ".join(f"{kind} {count}" for kind, count in self.blocked.most_common())
+        logger.info(
+            f"Loaded {self.url} in {stats['seconds']:.2f}s: {stats['responses']} responses, "
+            f"{stats['bytes'] / 1024:.0f} KB, {stats['blocked']} blocked" + (f" ({breakdown})" if breakdown else "")
+        )
+        return stats
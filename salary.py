@@ -0,0 +1,184 @@
+"""
+Salary parsing: advertised pay text -> numeric annual range
+
+LinkedIn shows pay as free text ("KES 100K/yr - 150K/yr", "$45/hr",
+"€50,000 - €60,000 a year", "Not specified"). parse_salary() reads the
+currency, the pay period and the amounts (thousands separators, K/M suffixes,
+ranges) and scales the amounts to a year with
+SALARY_SETTINGS["periods_per_year"], so hourly and yearly postings compare
+directly. Amounts are not converted between currencies.
+
+Only the pay itself is read: the first amount next to a currency marker (or
+the first amount, if none is marked) and the amount closing its range. Text
+after a "·" separator, like "401k, +1 benefit", is ignored.
+
+The parsed values are stored in applications.salary_min/salary_max/currency/
+period when a job is saved (indexed for range queries); backfill() re-parses
+rows saved earlier.
+"""
+
+import re
+from config import SALARY_SETTINGS
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Checked in order, so longer symbols win over "$"
+CURRENCY_SYMBOLS = [
+    ("KSh", "KES"), ("CA$", "CAD"), ("A$", "AUD"), ("US$", "USD"),
+    ("$", "USD"), ("€", "EUR"), ("£", "GBP"), ("₹", "INR"), ("₦", "NGN"), ("¥", "JPY"),
+]
+CURRENCY_CODES = {
+    "KES", "UGX", "TZS", "RWF", "ETB", "NGN", "GHS", "ZAR", "EGP", "MAD",
+    "USD", "CAD", "EUR", "GBP", "CHF", "AUD", "NZD", "INR", "AED", "SGD", "JPY", "CNY",
+}
+CURRENCY_CODE = re.compile(r"\b([A-Z]{3})\b")
+
+PERIOD_PATTERNS = [
+    ("hour", r"/\s*h(?:ou)?r\b|\bper\s+hour\b|\ban\s+hour\b|\bhourly\b"),
+    ("day", r"/\s*day\b|\bper\s+day\b|\ba\s+day\b|\bdaily\b"),
+    ("week", r"/\s*w(?:ee)?k\b|\bper\s+week\b|\ba\s+week\b|\bweekly\b"),
+    ("month", r"/\s*mo(?:nth)?\b|\bper\s+month\b|\ba\s+month\b|\bmonthly\b"),
+    ("year", r"/\s*y(?:ea)?r\b|\bper\s+(?:year|annum)\b|\ba\s+year\b|\bannual(?:ly)?\b|\byearly\b|\bp\.?a\.?(?!\w)"),
+]
+PERIODS = [(period, re.compile(pattern, re.IGNORECASE)) for period, pattern in PERIOD_PATTERNS]
+
+# A number with optional separators and K/M suffix ("150K", "1.2M", "120,000.00")
+AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*([kKmM])?(?![A-Za-z])")
+MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+
+# Currency symbol or code right before ("$100K", "KES 100K") or code right after ("100,000 KES")
+MARKED_BEFORE = re.compile(
+    r"(?:" + "|".join(re.escape(symbol) for symbol, _ in CURRENCY_SYMBOLS) + r"|\b[A-Z]{3})\s*$"
+)
+MARKED_AFTER = re.compile(r"^\s*[A-Z]{3}\b")
+# What may sit between the two ends of a range: "/yr - $", " to ", " – KES "
+RANGE_GAP = re.compile(
+    r"^\s*(?:/\s*[a-z]+\.?\s*)?(?:-|–|—|to)\s*(?:[A-Z]{0,2}\$|[^\w\s]{1,3}|[A-Z]{3})?\s*$",
+    re.IGNORECASE
+)
+# LinkedIn appends benefits after a middle dot ("$100K/yr · 401k, +1 benefit")
+EXTRAS = re.compile(r"[·•|]")
+
+
+def _currency(text):
+    for symbol, code in CURRENCY_SYMBOLS:
+        if symbol in text:
+            return code
+    for code in CURRENCY_CODE.findall(text.upper()):
+        if code in CURRENCY_CODES:
+            return code
+    return None
+
+
+def _period(text):
+    for period, pattern in PERIODS:
+        if pattern.search(text):
+            return period
+    return None
+
+
+def _value(match):
+    number, suffix = match.groups()
+    try:
+        value = float(number.replace(",", ""))
+    except ValueError:
+        return None
+    value *= MULTIPLIERS.get(suffix.lower(), 1) if suffix else 1
+    return value if value > 0 else None
+
+
+def _is_marked(text, match):
+    before = MARKED_BEFORE.search(text[:match.start()])
+    if before and _currency(before.group(0)):
+        return True
+    after = MARKED_AFTER.match(text[match.end():])
+    return bool(after) and _currency(after.group(0)) is not None
+
+
+def _pay_text(text):
+    """The part of a salary string that states the pay (benefits cut off)"""
+    return EXTRAS.split(text, 1)[0]
+
+
+def _joined(text, matches, i):
+    """True if matches[i] and matches[i + 1] are the two ends of a range"""
+    return i + 1 < len(matches) and RANGE_GAP.match(text[matches[i].end():matches[i + 1].start()]) is not None
+
+
+def _amounts(text):
+    """The pay amounts: the first marked amount (else the first) and its range end"""
+    matches = [match for match in AMOUNT.finditer(text) if _value(match) is not None]
+    if not matches:
+        return []
+    
+    start = next((i for i, match in enumerate(matches) if _is_marked(text, match)), 0)
+    if start > 0 and _joined(text, matches, start - 1):
+        start -= 1  # Marked at the end only: "100,000 - 120,000 KES"
+    amounts = [_value(matches[start])]
+    if _joined(text, matches, start):
+        amounts.append(_value(matches[start + 1]))
+    return amounts
+
+
+def parse_salary(text, settings=None):
+    """Parse advertised pay into an annual range
+    
+    Args:
+        text: Salary text as scraped ("KES 100K/yr - 150K/yr", "Not specified", None)
+        settings: Override SALARY_SETTINGS (None uses config value)
+    
+    Returns:
+        dict: 'min' and 'max' (per year), 'currency' (ISO code or None) and
+            'period' the pay was stated in, or None when the text has no amount
+    """
+    if not text:
+        return None
+    text = _pay_text(text)
+    amounts = _amounts(text)
+    if not amounts:
+        return None
+    
+    settings = settings or SALARY_SETTINGS
+    period = _period(text) or settings['default_period']
+    factor = settings['periods_per_year'].get(period, 1)
+    return {
+        'min': round(min(amounts) * factor, 2),
+        'max': round(max(amounts) * factor, 2),
+        'currency': _currency(text),
+        'period': period,
+    }
+
+
+def salary_columns(text, settings=None):
+    """(salary_min, salary_max, currency, period) for the applications table"""
+    parsed = parse_salary(text, settings)
+    if parsed is None:
+        return (None, None, None, None)
+    return (parsed['min'], parsed['max'], parsed['currency'], parsed['period'])
+
+
+def backfill(db, batch_size=500):
+    """Re-parse salary_range for every stored application
+    
+    Args:
+        db: ApplicationDatabase
+        batch_size: Rows read and updated per transaction
+    
+    Returns:
+        int: Applications with a parsed salary
+    """
+    checked = parsed = 0
+    batch = []
+    for row in db.iter_salary_rows(batch_size):
+        columns = salary_columns(row['salary_range'])
+        checked += 1
+        parsed += columns[0] is not None
+        batch.append(columns + (row['id'],))
+        if len(batch) >= batch_size:
+            db.update_salaries(batch)
+            batch = []
+    if batch:
+        db.update_salaries(batch)
+    logger.info(f"Salary backfill: parsed {parsed} of {checked} applications")
+    return parsed
@@ -0,0 +1,151 @@
+"""
+Pre-apply job scoring
+
+Scores a batch of scraped jobs against JOB_CRITERIA in one vectorized pass
+(pandas/NumPy), so browser time goes to the best matches first. Each
+component is in [0, 1] and the total is their weighted mean
+(SCORING_SETTINGS["weights"]):
+
+- keyword: share of a search keyword's words found in the title (best keyword)
+- salary: how the advertised annual pay compares to salary_range (unknown = neutral)
+- location: position of the first matching entry in JOB_CRITERIA["locations"]
+- recency: halves every recency_half_life_days since the posting date
+- experience: seniority read from the title is one of experience_level
+
+With require_keyword set, a title sharing no word with any keyword is dropped
+whatever its other components score: location, salary and seniority alone
+would otherwise carry an unrelated job past min_score.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from config import JOB_CRITERIA, SALARY_SETTINGS, SCORING_SETTINGS
+from logger import get_logger
+from salary import parse_salary
+
+logger = get_logger(__name__)
+
+COMPONENTS = ["keyword", "salary", "location", "recency", "experience"]
+SENIOR_PATTERN = r"\b(?:senior|sr\.?|lead|principal|staff|head)\b"
+ENTRY_PATTERN = r"\b(?:junior|jr\.?|entry|graduate|intern|internship|trainee|apprentice)\b"
+
+
+class JobScorer:
+    def __init__(self, criteria=None, settings=None):
+        """Initialize the scorer
+        
+        Args:
+            criteria: Override JOB_CRITERIA (None uses config value)
+            settings: Override SCORING_SETTINGS (None uses config value)
+        """
+        self.criteria = criteria or JOB_CRITERIA
+        settings = settings or SCORING_SETTINGS
+        self.enabled = settings['enabled']
+        self.min_score = settings['min_score']
+        self.require_keyword = settings['require_keyword']
+        self.weights = pd.Series(settings['weights']).reindex(COMPONENTS).fillna(0.0)
+        self.half_life = settings['recency_half_life_days']
+        self.unknown = settings['unknown_score']
+    
+    def _keyword_scores(self, titles):
+        """Best share of any keyword's words present in each title"""
+        best = np.zeros(len(titles))
+        for keyword in self.criteria['keywords']:
+            words = re.findall(r"\w+", keyword.lower())
+            if not words:
+                continue
+            hits = sum(titles.str.contains(rf"\b{re.escape(word)}", regex=True).to_numpy(dtype=float) for word in words)
+            best = np.maximum(best, hits / len(words))
+        return best
+    
+    def _salary_scores(self, salaries):
+        """1 inside salary_range, falling off linearly below its minimum (annual pay)"""
+        currency = SALARY_SETTINGS['currency']
+        parsed = [parse_salary(text) for text in salaries]
+        top = np.array([
+            p['max'] if p and (not currency or p['currency'] in (None, currency)) else np.nan
+            for p in parsed
+        ], dtype=float)
+        
+        low = self.criteria['salary_range']['min']
+        scores = np.clip(top / low, 0, 1) if low else np.ones(len(salaries))
+        return np.where(np.isnan(top), self.unknown, scores)
+    
+    def _location_scores(self, locations):
+        """Earlier entries in JOB_CRITERIA['locations'] score higher"""
+        preferred = self.criteria['locations']
+        scores = np.zeros(len(locations))
+        for rank, place in reversed(list(enumerate(preferred))):
+            match = locations.str.contains(re.escape(place.lower()), regex=True).to_numpy()
+            scores = np.where(match, 1 - rank / len(preferred), scores)
+        return scores
+    
+    def _recency_scores(self, dates, now):
+        posted = pd.to_datetime(dates, errors='coerce')
+        age_days = (pd.Timestamp(now) - posted).dt.total_seconds().to_numpy() / 86400
+        scores = np.power(0.5, np.clip(age_days, 0, None) / self.half_life)
+        return np.where(np.isnan(scores), self.unknown, scores)
+    
+    def _experience_scores(self, titles):
+        levels = np.select(
+            [titles.str.contains(SENIOR_PATTERN, regex=True), titles.str.contains(ENTRY_PATTERN, regex=True)],
+            ["Senior Level", "Entry Level"],
+            default="Mid Level"
+        )
+        return np.isin(levels, self.criteria['experience_level']).astype(float)
+    
+    def score(self, jobs, now=None):
+        """Score jobs against the criteria
+        
+        Returns:
+            DataFrame: One row per job (same order) with a column per
+                component plus the weighted 'score'
+        """
+        frame = pd.DataFrame(jobs, columns=['title', 'location', 'salary', 'date']).fillna("")
+        titles = frame['title'].str.lower()
+        
+        scores = pd.DataFrame({
+            'keyword': self._keyword_scores(titles),
+            'salary': self._salary_scores(frame['salary']),
+            'location': self._location_scores(frame['location'].str.lower()),
+            'recency': self._recency_scores(frame['date'], now or datetime.now()),
+            'experience': self._experience_scores(titles),
+        })
+        total = self.weights.sum() or 1.0
+        scores['score'] = scores[COMPONENTS].to_numpy() @ self.weights.to_numpy() / total
+        return scores
+    
+    def rank(self, jobs, top_n=None, min_score=None):
+        """Best jobs first, each annotated with job['score']
+        
+        Args:
+            jobs: Job dicts
+            top_n: Keep at most this many (None keeps all that pass)
+            min_score: Drop jobs scoring below this (None uses config value)
+        
+        Returns:
+            list: Jobs at or above min_score (and matching a keyword, with
+                require_keyword), highest score first
+        """
+        if not jobs:
+            return []
+        if not self.enabled:
+            return list(jobs)[:top_n]
+        
+        min_score = self.min_score if min_score is None else min_score
+        components = self.score(jobs)
+        scores = components['score'].to_numpy()
+        for job, score in zip(jobs, scores):
+            job['score'] = round(float(score), 3)
+        
+        eligible = scores >= min_score
+        if self.require_keyword:
+            eligible &= components['keyword'].to_numpy() > 0
+        order = np.argsort(-scores, kind='stable')
+        ranked = [jobs[i] for i in order if eligible[i]]
+        skipped = len(jobs) - len(ranked)
+        if skipped:
+            logger.info(f"Scoring: {skipped} of {len(jobs)} jobs below the minimum score {min_score} or matching no keyword")
+        return ranked[:top_n]
@@ -0,0 +1,72 @@
+"""
+Durable queue of search units for a scrape run
+
+Every keyword/location pair is a unit stored in the scrape_units table with
+its status and, once searched, its jobs. Results survive a crash or a killed
+process: the next scrape resumes the unfinished run and only searches the
+units that are not done yet. Failed units are retried up to max_attempts
+times; units that succeeded are never searched twice.
+"""
+
+from config import RETRY_SETTINGS, SCRAPER_SETTINGS
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ScrapeQueue:
+    def __init__(self, db, units, max_attempts=None):
+        """Resume the latest unfinished run or start a new one
+        
+        Args:
+            db: ApplicationDatabase holding the queue tables
+            units: (keyword, location) pairs making up the search grid
+            max_attempts: Tries per unit before it is given up (None uses RETRY_SETTINGS)
+        """
+        self.db = db
+        self.max_attempts = max_attempts or RETRY_SETTINGS['max_attempts']
+        self.run_id, resumed = db.start_scrape_run(units, SCRAPER_SETTINGS['resume_max_age_hours'])
+        
+        counts = self.counts()
+        if resumed:
+            logger.info(f"Resuming scrape run {self.run_id}: {counts.get('done', 0)} of "
+                        f"{sum(counts.values())} searches already done")
+        else:
+            logger.info(f"Started scrape run {self.run_id} with {sum(counts.values())} searches")
+    
+    def counts(self):
+        """Units per status"""
+        counts = {}
+        for unit in self.db.get_scrape_units(self.run_id):
+            counts[unit['status']] = counts.get(unit['status'], 0) + 1
+        return counts
+    
+    def pending(self):
+        """Units still to search: never tried, interrupted, or failed with attempts left"""
+        return [
+            (unit['keyword'], unit['location'])
+            for unit in self.db.get_scrape_units(self.run_id)
+            if unit['status'] != 'done' and unit['attempts'] < self.max_attempts
+        ]
+    
+    def start(self, keyword, location):
+        self.db.mark_scrape_unit(self.run_id, keyword, location, 'running')
+    
+    def complete(self, keyword, location, jobs):
+        self.db.mark_scrape_unit(self.run_id, keyword, location, 'done', jobs=jobs)
+    
+    def fail(self, keyword, location, error):
+        logger.warning(f"Search failed for {keyword} in {location}: {error}")
+        self.db.mark_scrape_unit(self.run_id, keyword, location, 'failed', error=str(error))
+    
+    def results(self):
+        """Jobs from every completed unit of the run, including earlier sessions"""
+        return self.db.get_scrape_results(self.run_id)
+    
+    def finish(self):
+        """Close the run once nothing is left to retry"""
+        counts = self.counts()
+        failed = counts.get('failed', 0)
+        if failed:
+            logger.warning(f"Scrape run {self.run_id} finished with {failed} failed searches")
+        self.db.finish_scrape_run(self.run_id)
@@ -1,73 +1,196 @@
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 import time
-import random
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlparse
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from config import JOB_CRITERIA, LINKEDIN_CREDENTIALS, RETRY_SETTINGS, BROWSER_SETTINGS, SESSIONS_DIR
+from config import JOB_CRITERIA, LINKEDIN_CREDENTIALS, RETRY_SETTINGS, BROWSER_SETTINGS, SESSIONS_DIR, SCRAPER_SETTINGS
 from database import ApplicationDatabase
+from seen_index import SeenUrlIndex
+from scrape_queue import ScrapeQueue
+from search_cache import SearchCache
+from dedupe import DuplicateDetector
+from request_filter import RequestFilter, TrafficMeter
+from waits import Waiter
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+_viewport_width, _viewport_height = (int(n) for n in BROWSER_SETTINGS['viewport'].lower().split('x'))
+
+# Browser context options shared by the sync and async backends
+CONTEXT_OPTIONS = {
+    'viewport': {'width': _viewport_width, 'height': _viewport_height},
+    'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+CARD_SELECTOR = ".job-search-card"
+RESULTS_PER_PAGE = 25  # LinkedIn's page size for the start= offset
+SHOW_MORE_SELECTOR = "button.infinite-scroller__show-more-button"
+
+# Card count and result links in one round-trip, for the scroll loader
+SCAN_CARDS_JS = """
+selector => {
+    const cards = document.querySelectorAll(selector);
+    return {
+        count: cards.length,
+        hrefs: Array.from(cards, card => {
+            const link = card.querySelector('a.base-card__full-link');
+            return link ? link.getAttribute('href') : null;
+        })
+    };
+}
+"""
+
+# Pulls every field of every result card in a single browser round-trip
+EXTRACT_CARDS_JS = """
+cards => cards.map(card => {
+    const text = selector => {
+        const el = card.querySelector(selector);
+        return el ? el.innerText.trim() : null;
+    };
+    const link = card.querySelector('a.base-card__full-link');
+    const time = card.querySelector('time');
+    return {
+        title: text('.base-search-card__title'),
+        company: text('.base-search-card__subtitle'),
+        location: text('.job-search-card__location'),
+        href: link ? link.getAttribute('href') : null,
+        date: time ? time.getAttribute('datetime') : null,
+        salary: text('.job-search-card__salary-info')
+    };
+})
+"""
+
+
+def read_session(session_file, max_age_days=7):
+    """Read a saved browser session if it exists and is recent
+    
+    Args:
+        session_file: Path written by JobScraper._write_session
+        max_age_days: Sessions older than this are ignored
+    
+    Returns:
+        dict: Session data ('cookies', 'storage', 'timestamp'), or None if
+        missing, stale or unreadable
+    """
+    if not session_file.exists():
+        logger.debug("No saved session found")
+        return None
+    
+    try:
+        with open(session_file, 'r') as f:
+            session_data = json.load(f)
+        
+        # Check if session is recent (less than 7 days old)
+        session_time = datetime.fromisoformat(session_data['timestamp'])
+        age_days = (datetime.now() - session_time).days
+        
+        if age_days > max_age_days:
+            logger.info("Saved session is too old, will login again")
+            return None
+        
+        logger.info(f"Loaded session from {age_days} days ago")
+        return session_data
+    
+    except Exception as e:
+        logger.warning(f"Failed to load session: {e}")
+        return None
+
+
+class HostThrottle:
+    """Per-host politeness: spaces out navigations to the same host
+    
+    Slots are reserved up front so callers (sync or async) only need to
+    sleep for the returned delay.
+    """
+    
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._next_slot = {}
+        self._lock = threading.Lock()
+    
+    def reserve(self, url):
+        """Reserve the next navigation slot for url's host
+        
+        Returns:
+            float: Seconds to wait before navigating
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        return slot - now
+    
+    def wait(self, url):
+        """Block until a navigation to url's host is allowed"""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+
 class JobScraper:
-    def __init__(self, headless=None):
+    def __init__(self, headless=None, use_cache=True):
         """Initialize job scraper with session management
         
         Args:
             headless: Override config headless setting (None uses config value)
+            use_cache: Serve searches from the result cache when fresh (results are cached either way)
         """
         self.headless = headless if headless is not None else BROWSER_SETTINGS['headless']
         self.db = ApplicationDatabase()
         self.credentials = LINKEDIN_CREDENTIALS
         self.session_file = SESSIONS_DIR / "linkedin_session.json"
-        logger.info(f"JobScraper initialized (headless={self.headless})")
+        self.concurrency = max(1, SCRAPER_SETTINGS['concurrency'])
+        self.throttle = HostThrottle(SCRAPER_SETTINGS['host_min_interval'])
+        self.seen = None  # Known job URLs, loaded when a scrape starts
+        self.max_jobs = max(1, SCRAPER_SETTINGS['max_jobs_per_search'])
+        self.cache = SearchCache(self.db)
+        self.use_cache = use_cache
+        self.dedupe = DuplicateDetector(self.db)
+        self.request_filter = RequestFilter("search")
+        self.waits = Waiter()
+        logger.info(f"JobScraper initialized (headless={self.headless}, concurrency={self.concurrency})")
     
-    def _human_delay(self, min_seconds=1, max_seconds=3):
-        """Random delay to mimic human behavior"""
-        delay = random.uniform(min_seconds, max_seconds)
-        time.sleep(delay)
+    def _human_delay(self, min_seconds=1, max_seconds=3, step="human"):
+        """Random delay to mimic human behavior (the politeness floor when waits are adaptive)"""
+        self.waits.pause(step, min_seconds, max_seconds)
     
     def _save_session(self, context):
         """Save browser session (cookies) for reuse"""
         try:
-            cookies = context.cookies()
-            storage = context.storage_state()
-            session_data = {
-                'cookies': cookies,
-                'storage': storage,
-                'timestamp': datetime.now().isoformat()
-            }
-            with open(self.session_file, 'w') as f:
-                json.dump(session_data, f)
-            logger.info("Browser session saved successfully")
+            self._write_session(context.cookies(), context.storage_state())
         except Exception as e:
             logger.warning(f"Failed to save session: {e}")
     
+    def _write_session(self, cookies, storage):
+        """Persist cookies and storage state to the session file"""
+        session_data = {
+            'cookies': cookies,
+            'storage': storage,
+            'timestamp': datetime.now().isoformat()
+        }
+        with open(self.session_file, 'w') as f:
+            json.dump(session_data, f)
+        logger.info("Browser session saved successfully")
+    
+    def _read_session(self):
+        """Read the saved session if it exists and is recent"""
+        return read_session(self.session_file)
+    
     def _load_session(self, context):
         """Load saved browser session if available"""
-        if not self.session_file.exists():
-            logger.debug("No saved session found")
+        session_data = self._read_session()
+        if not session_data:
             return False
         
         try:
-            with open(self.session_file, 'r') as f:
-                session_data = json.load(f)
-            
-            # Check if session is recent (less than 7 days old)
-            session_time = datetime.fromisoformat(session_data['timestamp'])
-            age_days = (datetime.now() - session_time).days
-            
-            if age_days > 7:
-                logger.info("Saved session is too old, will login again")
-                return False
-            
             # Add cookies to context
             context.add_cookies(session_data['cookies'])
-            logger.info(f"Loaded session from {age_days} days ago")
             return True
-            
         except Exception as e:
             logger.warning(f"Failed to load session: {e}")
             return False
@@ -83,15 +206,46 @@ class JobScraper:
         reraise=True
     )
     def scrape_linkedin_jobs(self):
-        """Scrape job listings from LinkedIn with retry logic"""
-        jobs_found = []
+        """Scrape job listings from LinkedIn with retry logic
+        
+        Collects everything iter_linkedin_jobs() yields into one list.
+        """
+        jobs = [job for batch in self.iter_linkedin_jobs() for job in batch]
+        print(f"\n✓ Total unique jobs after filtering: {len(jobs)}")
+        return jobs
+    
+    def iter_linkedin_jobs(self):
+        """Scrape LinkedIn, yielding each search's new jobs as soon as it completes
+        
+        Searches run off a durable ScrapeQueue: each finished search is saved
+        as it completes, failed searches are retried on their own, and a run
+        that crashes or is killed resumes where it stopped next time. Searches
+        already answered (from the cache or before a crash) are yielded first.
         
+        Yields:
+            list: Filtered jobs not yielded before in this run, one list per search
+        """
         if not self.credentials['email'] or not self.credentials['password']:
             logger.error("LinkedIn credentials not found in .env file")
             logger.info("Please add LINKEDIN_EMAIL and LINKEDIN_PASSWORD to your .env file")
-            return []
+            return
         
         logger.info("Starting LinkedIn job scraping...")
+        self._load_seen_index()
+        seen_urls = set()
+        
+        queue = ScrapeQueue(self.db, self._search_units())
+        self._serve_from_cache(queue)
+        
+        # Searches finished before an earlier crash or served from the cache
+        answered = self._filter_jobs(queue.results(), seen_urls)
+        if answered:
+            yield answered
+        
+        if not queue.pending():
+            print("\n⚡ Every search was answered from the result cache")
+            queue.finish()
+            return
         
         with sync_playwright() as p:
             try:
@@ -99,10 +253,8 @@ class JobScraper:
                     headless=self.headless,
                     slow_mo=BROWSER_SETTINGS['slow_mo']
                 )
-                context = browser.new_context(
-                    viewport={'width': 2560, 'height': 1600},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
+                context = browser.new_context(**CONTEXT_OPTIONS)
+                self.request_filter.install(context)
                 page = context.new_page()
                 
                 # Try to load existing session
@@ -113,33 +265,100 @@ class JobScraper:
                 if not self._linkedin_login(page, skip_login=session_loaded):
                     logger.error("Login failed")
                     browser.close()
-                    return []
+                    return
                 
                 # Save session for future use
                 self._save_session(context)
                 
                 logger.info("✓ Login successful")
                 
-                # Search for each keyword
-                for keyword in JOB_CRITERIA['keywords']:
-                    for location in JOB_CRITERIA['locations']:
-                        print(f"\n🔍 Searching: {keyword} in {location}")
-                        jobs = self._search_keyword(page, keyword, location)
-                        jobs_found.extend(jobs)
-                        print(f"   Found {len(jobs)} jobs")
-                        time.sleep(2)  # Be polite between searches
+                # Search every remaining keyword/location pair, `concurrency` pages at a time
+                tabs = min(self.concurrency, len(queue.pending()))
+                pages = [page] + [context.new_page() for _ in range(tabs - 1)]
+                meters = {search_page: TrafficMeter(search_page) for search_page in pages}
+                for jobs in self._run_queue(queue, context, pages, meters):
+                    jobs = self._filter_jobs(jobs, seen_urls)
+                    if jobs:
+                        yield jobs
                 
-                # Filter and deduplicate
-                filtered_jobs = self._filter_jobs(jobs_found)
-                print(f"\n✓ Total unique jobs after filtering: {len(filtered_jobs)}")
+                self.request_filter.log_summary()
+                self.waits.log_summary()
                 
                 browser.close()
-                
+            
             except Exception as e:
                 print(f"❌ Error during scraping: {e}")
-                return []
+                print("   Searches finished so far are kept; the next scrape resumes the rest")
+    
+    def _retry_delay(self, attempt):
+        """Backoff before retry round `attempt` (1-based)"""
+        return min(
+            RETRY_SETTINGS['wait_max'],
+            RETRY_SETTINGS['wait_min'] * RETRY_SETTINGS['exponential_base'] ** (attempt - 1)
+        )
+    
+    def _search_filters(self):
+        """Settings besides keyword/location that change what a search returns"""
+        return {
+            'max_jobs_per_search': self.max_jobs,
+            'pages_per_search': SCRAPER_SETTINGS['pages_per_search']
+        }
+    
+    def _serve_from_cache(self, queue):
+        """Complete pending searches whose results are still cached"""
+        if not (self.use_cache and self.cache.enabled):
+            return
+        
+        filters = self._search_filters()
+        hits = 0
+        for keyword, location in queue.pending():
+            cached = self.cache.get(keyword, location, filters)
+            if cached is None:
+                continue
+            # Jobs saved since the search ran are no longer new
+            queue.complete(keyword, location, [job for job in cached if not self._is_known(job['url'])])
+            hits += 1
+        
+        if hits:
+            logger.info(f"⚡ {hits} searches answered from the result cache")
+    
+    def _record_search(self, queue, keyword, location, jobs):
+        """Persist one search's outcome (jobs, or the exception it failed with)"""
+        if isinstance(jobs, Exception):
+            queue.fail(keyword, location, jobs)
+            return
+        print(f"\n🔍 Searching: {keyword} in {location}")
+        print(f"   Found {len(jobs)} jobs")
+        queue.complete(keyword, location, jobs)
+        self.cache.put(keyword, location, self._search_filters(), jobs)
+    
+    def _run_queue(self, queue, context, pages, meters):
+        """Search every pending unit, then retry failed ones in later rounds
+        
+        Yields:
+            list: Jobs of each search as soon as it completes
+        """
+        for attempt in range(queue.max_attempts):
+            searches = queue.pending()
+            if not searches:
+                break
+            if attempt:
+                delay = self._retry_delay(attempt)
+                logger.info(f"Retrying {len(searches)} failed searches in {delay:.0f}s")
+                time.sleep(delay)
+            
+            for start in range(0, len(searches), len(pages)):
+                batch = searches[start:start + len(pages)]
+                for keyword, location in batch:
+                    queue.start(keyword, location)
+                for (keyword, location), jobs in self._search_batch(pages, batch, meters):
+                    if not isinstance(jobs, Exception):
+                        jobs = self._search_more_pages(context, keyword, location, jobs)
+                    self._record_search(queue, keyword, location, jobs)
+                    if not isinstance(jobs, Exception):
+                        yield jobs
         
-        return filtered_jobs
+        queue.finish()
     
     
     def _linkedin_login(self, page, skip_login=False):
@@ -157,7 +376,7 @@ class JobScraper:
                 # Try to verify session is still valid
                 logger.info("   → Verifying saved session...")
                 page.goto("https://www.linkedin.com/feed/", timeout=BROWSER_SETTINGS['timeout'])
-                self._human_delay(2, 3)
+                self.waits.for_load(page, "session_check")
                 
                 # Check if we're logged in
                 try:
@@ -170,24 +389,24 @@ class JobScraper:
             # Perform full login
             logger.info("   → Navigating to LinkedIn login page...")
             page.goto("https://www.linkedin.com/login", timeout=BROWSER_SETTINGS['timeout'])
-            self._human_delay()
+            self.waits.for_selector(page, "login_form", "#username")
             
             # Fill credentials
             logger.info("   → Filling credentials...")
             page.fill("#username", self.credentials['email'])
-            self._human_delay(0.5, 1.5)
+            self._human_delay(0.5, 1.5, step="typing")
             page.fill("#password", self.credentials['password'])
             
             logger.info("   → Submitting login form...")
             page.click("button[type='submit']")
-            self._human_delay(2, 4)
+            self.waits.for_load(page, "login_submit")
             
             # Wait for login to complete
             logger.info("   → Waiting for login to complete...")
             try:
                 page.wait_for_selector("nav.global-nav", timeout=15000)
                 logger.info("   ✓ Login successful!")
-                self._human_delay()
+                self._human_delay(step="after_login")
                 return True
             except PlaywrightTimeoutError:
                 # Check current URL for clues
@@ -231,57 +450,332 @@ class JobScraper:
                     logger.error("   ❌ Login failed - no navigation detected")
                 
                 return False
-                
+        
         except Exception as e:
             logger.error(f"   ❌ Login error: {e}", exc_info=True)
             return False
-
     
-    def _search_keyword(self, page, keyword, location):
-        """Search for jobs with specific keyword and location"""
-        jobs = []
+    
+    def _search_units(self):
+        """All (keyword, location) pairs to search, in config order"""
+        return [
+            (keyword, location)
+            for keyword in JOB_CRITERIA['keywords']
+            for location in JOB_CRITERIA['locations']
+        ]
+    
+    def _build_search_url(self, keyword, location, start=0):
+        """Build the LinkedIn search URL for a keyword/location pair
+        
+        Args:
+            start: Result offset (multiples of RESULTS_PER_PAGE for later pages)
+        """
+        # Removed restrictive filters
+        url = (
+            f"https://www.linkedin.com/jobs/search/?"
+            f"keywords={keyword.replace(' ', '%20')}&"
+            f"location={location.replace(' ', '%20')}"
+        )
+        return f"{url}&start={start}" if start else url
+    
+    def _search_batch(self, pages, searches, meters=None):
+        """Run several searches side by side, one page per search
+        
+        Navigations are started on every page first (returning as soon as the
+        response commits) so the loads overlap, then results are scrolled and
+        extracted page by page.
+        
+        Args:
+            pages: Pages from the shared logged-in context
+            searches: (keyword, location) pairs, at most one per page
+            meters: Optional page -> TrafficMeter map for load instrumentation
+        
+        Returns:
+            list: ((keyword, location), jobs) tuples in search order; jobs is
+                the exception instead if the search failed
+        """
+        meters = meters or {}
+        if len(searches) == 1:
+            keyword, location = searches[0]
+            return [(searches[0], self._search_keyword(pages[0], keyword, location, meters.get(pages[0])))]
+        
+        units = [(keyword, location, 0) for keyword, location in searches]
+        return list(zip(searches, self._load_result_pages(pages, units, meters)))
+    
+    def _load_result_pages(self, pages, units, meters=None):
+        """Load, scroll and extract one result page per tab, side by side
+        
+        Args:
+            pages: Tabs from the shared logged-in context
+            units: (keyword, location, start) per tab
+            meters: Optional page -> TrafficMeter map for load instrumentation
+        
+        Returns:
+            list: New jobs per unit, in order (the exception for a unit that failed)
+        """
+        meters = meters or {}
+        errors = {}
+        for page, (keyword, location, start) in zip(pages, units):
+            try:
+                search_url = self._build_search_url(keyword, location, start)
+                self.throttle.wait(search_url)
+                if page in meters:
+                    meters[page].begin(search_url)
+                page.goto(search_url, timeout=30000, wait_until="commit")
+            except Exception as e:
+                print(f"   Search error: {e}")
+                errors[page] = e
+        
+        ready = [
+            page not in errors and self._wait_for_results(page, keyword, location, quiet=start > 0)
+            for page, (keyword, location, start) in zip(pages, units)
+        ]
+        for page, ok in zip(pages, ready):
+            if ok and page in meters:
+                meters[page].report()
+        
+        # Scroll all pages in lockstep so the lazy-load waits overlap too
+        self._load_results([page for page, ok in zip(pages, ready) if ok])
+        
+        results = []
+        for page, ok in zip(pages, ready):
+            if page in errors:
+                results.append(errors[page])
+                continue
+            try:
+                results.append(self._extract_jobs(page) if ok else [])
+            except Exception as e:
+                print(f"   Extraction error: {e}")
+                results.append(e)
+        return results
+    
+    def _more_pages_needed(self, jobs):
+        """A search goes deeper only if its last page had new jobs but not enough"""
+        return SCRAPER_SETTINGS['pages_per_search'] > 1 and 0 < len(jobs) < self.max_jobs
+    
+    def _merge_page_jobs(self, jobs, page_jobs):
+        """Add a later page's jobs to a search's results
+        
+        Returns:
+            bool: True if the search should stop (page had nothing new, or the cap is reached)
+        """
+        urls = {job['url'] for job in jobs}
+        fresh = [job for job in page_jobs if job['url'] not in urls]
+        jobs.extend(fresh[:self.max_jobs - len(jobs)])
+        return not fresh or len(jobs) >= self.max_jobs
+    
+    def _search_more_pages(self, context, keyword, location, jobs):
+        """Fetch result pages 2..K of a search in parallel tabs
+        
+        Pages are loaded `concurrency` at a time, in order, up to the
+        pages_per_search budget. The search stops at the first page with no
+        new jobs (everything there is known, or the results ran out) or once
+        max_jobs_per_search is reached.
+        
+        Args:
+            context: The logged-in browser context
+            jobs: New jobs already found on page 1
+        
+        Returns:
+            list: jobs plus any found on later pages
+        """
+        if not self._more_pages_needed(jobs):
+            return jobs
+        
+        jobs = list(jobs)
+        offsets = [n * RESULTS_PER_PAGE for n in range(1, SCRAPER_SETTINGS['pages_per_search'])]
+        tabs = [context.new_page() for _ in range(min(self.concurrency, len(offsets)))]
         
         try:
-            # Build search URL (removed restrictive filters)
-            search_url = (
-                f"https://www.linkedin.com/jobs/search/?"
-                f"keywords={keyword.replace(' ', '%20')}&"
-                f"location={location.replace(' ', '%20')}"
-            )
+            for first in range(0, len(offsets), len(tabs)):
+                wave = offsets[first:first + len(tabs)]
+                units = [(keyword, location, start) for start in wave]
+                for page_jobs in self._load_result_pages(tabs, units):
+                    if isinstance(page_jobs, Exception) or self._merge_page_jobs(jobs, page_jobs):
+                        return jobs
+        finally:
+            for tab in tabs:
+                tab.close()
+        
+        return jobs
+    
+    def _load_seen_index(self):
+        """Load known job URLs so already-saved cards can be skipped"""
+        if SCRAPER_SETTINGS['skip_known_jobs']:
+            self.seen = SeenUrlIndex(self.db)
+            logger.info(f"Skipping {len(self.seen)} jobs already in the database")
+    
+    def _is_known(self, url):
+        return self.seen is not None and url in self.seen
+    
+    def _scan_cards(self, page):
+        """Card count and card URLs (without query) currently on the page"""
+        scan = page.evaluate(SCAN_CARDS_JS, CARD_SELECTOR)
+        return scan['count'], [href.split('?')[0] for href in scan['hrefs'] if href]
+    
+    def _saturated(self, urls):
+        """True once the page holds max_jobs new cards, or only known ones"""
+        new_urls = [url for url in urls if not self._is_known(url)]
+        return len(new_urls) >= self.max_jobs or (self.seen is not None and bool(urls) and not new_urls)
+    
+    def _scroll(self, page):
+        """Load the next chunk of results: "See more jobs" if shown, else scroll"""
+        show_more = page.query_selector(SHOW_MORE_SELECTOR)
+        if show_more and show_more.is_visible():
+            show_more.click()
+        else:
+            page.mouse.wheel(0, 10000)
+    
+    def _load_results(self, pages):
+        """Scroll result pages until each is saturated or stops growing
+        
+        A page is done once it shows max_jobs new cards (or nothing but known
+        ones), or its card count has not grown for scroll_stall_rounds scrolls
+        in a row. max_scrolls bounds the whole loop.
+        
+        Args:
+            pages: Loaded search result pages, scrolled in lockstep
+        """
+        stall_rounds = max(1, SCRAPER_SETTINGS['scroll_stall_rounds'])
+        last_count = {page: 0 for page in pages}
+        stalls = {page: 0 for page in pages}
+        active = list(pages)
+        
+        for _ in range(SCRAPER_SETTINGS['max_scrolls']):
+            scrolling, counts = [], []
+            for page in active:
+                try:
+                    count, urls = self._scan_cards(page)
+                except Exception as e:
+                    logger.debug(f"Could not read result cards: {e}")
+                    continue
+                
+                stalls[page] = stalls[page] + 1 if count <= last_count[page] else 0
+                last_count[page] = count
+                if self._saturated(urls) or stalls[page] >= stall_rounds:
+                    continue
+                scrolling.append(page)
+                counts.append(count)
             
+            active = scrolling
+            if not active:
+                break
+            for page in active:
+                self._scroll(page)
+            self.waits.for_count_growth_many(active, "scroll", CARD_SELECTOR, counts)
+    
+    def _wait_for_results(self, page, keyword, location, quiet=False):
+        """Wait for the results list to render; False if nothing shows up"""
+        try:
+            page.wait_for_selector(".jobs-search__results-list", timeout=10000)
+            return True
+        except PlaywrightTimeoutError:
+            if not quiet:
+                print(f"   No results found for {keyword} in {location}")
+            return False
+    
+    def _search_keyword(self, page, keyword, location, meter=None):
+        """Search for jobs with specific keyword and location
+        
+        Returns:
+            list: New jobs, or the exception if the search failed
+        """
+        jobs = []
+        
+        try:
+            search_url = self._build_search_url(keyword, location)
+            self.throttle.wait(search_url)
+            if meter:
+                meter.begin(search_url)
             page.goto(search_url, timeout=30000)
             
             # Wait for results to load
-            try:
-                page.wait_for_selector(".jobs-search__results-list", timeout=10000)
-            except PlaywrightTimeoutError:
-                print(f"   No results found for {keyword} in {location}")
+            if not self._wait_for_results(page, keyword, location):
                 return []
+            if meter:
+                meter.report()
             
-            # Scroll to load more jobs
-            for _ in range(3):
-                page.mouse.wheel(0, 10000)
-                time.sleep(1)
+            # Scroll until there are enough new jobs or no more load
+            self._load_results([page])
             
+            jobs = self._extract_jobs(page)
+        
+        except Exception as e:
+            print(f"   Search error: {e}")
+            return e
+        
+        return jobs
+    
+    def _extract_jobs(self, page):
+        """Extract job cards from a loaded search results page"""
+        if SCRAPER_SETTINGS['extraction_mode'] == 'bulk':
+            return self._extract_jobs_bulk(page)
+        return self._extract_jobs_by_element(page)
+    
+    def _card_to_job(self, card):
+        """Turn one EXTRACT_CARDS_JS record into a job dict (None if incomplete)"""
+        if not all([card.get('title'), card.get('company'), card.get('location'), card.get('href')]):
+            return None
+        
+        return {
+            'title': card['title'],
+            'company': card['company'],
+            'location': card['location'],
+            'url': card['href'].split('?')[0],  # Remove query params
+            'date': card.get('date') or datetime.now().strftime('%Y-%m-%d'),
+            'salary': card.get('salary') or "Not specified"
+        }
+    
+    def _cards_to_jobs(self, cards):
+        """Convert raw card records, skipping known and incomplete ones"""
+        jobs = []
+        for card in cards:
+            if len(jobs) >= self.max_jobs:  # Limit new jobs per search
+                break
+            job = self._card_to_job(card)
+            if job and not self._is_known(job['url']):
+                jobs.append(job)
+        return jobs
+    
+    def _extract_jobs_bulk(self, page):
+        """Extract every card with one page-side evaluation"""
+        cards = page.eval_on_selector_all(CARD_SELECTOR, EXTRACT_CARDS_JS)
+        return self._cards_to_jobs(cards)
+    
+    def _extract_jobs_by_element(self, page):
+        """Extract job cards one element lookup at a time"""
+        jobs = []
+        
+        try:
             # Extract job cards
             job_elements = page.query_selector_all(".job-search-card")
             
-            for job_elem in job_elements[:15]:  # Limit to 15 per search
+            for job_elem in job_elements:
+                if len(jobs) >= self.max_jobs:  # Limit new jobs per search
+                    break
+                
                 try:
+                    # Check the link first so known jobs cost one lookup
+                    link_elem = job_elem.query_selector("a.base-card__full-link")
+                    if not link_elem:
+                        continue
+                    url = link_elem.get_attribute("href").split('?')[0]  # Remove query params
+                    if self._is_known(url):
+                        continue
+                    
                     # Extract basic info
                     title_elem = job_elem.query_selector(".base-search-card__title")
                     company_elem = job_elem.query_selector(".base-search-card__subtitle")
                     location_elem = job_elem.query_selector(".job-search-card__location")
-                    link_elem = job_elem.query_selector("a.base-card__full-link")
                     
-                    if not all([title_elem, company_elem, location_elem, link_elem]):
+                    if not all([title_elem, company_elem, location_elem]):
                         continue
                     
                     job_data = {
                         'title': title_elem.inner_text().strip(),
                         'company': company_elem.inner_text().strip(),
                         'location': location_elem.inner_text().strip(),
-                        'url': link_elem.get_attribute("href").split('?')[0],  # Remove query params
+                        'url': url,
                         'date': datetime.now().strftime('%Y-%m-%d')
                     }
                     
@@ -304,20 +798,26 @@ class JobScraper:
                         job_data['salary'] = "Not specified"
                     
                     jobs.append(job_data)
-                    
+                
                 except Exception as e:
                     print(f"   Error extracting job: {e}")
                     continue
-            
+        
         except Exception as e:
-            print(f"   Search error: {e}")
+            print(f"   Extraction error: {e}")
         
         return jobs
     
-    def _filter_jobs(self, jobs):
-        """Filter jobs based on criteria and remove duplicates"""
+    def _filter_jobs(self, jobs, seen_urls=None):
+        """Filter jobs based on criteria and remove duplicates
+        
+        Args:
+            jobs: Scraped jobs
+            seen_urls: URLs already returned (updated in place), so successive
+                calls never repeat a job
+        """
         filtered = []
-        seen_urls = set()
+        seen_urls = set() if seen_urls is None else seen_urls
         
         for job in jobs:
             # Deduplicate by URL
@@ -336,20 +836,55 @@ class JobScraper:
         return filtered
     
     def save_jobs_to_db(self, jobs):
-        """Save scraped jobs to database"""
+        """Save scraped jobs to database in one transaction
+        
+        Sets job['saved'] to True on each job that was newly inserted (False
+        for ones already stored or that failed) so callers can skip the rest.
+        """
+        outcomes = self.db.add_applications(jobs)
         saved_count = 0
-        for job in jobs:
-            try:
-                job_id = self.db.add_application(job)
-                if job_id:
-                    saved_count += 1
-                    print(f"   ✓ Saved: {job['title']} at {job['company']}")
-            except Exception as e:
-                print(f"   ✗ Failed to save {job['title']}: {e}")
+        
+        if self.seen is not None:
+            self.seen.add_many(job['url'] for job, outcome in zip(jobs, outcomes) if outcome != 'error')
+        
+        for job, outcome in zip(jobs, outcomes):
+            job['saved'] = outcome == 'inserted'
+            if outcome == 'inserted':
+                saved_count += 1
+                print(f"   ✓ Saved: {job['title']} at {job['company']}")
+            elif outcome == 'error':
+                print(f"   ✗ Failed to save {job['title']}")
         
         print(f"\n📊 Saved {saved_count} new jobs to database")
+        
+        inserted = [job for job, outcome in zip(jobs, outcomes) if outcome == 'inserted']
+        if inserted and self.dedupe.enabled:
+            self._link_duplicates(inserted)
         return saved_count
     
+    def _link_duplicates(self, jobs):
+        """Link newly saved jobs to earlier postings of the same role
+        
+        Sets job['duplicate_of'] on each near-duplicate so callers can skip it.
+        """
+        try:
+            self.dedupe.ensure_index()
+            ids = self.db.get_application_ids(job['url'] for job in jobs)
+            duplicates = 0
+            for job in jobs:
+                if job['url'] not in ids:
+                    continue
+                original_id = self.dedupe.register(ids[job['url']], job['title'], job['company'], job['location'])
+                if original_id is not None:
+                    job['duplicate_of'] = original_id
+                    duplicates += 1
+                    print(f"   ≈ Near-duplicate of #{original_id}: {job['title']} at {job['company']}")
+            if duplicates:
+                print(f"🔁 {duplicates} of the new jobs repeat earlier postings")
+        except Exception as e:
+            # Duplicate detection is advisory; the jobs are already saved
+            logger.warning(f"Near-duplicate check failed: {e}")
+    
     def close(self):
         """Close database connection"""
         self.db.close()
@@ -0,0 +1,176 @@
+"""
+Screenshot service: capture in memory, write on a background thread
+
+The apply path only pays for the capture itself. The image bytes are
+handed to one writer thread, so disk I/O never blocks an application.
+Storage stays bounded two ways:
+
+- Images are JPEG by default (SCREENSHOT_FORMAT, SCREENSHOT_QUALITY), and
+  in-modal outcomes can be clipped to the Easy Apply dialog instead of the
+  whole viewport.
+- Every file name ends with a hash of the image content. An identical
+  image (the same "No Easy Apply" page, the same stuck form) reuses the
+  existing file instead of writing a new one, across runs too.
+
+Use the shared instance from get_screenshot_service(); call flush() to wait
+for pending writes (bots do this in close()).
+"""
+
+import atexit
+import hashlib
+import queue
+import threading
+from datetime import datetime
+from config import SCREENSHOT_SETTINGS, SCREENSHOTS_DIR
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+DIGEST_LENGTH = 12
+
+
+class ScreenshotService:
+    def __init__(self, directory=None, settings=None):
+        """Initialize the service (the writer thread starts on the first capture)
+        
+        Args:
+            directory: Where screenshots are written (None uses SCREENSHOTS_DIR)
+            settings: Override SCREENSHOT_SETTINGS (None uses config value)
+        """
+        settings = settings or SCREENSHOT_SETTINGS
+        self.directory = directory or SCREENSHOTS_DIR
+        self.format = "png" if settings['format'] == "png" else "jpeg"
+        self.quality = settings['quality']
+        self.clip_to_modal = settings['clip_to_modal']
+        self.extension = "png" if self.format == "png" else "jpg"
+        
+        self._pending = queue.Queue()
+        self._writer = None
+        self._index = None  # content digest -> path
+        self._lock = threading.Lock()
+        self.stats = {'captured': 0, 'deduplicated': 0, 'written': 0, 'bytes_written': 0}
+    
+    def _options(self):
+        """Keyword arguments for page/element.screenshot()"""
+        options = {'type': self.format}
+        if self.format == "jpeg":
+            options['quality'] = self.quality
+        return options
+    
+    def _load_index(self):
+        """Digests of screenshots already on disk, taken from their file names"""
+        index = {}
+        for path in self.directory.glob(f"*.{self.extension}"):
+            digest = path.stem.rsplit("_", 1)[-1]
+            if len(digest) == DIGEST_LENGTH:
+                index.setdefault(digest, str(path))
+        return index
+    
+    def _path_for(self, prefix, job_details, digest):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        company_safe = job_details.get('company', 'unknown').replace(' ', '_').replace('/', '_')
+        return self.directory / f"{prefix}_{company_safe}_{timestamp}_{digest}.{self.extension}"
+    
+    def _target(self, page, selector):
+        """Element to clip to, or the page itself"""
+        if selector and self.clip_to_modal:
+            element = page.query_selector(selector)
+            if element:
+                return element
+        return page
+    
+    def capture(self, page, prefix, job_details, selector=None):
+        """Screenshot a page (or the element matching selector) and queue the write
+        
+        Args:
+            page: Sync Playwright page
+            prefix: Outcome the screenshot documents ("success", "error", ...)
+            job_details: Job dict (its company goes in the file name)
+            selector: Element to clip to when clip_to_modal is on
+        
+        Returns:
+            str: Path the screenshot is (or will shortly be) stored at
+        """
+        data = self._target(page, selector).screenshot(**self._options())
+        return self._store(data, prefix, job_details)
+    
+    async def capture_async(self, page, prefix, job_details, selector=None):
+        """capture() for an async Playwright page"""
+        target = page
+        if selector and self.clip_to_modal:
+            target = await page.query_selector(selector) or page
+        data = await target.screenshot(**self._options())
+        return self._store(data, prefix, job_details)
+    
+    def _store(self, data, prefix, job_details):
+        digest = hashlib.sha256(data).hexdigest()[:DIGEST_LENGTH]
+        with self._lock:
+            if self._index is None:
+                self._index = self._load_index()
+            self.stats['captured'] += 1
+            
+            existing = self._index.get(digest)
+            if existing:
+                self.stats['deduplicated'] += 1
+                return existing
+            
+            path = self._path_for(prefix, job_details, digest)
+            self._index[digest] = str(path)
+            self._start_writer()
+        
+        self._pending.put((path, data))
+        return str(path)
+    
+    def _start_writer(self):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="screenshot-writer", daemon=True)
+            self._writer.start()
+    
+    def _write_loop(self):
+        while True:
+            path, data = self._pending.get()
+            try:
+                # Write then rename, so a reader never sees half a file
+                partial = path.with_name(path.name + ".part")
+                partial.write_bytes(data)
+                partial.replace(path)
+                with self._lock:
+                    self.stats['written'] += 1
+                    self.stats['bytes_written'] += len(data)
+            except Exception as e:
+                logger.warning(f"Could not write screenshot {path.name}: {e}")
+                with self._lock:
+                    self._index.pop(path.stem.rsplit("_", 1)[-1], None)
+            finally:
+                self._pending.task_done()
+    
+    def flush(self):
+        """Block until every queued screenshot is on disk"""
+        self._pending.join()
+    
+    def log_summary(self):
+        with self._lock:
+            stats = dict(self.stats)
+        if stats['captured']:
+            logger.info(f"Screenshots: {stats['captured']} captured, {stats['deduplicated']} deduplicated, "
+                        f"{stats['written']} written ({stats['bytes_written'] / 1024:.0f} KB)")
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_screenshot_service():
+    """Return the shared ScreenshotService, creating it once"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = ScreenshotService()
+        return _service
+
+
+@atexit.register
+def flush_screenshots():
+    """Finish pending writes before the interpreter exits"""
+    if _service is not None:
+        _service.flush()
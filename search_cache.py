@@ -0,0 +1,55 @@
+"""
+Cache of search results keyed on keyword, location and search filters
+
+Back-to-back runs (a manual scrape, then the scheduled routine) repeat the
+same keyword/location searches. Results younger than the TTL are served from
+the search_cache table instead of the browser; the table is capped at
+max_entries, evicting the least recently used searches.
+"""
+
+import hashlib
+import json
+from config import SCRAPER_SETTINGS
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SearchCache:
+    def __init__(self, db, ttl_minutes=None, max_entries=None):
+        """Initialize the cache
+        
+        Args:
+            db: ApplicationDatabase holding the search_cache table
+            ttl_minutes: Age after which a cached search is ignored (None uses config value, 0 disables)
+            max_entries: Searches kept before LRU eviction (None uses config value)
+        """
+        self.db = db
+        self.ttl_minutes = SCRAPER_SETTINGS['cache_ttl_minutes'] if ttl_minutes is None else ttl_minutes
+        self.max_entries = max_entries or SCRAPER_SETTINGS['cache_max_entries']
+    
+    @property
+    def enabled(self):
+        return self.ttl_minutes > 0
+    
+    def _key(self, keyword, location, filters):
+        raw = json.dumps([keyword.lower(), location.lower(), filters], sort_keys=True)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    
+    def get(self, keyword, location, filters):
+        """Cached jobs for a search, or None on a miss"""
+        if not self.enabled:
+            return None
+        return self.db.get_cached_search(self._key(keyword, location, filters), self.ttl_minutes)
+    
+    def put(self, keyword, location, filters, jobs):
+        if not self.enabled:
+            return
+        try:
+            self.db.put_cached_search(
+                self._key(keyword, location, filters), keyword, location,
+                json.dumps(filters, sort_keys=True), jobs, self.max_entries
+            )
+        except Exception as e:
+            # A cache write must never fail the search itself
+            logger.warning(f"Could not cache results for {keyword} in {location}: {e}")
@@ -0,0 +1,43 @@
+"""
+Compact index of job URLs already stored in the database
+
+URLs are kept as fixed-size 64-bit hashes rather than full strings, loaded
+from the applications table when the index is built.
+The scraper checks it before extracting a card so known jobs cost no further
+browser round-trips.
+"""
+
+from hashlib import blake2b
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _url_key(url):
+    return int.from_bytes(blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class SeenUrlIndex:
+    def __init__(self, db=None):
+        """Build the index
+        
+        Args:
+            db: ApplicationDatabase to load known URLs from (None starts empty)
+        """
+        self._keys = set()
+        if db is not None:
+            self.add_many(db.iter_job_urls())
+            logger.debug(f"Seen-URL index loaded with {len(self._keys)} jobs")
+    
+    def __contains__(self, url):
+        return bool(url) and _url_key(url) in self._keys
+    
+    def __len__(self):
+        return len(self._keys)
+    
+    def add(self, url):
+        if url:
+            self._keys.add(_url_key(url))
+    
+    def add_many(self, urls):
+        self._keys.update(_url_key(url) for url in urls if url)
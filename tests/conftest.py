@@ -0,0 +1,28 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# config.py exits when credentials are missing; tests never log in
+os.environ.setdefault("LINKEDIN_EMAIL", "test@example.com")
+os.environ.setdefault("LINKEDIN_PASSWORD", "test")
+os.environ["BLOCK_RESOURCES"] = "true"  # Tests check the filter routes
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """A fresh database file used by every ApplicationDatabase() in the test"""
+    path = tmp_path / "applications.db"
+    monkeypatch.setattr(database, "DB_PATH", path)
+    yield path
+    database.close_pools()
+
+
+@pytest.fixture
+def db(db_path):
+    return database.ApplicationDatabase(db_path)
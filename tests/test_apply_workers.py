@@ -0,0 +1,31 @@
+import asyncio
+
+from apply_workers import RateGovernor
+
+
+def test_zero_rate_means_no_limit():
+    governor = RateGovernor(daily_cap=10, rate_per_minute=0, burst=1, company_spacing=0)
+    for _ in range(5):
+        governor.wait_turn("Acme")  # Would block (or divide by zero) if paced
+    assert governor.rate == 0
+
+
+def test_async_reserve_respects_daily_cap():
+    governor = RateGovernor(daily_cap=3, already_sent=1, rate_per_minute=0, company_spacing=0)
+    
+    async def run():
+        first = await governor.reserve_async(poll_interval=0.01)
+        governor.release(False)  # A failed attempt hands its slot back
+        results = []
+        for _ in range(3):
+            reserved = await governor.reserve_async(poll_interval=0.01)
+            results.append(reserved)
+            if reserved:
+                await governor.wait_turn_async("Acme")
+                governor.release(True)
+        return first, results
+    
+    first, results = asyncio.run(run())
+    assert first is True
+    assert results == [True, True, False]
+    assert governor.remaining == 0
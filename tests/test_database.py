@@ -0,0 +1,72 @@
+def _job(n, **overrides):
+    job = dict(url=f"https://example.com/jobs/{n}", title=f"Engineer {n}", company="Acme",
+               location="Nairobi", salary="KES 100K/yr - 150K/yr")
+    job.update(overrides)
+    return job
+
+
+def test_add_applications_reports_outcomes_in_input_order(db):
+    assert db.add_applications([_job(1)]) == ['inserted']
+    
+    outcomes = db.add_applications([_job(2), _job(1), _job(3), _job(2)])
+    
+    # Already stored, and repeated within the batch, both count as duplicates
+    assert outcomes == ['inserted', 'duplicate', 'inserted', 'duplicate']
+    assert len(db.get_all_applications()) == 3
+
+
+def test_add_applications_with_no_jobs(db):
+    assert db.add_applications(iter([])) == []
+
+
+def test_add_applications_reports_rows_the_insert_ignored(db):
+    outcomes = db.add_applications([_job(1), _job(2, title=None), _job(3, company=None), _job(4)])
+    
+    assert outcomes == ['inserted', 'error', 'error', 'inserted']
+    assert sorted(row['job_url'] for row in db.get_all_applications()) == [_job(1)['url'], _job(4)['url']]
+
+
+def test_add_applications_rolls_back_a_failed_batch(db):
+    outcomes = db.add_applications([_job(1), _job(2, salary=150000)])  # Not text: parsing it raises
+    
+    assert outcomes == ['error', 'error']
+    assert db.get_all_applications() == []
+    assert db.add_applications([_job(1)]) == ['inserted']
+
+
+def test_add_application_returns_none_unless_inserted(db):
+    first = db.add_application(_job(1))
+    other = db.add_application(_job(2))
+    
+    assert first is not None and other == first + 1
+    assert db.add_application(_job(1)) is None  # Not the previous insert's id
+    assert db.add_application(_job(3, title=None)) is None
+
+
+def test_failed_write_does_not_leave_the_shared_writer_in_a_transaction(db):
+    db.add_applications([_job(1)])
+    
+    try:
+        with db.pool.writer() as conn:
+            conn.execute("UPDATE applications SET notes = 'half done'")
+            conn.execute("UPDATE no_such_table SET x = 1")
+    except Exception:
+        pass
+    
+    assert not db.pool.writer_conn.in_transaction
+    assert db.get_all_applications()[0]['notes'] is None
+    assert db.add_applications([_job(2)]) == ['inserted']  # BEGIN IMMEDIATE works again
+
+
+def test_failed_daily_stats_update_changes_neither_table(db):
+    db.update_daily_stats(date='2026-10-01', applications_sent=2)
+    
+    try:
+        db.update_daily_stats(date='2026-10-01', applications_sent=object())  # Not bindable
+    except Exception:
+        pass
+    
+    assert db.get_daily_stats('2026-10-01')['applications_sent'] == 2
+    assert db.rebuild_rollups() == 1
+    assert db.get_daily_stats('2026-10-01')['applications_sent'] == 2
+    assert not db.pool.writer_conn.in_transaction
@@ -0,0 +1,116 @@
+import sqlite3
+
+import database
+import migrations
+
+
+def _baseline_db(path):
+    """A database as the pre-versioning code left it: tables, rows, hand-counted stats"""
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    migrations._initial_schema(conn)
+    rows = [
+        ('u1', 'Applied', '2026-10-01', '2026-10-01', None),
+        ('u2', 'Applied', '2026-10-01', '2026-10-02', 'success.jpg'),
+        ('u3', 'Interview Scheduled', '2026-10-01', '2026-10-05', None),
+        ('u4', 'Rejected', '2026-10-02', '2026-10-06', None),
+        ('u5', 'Offer', '2026-10-02', '2026-10-09', None),
+        ('u6', 'Manual Review Needed', '2026-10-03', '2026-10-03', None),
+    ]
+    conn.executemany('''
+    INSERT INTO applications (job_title, company_name, job_url, application_status,
+                              date_applied, status_updated, screenshot_path)
+    VALUES ('Engineer', 'Acme', ?, ?, ?, ?, ?)
+    ''', rows)
+    # Sends counted by the old daily routine, more than the statuses can explain
+    conn.execute("INSERT INTO daily_stats (date, applications_sent) VALUES ('2026-10-01', 5)")
+    return conn
+
+
+def _totals(conn):
+    return conn.execute('''
+    SELECT SUM(applications_sent), SUM(interviews_scheduled), SUM(rejections_received), SUM(offers_received)
+    FROM daily_stats
+    ''').fetchone()
+
+
+def test_upgrade_to_latest_keeps_stats_totals(tmp_path):
+    conn = _baseline_db(tmp_path / "old.db")
+    assert migrations.get_version(conn) == 0
+    
+    assert migrations.migrate(conn) == migrations.LATEST_VERSION
+    
+    sent, interviews, rejections, offers = _totals(conn)
+    assert (interviews, rejections, offers) == (1, 1, 1)
+    # 5 hand-counted sends on 2026-10-01 (u3's is one of them) plus u2, u4 and u5
+    assert sent == 5 + 3
+    conn.close()
+
+
+def test_rebuild_after_upgrade_matches_migrated_stats(tmp_path):
+    path = tmp_path / "old.db"
+    conn = _baseline_db(path)
+    migrations.migrate(conn)
+    migrated = conn.execute('SELECT * FROM daily_stats ORDER BY date').fetchall()
+    conn.close()
+    
+    db = database.ApplicationDatabase(path)
+    try:
+        db.rebuild_rollups()
+        rebuilt = [tuple(row) for row in db._fetch('SELECT * FROM daily_stats ORDER BY date')]
+    finally:
+        database.close_pools()
+    
+    assert rebuilt == migrated
+
+
+def test_triggers_count_every_write_path(db):
+    db.add_applications([{'title': 'Engineer', 'company': 'Acme', 'url': f'u{n}'} for n in range(3)])
+    
+    db.update_status('u0', 'Applied')
+    db.update_status('u1', 'Applied')
+    db.schedule_interview('u1', '2026-11-01')
+    db.update_status('u1', 'Offer')
+    db.update_status('u2', 'Rejected')
+    db.update_daily_stats(applications_sent=1)
+    
+    stats = db.get_daily_stats()
+    assert (stats['applications_sent'], stats['interviews_scheduled'],
+            stats['rejections_received'], stats['offers_received']) == (3, 1, 1, 1)
+    
+    summary = dict(db.get_stats_summary(1))
+    db.rebuild_rollups()
+    assert dict(db.get_stats_summary(1)) == summary
+
+
+def test_repeated_applied_writes_count_one_send(db):
+    db.add_applications([{'title': 'Engineer', 'company': 'Acme', 'url': f'u{n}'} for n in range(2)])
+    
+    db.update_status('u0', 'Applied')
+    db.update_status('u0', 'Applied')  # Retried callback
+    db.update_status('u0', 'Applied', notes="checked by hand")
+    db.update_status('u1', 'Manual Review Needed')
+    db.update_status('u1', 'Applied')
+    db.update_status('u1', 'Applied')
+    
+    assert db.get_daily_stats()['applications_sent'] == 2
+    history = [(row['from_status'], row['to_status']) for row in db.get_status_history(1)]
+    assert history == [('', 'Applied'), ('Applied', 'Applied')]
+    db.rebuild_rollups()
+    assert db.get_daily_stats()['applications_sent'] == 2
+
+
+def test_upgrade_drops_repeat_sends_logged_before_the_fix(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "v10.db"), isolation_level=None)
+    for _, _, apply in migrations.MIGRATIONS[:10]:
+        apply(conn)
+    conn.execute('PRAGMA user_version = 10')
+    conn.execute("INSERT INTO applications (job_title, company_name, job_url) VALUES ('Engineer', 'Acme', 'u0')")
+    for _ in range(3):
+        conn.execute("UPDATE applications SET application_status = 'Applied' WHERE job_url = 'u0'")
+    assert _totals(conn)[0] == 3
+    
+    migrations.migrate(conn)
+    
+    assert _totals(conn)[0] == 1
+    assert conn.execute("SELECT COUNT(*) FROM status_events WHERE to_status = 'Applied'").fetchone()[0] == 2
+    conn.close()
@@ -0,0 +1,24 @@
+from pipeline import JobPipeline
+from scraper import JobScraper
+
+
+def _job(n, **extra):
+    return dict(url=f"https://example.com/jobs/{n}", title=f"Engineer {n}", company="Acme",
+                location="Nairobi", **extra)
+
+
+def test_save_offers_only_inserted_jobs(db):
+    db.add_applications([_job(1)])
+    scraper = JobScraper.__new__(JobScraper)  # No browser needed to save
+    scraper.db = db
+    scraper.seen = None
+    scraper.dedupe = type("NoDedupe", (), {"enabled": False})()
+    pipeline = JobPipeline(scraper, queue_size=10)
+    
+    pipeline._save([_job(1), _job(2), _job(2), _job(3, duplicate_of=1)])
+    
+    offered = []
+    while not pipeline.jobs.empty():
+        offered.append(pipeline.jobs.get_nowait()[2]['url'])
+    assert pipeline.saved == 2
+    assert offered == [_job(2)['url']]
@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+
+import pytest
+
+from request_filter import RequestFilter, TrafficMeter
+
+SETTINGS = {
+    "enabled": True,
+    "blocked_types": ["image", "media", "font"],
+    "blocked_hosts": ["doubleclick.net", "ads.linkedin.com"],
+    "allow": {
+        "search": {"types": [], "hosts": []},
+        "apply": {"types": ["font"], "hosts": ["static.licdn.com"]},
+    },
+}
+
+
+def _request(url, resource_type, failure=None):
+    return SimpleNamespace(url=url, resource_type=resource_type, failure=failure)
+
+
+@pytest.mark.parametrize("phase, url, resource_type, blocked", [
+    ("search", "https://www.linkedin.com/jobs/search", "document", False),
+    ("search", "https://stats.g.doubleclick.net/collect", "document", False),  # Documents always load
+    ("search", "https://www.linkedin.com/voyager/api/jobs", "xhr", False),
+    ("search", "https://media.licdn.com/logo.png", "image", True),
+    ("search", "https://static.licdn.com/font.woff2", "font", True),
+    ("search", "https://stats.g.doubleclick.net/collect", "xhr", True),  # Subdomain of a blocked host
+    ("search", "https://ads.linkedin.com/px", "script", True),
+    ("search", "https://notdoubleclick.net/x.js", "script", False),  # Suffix match is per label
+    ("apply", "https://fonts.example.com/font.woff2", "font", False),  # Type allowed in this phase
+    ("apply", "https://static.licdn.com/sprite.png", "image", False),  # Host allowed in this phase
+    ("apply", "https://media.licdn.com/logo.png", "image", True),
+])
+def test_should_block(phase, url, resource_type, blocked):
+    assert RequestFilter(phase, SETTINGS).should_block(_request(url, resource_type)) is blocked
+
+
+class StubRoute:
+    def __init__(self, request):
+        self.request = request
+        self.outcome = None
+    
+    def abort(self, reason):
+        self.outcome = ("abort", reason)
+    
+    def continue_(self):
+        self.outcome = ("continue", None)
+
+
+def test_route_aborts_and_counts_blocked_requests():
+    request_filter = RequestFilter("search", SETTINGS)
+    routes = [StubRoute(_request(url, kind)) for url, kind in [
+        ("https://media.licdn.com/a.png", "image"),
+        ("https://media.licdn.com/b.png", "image"),
+        ("https://www.linkedin.com/voyager/api/jobs", "xhr"),
+    ]]
+    
+    for route in routes:
+        request_filter._route(route)
+    
+    assert [route.outcome for route in routes] == [
+        ("abort", "blockedbyclient"), ("abort", "blockedbyclient"), ("continue", None)
+    ]
+    assert request_filter.blocked == {"image": 2}
+
+
+def test_disabled_filter_installs_no_route():
+    routes = []
+    context = SimpleNamespace(route=lambda pattern, handler: routes.append(pattern))
+    
+    RequestFilter("search", dict(SETTINGS, enabled=False)).install(context)
+    
+    assert routes == []
+
+
+class StubPage:
+    def __init__(self):
+        self.handlers = {}
+    
+    def on(self, event, handler):
+        self.handlers[event] = handler
+    
+    def emit(self, event, payload):
+        self.handlers[event](payload)
+
+
+def test_traffic_meter_counts_requests_and_bytes():
+    page = StubPage()
+    meter = TrafficMeter(page)
+    meter.begin("https://www.linkedin.com/jobs/search")
+    
+    page.emit("response", SimpleNamespace(headers={"content-length": "2048"}))
+    page.emit("response", SimpleNamespace(headers={"content-length": "1024"}))
+    page.emit("response", SimpleNamespace(headers={}))  # Chunked: counted, no bytes
+    page.emit("response", SimpleNamespace(headers={"content-length": "n/a"}))
+    page.emit("requestfailed", _request("https://media.licdn.com/a.png", "image", "net::ERR_BLOCKED_BY_CLIENT"))
+    page.emit("requestfailed", _request("https://www.linkedin.com/x", "xhr", "net::ERR_TIMED_OUT"))
+    stats = meter.report()
+    
+    assert stats["url"] == "https://www.linkedin.com/jobs/search"
+    assert (stats["responses"], stats["bytes"], stats["blocked"]) == (4, 3072, 1)
+    assert stats["seconds"] >= 0
+
+
+def test_traffic_meter_resets_per_navigation():
+    page = StubPage()
+    meter = TrafficMeter(page)
+    meter.begin("https://www.linkedin.com/jobs/view/1")
+    page.emit("response", SimpleNamespace(headers={"content-length": "500"}))
+    
+    meter.begin("https://www.linkedin.com/jobs/view/2")
+    page.emit("response", SimpleNamespace(headers={"content-length": "100"}))
+    stats = meter.report()
+    
+    assert (stats["url"], stats["responses"], stats["bytes"]) == ("https://www.linkedin.com/jobs/view/2", 1, 100)
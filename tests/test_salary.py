@@ -0,0 +1,71 @@
+import pytest
+
+import migrations
+import salary
+from salary import parse_salary
+
+SETTINGS = {"default_period": "year", "periods_per_year": {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}}
+
+
+@pytest.mark.parametrize("text, expected", [
+    # LinkedIn formats
+    ("KES 100K/yr - 150K/yr", (100_000, 150_000, "KES", "year")),
+    ("$100K/yr - $150K/yr · 401k, +1 benefit", (100_000, 150_000, "USD", "year")),
+    ("$45/hr - $60/hr", (93_600, 124_800, "USD", "hour")),
+    ("$45/hr", (93_600, 93_600, "USD", "hour")),
+    ("KES 80,000/month - 120,000/month", (960_000, 1_440_000, "KES", "month")),
+    ("KSh 150,000 per month", (1_800_000, 1_800_000, "KES", "month")),
+    ("€50,000 - €60,000 a year", (50_000, 60_000, "EUR", "year")),
+    ("£30 to £35 an hour", (62_400, 72_800, "GBP", "hour")),
+    ("100,000 - 120,000 KES", (100_000, 120_000, "KES", "year")),
+    ("1.2M - 1.5M NGN per annum", (1_200_000, 1_500_000, "NGN", "year")),
+    ("CA$90K/yr - CA$110K/yr · Medical, +2 benefits", (90_000, 110_000, "CAD", "year")),
+    # Numbers that are not the pay
+    ("2 openings, $120,000/yr", (120_000, 120_000, "USD", "year")),
+    ("$100K - $150K, 401k match", (100_000, 150_000, "USD", "year")),
+    ("85000", (85_000, 85_000, None, "year")),  # Unmarked: the default period applies
+])
+def test_parse_salary(text, expected):
+    parsed = parse_salary(text, SETTINGS)
+    assert (parsed['min'], parsed['max'], parsed['currency'], parsed['period']) == expected
+
+
+@pytest.mark.parametrize("text", ["Not specified", "", None, "Competitive", "Medical · Dental"])
+def test_parse_salary_without_an_amount(text):
+    assert parse_salary(text, SETTINGS) is None
+
+
+def test_salary_columns_for_unparsed_text():
+    assert salary.salary_columns("Not specified", SETTINGS) == (None, None, None, None)
+
+
+def test_backfill_reparses_stored_rows(db):
+    db.add_applications([
+        {'title': 'Engineer', 'company': 'Acme', 'url': 'u1', 'salary': 'KES 100K/yr - 150K/yr'},
+        {'title': 'Engineer', 'company': 'Acme', 'url': 'u2', 'salary': '$45/hr · 401k'},
+        {'title': 'Engineer', 'company': 'Acme', 'url': 'u3', 'salary': 'Not specified'},
+    ])
+    with db.pool.writer() as conn:
+        conn.execute('UPDATE applications SET salary_min = NULL, salary_max = NULL, currency = NULL, period = NULL')
+        conn.commit()
+    
+    assert salary.backfill(db, batch_size=2) == 2
+    
+    rows = {row['job_url']: (row['salary_min'], row['salary_max'], row['currency'], row['period'])
+            for row in db.get_all_applications()}
+    assert rows['u1'] == (100_000, 150_000, 'KES', 'year')
+    assert rows['u2'][2:] == ('USD', 'hour') and rows['u2'][0] == rows['u2'][1]
+    assert rows['u3'] == (None, None, None, None)
+
+
+def test_upgrade_reparses_salaries_stored_by_the_old_parser(db):
+    db.add_applications([{'title': 'Engineer', 'company': 'Acme', 'url': 'u1',
+                          'salary': '$100K/yr - $150K/yr · 401k, +1 benefit'}])
+    with db.pool.writer() as conn:
+        conn.execute('UPDATE applications SET salary_min = 1, salary_max = 401000')
+        conn.execute('PRAGMA user_version = 11')
+        conn.commit()
+        migrations.migrate(conn)
+    
+    row = db.get_all_applications()[0]
+    assert (row['salary_min'], row['salary_max']) == (100_000, 150_000)
@@ -0,0 +1,116 @@
+from datetime import datetime
+
+import pytest
+
+from config import SCORING_SETTINGS
+from scoring import JobScorer
+
+CRITERIA = {
+    "keywords": ["Python Developer", "Software Engineer"],
+    "locations": ["Remote", "Nairobi", "Kenya", "Mombasa"],
+    "experience_level": ["Entry Level", "Mid Level", "Senior Level"],
+    "salary_range": {"min": 100000, "max": 200000},
+}
+SETTINGS = {
+    "enabled": True,
+    "min_score": 0.4,
+    "require_keyword": True,
+    "weights": {"keyword": 0.35, "location": 0.2, "salary": 0.15, "recency": 0.15, "experience": 0.15},
+    "recency_half_life_days": 7,
+    "unknown_score": 0.5,
+}
+NOW = datetime(2026, 10, 17)
+
+
+def _job(title="Python Developer", location="Nairobi, Kenya", salary="Not specified", date="", **extra):
+    return dict(title=title, location=location, salary=salary, date=date, **extra)
+
+
+def _component(name, jobs, criteria=CRITERIA):
+    return list(JobScorer(criteria, SETTINGS).score(jobs, now=NOW)[name].round(3))
+
+
+def test_keyword_share_of_best_keyword():
+    jobs = [_job("Senior Python Developer"), _job("Python Data Analyst"), _job("Graphic Designer")]
+    assert _component("keyword", jobs) == [1.0, 0.5, 0.0]
+
+
+def test_salary_against_the_range_minimum():
+    jobs = [
+        _job(salary="KES 150K/yr - 250K/yr"),
+        _job(salary="KES 50K/yr"),
+        _job(salary="KES 5,000/month"),  # 60,000 a year
+        _job(salary="Not specified"),
+    ]
+    assert _component("salary", jobs) == [1.0, 0.5, 0.6, 0.5]
+
+
+def test_location_by_preference_order():
+    jobs = [_job(location="Remote"), _job(location="Nairobi, Kenya"), _job(location="Mombasa"), _job(location="Lagos")]
+    # The first preferred place found wins: "Nairobi, Kenya" scores as Nairobi
+    assert _component("location", jobs) == [1.0, 0.75, 0.25, 0.0]
+
+
+def test_recency_halves_every_half_life():
+    jobs = [_job(date="2026-10-17"), _job(date="2026-10-10"), _job(date="2026-10-03"), _job(date="")]
+    assert _component("recency", jobs) == [1.0, 0.5, 0.25, 0.5]
+
+
+def test_experience_from_title():
+    criteria = dict(CRITERIA, experience_level=["Mid Level"])
+    jobs = [_job("Python Developer"), _job("Senior Python Developer"), _job("Python Developer Intern")]
+    assert _component("experience", jobs, criteria) == [1.0, 0.0, 0.0]
+
+
+def test_rank_orders_by_score_and_annotates_jobs():
+    jobs = [
+        _job("Python Developer", location="Lagos", n=0),
+        _job("Python Developer", location="Remote", date="2026-10-17", n=1),
+        _job("Software Engineer", location="Nairobi", n=2),
+    ]
+    
+    ranked = JobScorer(CRITERIA, SETTINGS).rank(jobs)
+    
+    assert [job['n'] for job in ranked] == [1, 2, 0]
+    assert all(0 <= job['score'] <= 1 for job in jobs)
+    assert ranked[0]['score'] > ranked[1]['score'] > ranked[2]['score']
+
+
+def test_rank_drops_jobs_matching_no_keyword():
+    # Everything but the keyword is a perfect match, which alone would clear min_score
+    unrelated = _job("Intern", location="Remote", salary="KES 150K/yr", date="2026-10-17")
+    scorer = JobScorer(CRITERIA, SETTINGS)
+    
+    assert scorer.score([unrelated], now=NOW)['score'][0] >= SETTINGS['min_score']
+    assert scorer.rank([unrelated]) == []
+    assert JobScorer(CRITERIA, dict(SETTINGS, require_keyword=False)).rank([unrelated]) == [unrelated]
+
+
+def test_default_settings_drop_a_zero_keyword_match():
+    scorer = JobScorer(CRITERIA, dict(SCORING_SETTINGS, enabled=True))
+    
+    assert scorer.rank([_job("Intern", location="Lagos"), _job("Intern", location="Remote")]) == []
+
+
+@pytest.mark.parametrize("min_score, top_n, expected", [
+    (0.0, None, [1, 2, 0]),
+    (0.0, 2, [1, 2]),
+    (0.7, None, [1, 2]),
+    (0.7, 1, [1]),
+    (0.99, None, []),
+])
+def test_rank_min_score_and_top_n(min_score, top_n, expected):
+    jobs = [
+        _job("Python Developer", location="Lagos", n=0),
+        _job("Python Developer", location="Remote", date="2026-10-17", n=1),
+        _job("Software Engineer", location="Nairobi", n=2),
+    ]
+    
+    ranked = JobScorer(CRITERIA, SETTINGS).rank(jobs, top_n=top_n, min_score=min_score)
+    
+    assert [job['n'] for job in ranked] == expected
+
+
+def test_disabled_scorer_keeps_scrape_order():
+    jobs = [_job("Intern", n=0), _job("Python Developer", n=1)]
+    assert JobScorer(CRITERIA, dict(SETTINGS, enabled=False)).rank(jobs, top_n=1) == [jobs[0]]
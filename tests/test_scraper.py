@@ -0,0 +1,148 @@
+import asyncio
+
+from scraper import HostThrottle, JobScraper
+from async_scraper import AsyncJobScraper
+from waits import AsyncWaiter, Waiter
+
+
+class StubContext:
+    def __init__(self):
+        self.routes = []
+    
+    def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+
+class StubAsyncContext(StubContext):
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+
+def test_scraper_installs_search_request_filter(db_path):
+    scraper = JobScraper(headless=True)
+    context = StubContext()
+    
+    scraper.request_filter.install(context)
+    
+    assert scraper.request_filter.phase == "search"
+    assert context.routes == [("**/*", scraper.request_filter._route)]
+
+
+def test_async_scraper_installs_search_request_filter(db_path):
+    scraper = AsyncJobScraper(headless=True)
+    context = StubAsyncContext()
+    
+    asyncio.run(scraper.request_filter.install_async(context))
+    
+    assert scraper.request_filter.phase == "search"
+    assert context.routes == [("**/*", scraper.request_filter._route_async)]
+
+
+def test_scraper_waits_match_backend(db_path):
+    assert isinstance(JobScraper(headless=True).waits, Waiter)
+    assert isinstance(AsyncJobScraper(headless=True).waits, AsyncWaiter)
+
+
+def test_human_delay_uses_waiter(db_path, monkeypatch):
+    scraper = JobScraper(headless=True)
+    pauses = []
+    monkeypatch.setattr(scraper.waits, "pause", lambda *args: pauses.append(args))
+    
+    scraper._human_delay(0, 0)
+    
+    assert pauses == [("human", 0, 0)]
+
+
+class StubPage:
+    def __init__(self, name, log, fail=False):
+        self.name = name
+        self.log = log
+        self.fail = fail
+    
+    def goto(self, url, **kwargs):
+        self.log.append(("goto", self.name))
+        if self.fail:
+            raise TimeoutError(f"{self.name} timed out")
+
+
+def _pooled_scraper(monkeypatch, log):
+    scraper = JobScraper(headless=True)
+    scraper.throttle = HostThrottle(0)
+    
+    def wait_for_results(page, *args, **kwargs):
+        log.append(("wait", page.name))
+        return True
+    
+    monkeypatch.setattr(scraper, "_wait_for_results", wait_for_results)
+    monkeypatch.setattr(scraper, "_load_results", lambda pages: log.append(("scroll", [page.name for page in pages])))
+    monkeypatch.setattr(scraper, "_extract_jobs", lambda page: [{"url": page.name}])
+    return scraper
+
+
+def test_page_pool_starts_every_navigation_before_waiting(db_path, monkeypatch):
+    log = []
+    scraper = _pooled_scraper(monkeypatch, log)
+    pages = [StubPage(name, log) for name in ("a", "b", "c")]
+    
+    results = scraper._search_batch(pages, [("python", "Nairobi"), ("python", "Remote"), ("react", "Nairobi")])
+    
+    assert log == [("goto", "a"), ("goto", "b"), ("goto", "c"),
+                   ("wait", "a"), ("wait", "b"), ("wait", "c"), ("scroll", ["a", "b", "c"])]
+    assert [jobs for _, jobs in results] == [[{"url": "a"}], [{"url": "b"}], [{"url": "c"}]]
+    assert [search for search, _ in results] == [("python", "Nairobi"), ("python", "Remote"), ("react", "Nairobi")]
+
+
+def test_page_pool_keeps_a_failed_navigation_to_its_search(db_path, monkeypatch):
+    log = []
+    scraper = _pooled_scraper(monkeypatch, log)
+    pages = [StubPage("a", log), StubPage("b", log, fail=True)]
+    
+    results = scraper._search_batch(pages, [("python", "Nairobi"), ("python", "Remote")])
+    
+    assert results[0] == (("python", "Nairobi"), [{"url": "a"}])
+    assert isinstance(results[1][1], TimeoutError)
+    assert ("wait", "b") not in log
+    assert ("scroll", ["a"]) in log
+
+
+class StubQueue:
+    max_attempts = 1
+    
+    def __init__(self, searches):
+        self.searches = list(searches)
+        self.started = []
+    
+    def pending(self):
+        return [search for search in self.searches if search not in self.started]
+    
+    def start(self, keyword, location):
+        self.started.append((keyword, location))
+    
+    def finish(self):
+        pass
+
+
+def test_page_pool_runs_searches_in_batches_of_its_size(db_path, monkeypatch):
+    scraper = JobScraper(headless=True)
+    searches = [("python", f"City {n}") for n in range(5)]
+    batches = []
+    
+    def search_batch(pages, batch, meters):
+        batches.append(batch)
+        return [(search, []) for search in batch]
+    
+    monkeypatch.setattr(scraper, "_search_batch", search_batch)
+    monkeypatch.setattr(scraper, "_record_search", lambda *args: None)
+    
+    list(scraper._run_queue(StubQueue(searches), None, pages=["tab1", "tab2"], meters={}))
+    
+    assert batches == [searches[0:2], searches[2:4], searches[4:5]]
+
+
+def test_host_throttle_spaces_navigations_per_host():
+    throttle = HostThrottle(10)
+    
+    assert throttle.reserve("https://www.linkedin.com/jobs/search?keywords=a") == 0
+    assert 9 < throttle.reserve("https://www.linkedin.com/jobs/search?keywords=b") <= 10
+    assert 19 < throttle.reserve("https://www.linkedin.com/jobs/view/1") <= 20
+    assert throttle.reserve("https://example.com/") == 0  # Other hosts are not held back
@@ -0,0 +1,90 @@
+import pytest
+
+
+def _job(n, **overrides):
+    job = dict(url=f"https://example.com/jobs/{n}", title=f"Engineer {n}", company="Acme",
+               location="Nairobi", salary="")
+    job.update(overrides)
+    return job
+
+
+def _urls(rows):
+    return [row['job_url'] for row in rows]
+
+
+@pytest.fixture
+def fts(db):
+    with db.pool.reader() as conn:
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'applications_fts'").fetchone():
+            pytest.skip("SQLite built without FTS5")
+    return db
+
+
+def test_search_finds_notes_after_an_update(fts):
+    fts.add_applications([_job(1), _job(2)])
+    assert fts.search("recruiter") == []
+    
+    fts.update_status(_job(2)['url'], 'Interview Scheduled', notes="Recruiter called back")
+    
+    assert _urls(fts.search("recruiter")) == [_job(2)['url']]
+    fts.update_status(_job(2)['url'], 'Rejected', notes="")
+    assert fts.search("recruiter") == []
+
+
+def test_search_ranks_title_matches_first(fts):
+    fts.add_applications([_job(1, title="Accountant", company="Python Ltd"), _job(2, title="Python Developer")])
+    
+    assert _urls(fts.search("python")) == [_job(2)['url'], _job(1)['url']]
+
+
+def test_search_matches_long_words_and_prefixes(fts):
+    fts.add_applications([_job(1, title="Developer"), _job(2, title="Development Lead"), _job(3, title="Designer")])
+    
+    assert sorted(_urls(fts.search("dev"))) == [_job(1)['url'], _job(2)['url']]
+    # Words past the longest indexed prefix match on that prefix
+    assert _urls(fts.search("developers")) == [_job(1)['url']]
+    assert _urls(fts.search("developmental")) == [_job(2)['url']]
+
+
+def test_search_applies_filters(fts):
+    fts.add_applications([_job(1), _job(2, company="Globex"), _job(3, location="Remote")])
+    
+    assert _urls(fts.search("engineer", {'company': 'globex'})) == [_job(2)['url']]
+    assert _urls(fts.search("engineer", {'location': 'Remote'})) == [_job(3)['url']]
+    assert fts.search("engineer", {'status': 'Rejected'}) == []
+
+
+def test_search_ranks_only_the_newest_candidates(fts):
+    fts.add_applications([_job(1, title="Python Developer")] + [_job(n, company="Python Ltd") for n in range(2, 6)])
+    fts.pool.settings = dict(fts.pool.settings, search_candidates=2)
+    
+    # The best match is older than the two newest candidates
+    assert sorted(_urls(fts.search("python"))) == [_job(4)['url'], _job(5)['url']]
+    
+    fts.pool.settings = dict(fts.pool.settings, search_candidates=0)
+    assert _urls(fts.search("python"))[0] == _job(1)['url']
+
+
+@pytest.mark.parametrize("query", ["", "   ", "*", '"', "-()^:"])
+def test_search_without_words_returns_nothing(fts, query):
+    fts.add_applications([_job(1)])
+    
+    assert fts.search(query) == []
+
+
+def test_search_falls_back_to_like_without_fts(db):
+    db.add_applications([_job(1), _job(2, title="Data Analyst")])
+    db.update_status(_job(2)['url'], 'Applied', notes="Small shop")
+    with db.pool.writer() as conn:
+        conn.execute('DROP TABLE IF EXISTS applications_fts')
+        conn.commit()
+    
+    assert _urls(db.search("analyst")) == [_job(2)['url']]
+    assert _urls(db.search("shop")) == [_job(2)['url']]
+
+
+def test_search_falls_back_to_like_when_fts_rejects_the_query(fts, monkeypatch):
+    fts.add_applications([_job(1, title="Data Analyst")])
+    monkeypatch.setattr("database.fts_match", lambda terms: 'AND ("analyst"')  # fts5: syntax error
+    
+    assert _urls(fts.search("analyst")) == [_job(1)['url']]
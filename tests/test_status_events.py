@@ -0,0 +1,45 @@
+from funnel import FunnelAnalyzer
+
+
+def _history(db):
+    db.add_applications([{'title': 'Engineer', 'company': 'Acme', 'url': f'u{n}'} for n in range(4)])
+    db.update_status('u0', 'Applied')
+    db.update_status('u1', 'Applied')
+    db.schedule_interview('u1', '2026-11-01')
+    db.update_status('u1', 'Rejected', 'Went with another candidate')
+    db.update_status('u2', 'Applied')
+    db.update_status('u2', 'Offer')
+
+
+def test_status_changes_are_logged_in_order(db):
+    _history(db)
+    app_id = db.get_application_ids(['u1'])['u1']
+    
+    history = [(row['from_status'], row['to_status'], row['notes']) for row in db.get_status_history(app_id)]
+    
+    assert history == [
+        ('', 'Applied', None),
+        ('Applied', 'Applied', ''),
+        ('Applied', 'Interview Scheduled', ''),
+        ('Interview Scheduled', 'Rejected', 'Went with another candidate'),
+    ]
+
+
+def test_interview_rate_counts_interviews_that_moved_on(db):
+    _history(db)
+    
+    stats = db.get_stats_summary(1)
+    
+    assert stats['total_applications'] == 3
+    # u1 was interviewed then rejected; u2 went straight to an offer
+    assert stats['interviews'] == 1
+    assert stats['interviews_reached'] == 2
+
+
+def test_funnel_counts_ever_reached(db):
+    _history(db)
+    
+    funnel = FunnelAnalyzer(db).funnel()
+    
+    assert funnel['reached'].tolist() == [4, 3, 2, 1, 0]
+    assert funnel.loc['Applied', 'conversion'] == 0.75
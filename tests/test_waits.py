@@ -0,0 +1,154 @@
+import asyncio
+import time
+
+import pytest
+
+from waits import AsyncWaiter, PlaywrightTimeoutError, Waiter
+
+SETTINGS = {"adaptive": True, "politeness_min": 0.0, "jitter": 0.0, "budgets": {"step": 0.2}}
+
+
+class StubPage:
+    """Readiness signals that fire after `ready_after` seconds (None = never)"""
+    
+    def __init__(self, ready_after=None):
+        self.ready_after = ready_after
+        self.timeouts = []
+    
+    def _signal(self, timeout):
+        self.timeouts.append(timeout)
+        if self.ready_after is not None and self.ready_after * 1000 <= timeout:
+            time.sleep(self.ready_after)
+            return True
+        time.sleep(timeout / 1000)
+        raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+    
+    def wait_for_selector(self, selector, state="visible", timeout=None):
+        return self._signal(timeout)
+    
+    def wait_for_function(self, expression, arg=None, timeout=None):
+        return self._signal(timeout)
+
+
+class AsyncStubPage(StubPage):
+    async def _signal(self, timeout):
+        self.timeouts.append(timeout)
+        if self.ready_after is not None and self.ready_after * 1000 <= timeout:
+            await asyncio.sleep(self.ready_after)
+            return True
+        await asyncio.sleep(timeout / 1000)
+        raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+    
+    async def wait_for_selector(self, selector, state="visible", timeout=None):
+        return await self._signal(timeout)
+    
+    async def wait_for_function(self, expression, arg=None, timeout=None):
+        return await self._signal(timeout)
+
+
+def _timed(call):
+    started = time.monotonic()
+    result = call()
+    return result, time.monotonic() - started
+
+
+def test_returns_as_soon_as_the_selector_appears():
+    waits = Waiter(dict(SETTINGS, budgets={"step": 2.0}))
+    
+    ready, elapsed = _timed(lambda: waits.for_selector(StubPage(ready_after=0.02), "step", "#results"))
+    
+    assert ready is True
+    assert elapsed < 0.5
+    assert waits.stats()["step"]["timeouts"] == 0
+
+
+def test_returns_as_soon_as_the_content_changes():
+    waits = Waiter(dict(SETTINGS, budgets={"step": 2.0}))
+    
+    ready, elapsed = _timed(lambda: waits.for_content_change(StubPage(ready_after=0.02), "step", "#list", "before"))
+    
+    assert ready is True
+    assert elapsed < 0.5
+
+
+def test_falls_back_after_the_budget():
+    waits = Waiter(SETTINGS)
+    page = StubPage()
+    
+    ready, elapsed = _timed(lambda: waits.for_selector(page, "step", "#missing"))
+    
+    assert ready is False
+    assert page.timeouts == [200]  # The step's budget, in ms
+    assert 0.2 <= elapsed < 0.5
+    assert waits.stats()["step"]["timeouts"] == 1
+
+
+def test_explicit_budget_overrides_the_step_budget():
+    waits = Waiter(SETTINGS)
+    page = StubPage()
+    
+    waits.for_selector(page, "step", "#missing", budget=0.05)
+    
+    assert page.timeouts == [50]
+
+
+def test_politeness_floor_applies_to_fast_signals():
+    waits = Waiter(dict(SETTINGS, politeness_min=0.15))
+    
+    ready, elapsed = _timed(lambda: waits.for_selector(StubPage(ready_after=0), "step", "#results"))
+    
+    assert ready is True
+    assert elapsed >= 0.15
+
+
+def test_non_adaptive_sleeps_the_full_budget():
+    waits = Waiter(dict(SETTINGS, adaptive=False))
+    page = StubPage(ready_after=0)
+    
+    ready, elapsed = _timed(lambda: waits.for_selector(page, "step", "#results"))
+    
+    assert ready is True
+    assert page.timeouts == []
+    assert elapsed >= 0.2
+
+
+def test_growth_on_many_pages_shares_one_budget():
+    waits = Waiter(SETTINGS)
+    pages = [StubPage(), StubPage(), StubPage(ready_after=0)]
+    
+    grown, elapsed = _timed(lambda: waits.for_count_growth_many(pages, "step", ".card", [10, 10, 10]))
+    
+    assert grown == [False, False, True]
+    assert elapsed < 0.35  # Not 0.2s per page
+
+
+def test_async_returns_as_soon_as_the_selector_appears():
+    waits = AsyncWaiter(dict(SETTINGS, budgets={"step": 2.0}))
+    
+    ready, elapsed = _timed(lambda: asyncio.run(waits.for_selector(AsyncStubPage(ready_after=0.02), "step", "#results")))
+    
+    assert ready is True
+    assert elapsed < 0.5
+
+
+def test_async_returns_as_soon_as_the_content_changes():
+    waits = AsyncWaiter(dict(SETTINGS, budgets={"step": 2.0}))
+    page = AsyncStubPage(ready_after=0.02)
+    
+    ready, elapsed = _timed(lambda: asyncio.run(waits.for_content_change(page, "step", "#list", "before")))
+    
+    assert ready is True
+    assert elapsed < 0.5
+
+
+@pytest.mark.parametrize("budget, expected_ms", [(None, 200), (0.05, 50)])
+def test_async_falls_back_after_the_budget(budget, expected_ms):
+    waits = AsyncWaiter(SETTINGS)
+    page = AsyncStubPage()
+    
+    ready, elapsed = _timed(lambda: asyncio.run(waits.for_selector(page, "step", "#missing", budget=budget)))
+    
+    assert ready is False
+    assert page.timeouts == [expected_ms]
+    assert expected_ms / 1000 <= elapsed < expected_ms / 1000 + 0.3
+    assert waits.stats()["step"]["timeouts"] == 1
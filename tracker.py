@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
-from database import ApplicationDatabase
+import pandas as pd
+from database import ApplicationDatabase, utc_date
+from funnel import FunnelAnalyzer
 
 class ApplicationTracker:
     def __init__(self):
@@ -48,12 +50,33 @@ class ApplicationTracker:
             print(f"   Rejections: {stats['rejections']}")
             print(f"   Offers: {stats['offers']}")
             
+            # Interviews reached count even if they later became a rejection or an offer
             if stats['total_applications'] > 0:
-                interview_rate = (stats['interviews'] / stats['total_applications']) * 100
+                interview_rate = (stats['interviews_reached'] / stats['total_applications']) * 100
                 print(f"   Interview Rate: {interview_rate:.1f}%")
         
         return stats
     
+    def show_funnel(self, days=None):
+        """Print conversion and median days between stages
+        
+        Args:
+            days: Only applications saved in the last N days (None for all)
+        """
+        since = utc_date(days) if days else None
+        funnel = FunnelAnalyzer(self.db).funnel(since=since)
+        
+        print(f"\n🔻 Application funnel ({f'last {days} days' if days else 'all time'}):")
+        for stage, row in funnel.iterrows():
+            line = f"   {stage:<10} {int(row['reached']):>6}"
+            if pd.notna(row['conversion']):
+                line += f"  {row['conversion'] * 100:5.1f}% of previous"
+            if pd.notna(row['median_days']):
+                line += f"  median {row['median_days']:.1f} days"
+            print(line)
+        
+        return funnel
+    
     def update_application_status(self, job_url, new_status, notes=""):
         """Update the status of an application"""
         valid_statuses = ['Applied', 'Interview Scheduled', 'Rejected', 'Offer', 'Accepted', 'Declined']
@@ -69,13 +92,7 @@ class ApplicationTracker:
     
     def schedule_interview(self, job_url, interview_date, notes=""):
         """Schedule an interview for an application"""
-        cursor = self.db.conn.cursor()
-        cursor.execute('''
-        UPDATE applications 
-        SET interview_date = ?, application_status = 'Interview Scheduled', notes = ?
-        WHERE job_url = ?
-        ''', (interview_date, notes, job_url))
-        self.db.conn.commit()
+        self.db.schedule_interview(job_url, interview_date, notes)
         
         print(f"✓ Interview scheduled for: {interview_date}")
         return True
@@ -0,0 +1,231 @@
+"""
+Adaptive waits for browser automation
+
+Instead of sleeping a fixed time after each action, a Waiter blocks on a
+concrete readiness signal - a selector reaching a state, the network going
+idle, the result count growing or a container's content changing - and
+returns as soon as it fires. Each step has a budget (the old fixed sleep)
+that caps the wait, and a politeness floor plus random jitter keeps the bot
+from acting faster than a person would.
+
+Every wait is recorded per step, so log_summary() shows the time actually
+spent against the time the fixed sleeps would have taken.
+
+Set ADAPTIVE_WAITS=false to fall back to sleeping the full budget.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from config import WAIT_SETTINGS
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+COUNT_GREW_JS = "([selector, previous]) => document.querySelectorAll(selector).length > previous"
+SNAPSHOT_JS = "selector => { const el = document.querySelector(selector); return el ? el.innerText : null; }"
+CHANGED_JS = """
+([selector, before]) => {
+    const el = document.querySelector(selector);
+    return (el ? el.innerText : null) !== before;
+}
+"""
+
+
+class _WaitBase:
+    def __init__(self, settings=None):
+        """Initialize the waiter
+        
+        Args:
+            settings: Override WAIT_SETTINGS (None uses config value)
+        """
+        settings = settings or WAIT_SETTINGS
+        self.adaptive = settings['adaptive']
+        self.politeness_min = settings['politeness_min']
+        self.jitter = settings['jitter']
+        self.budgets = settings['budgets']
+        self._stats = {}
+        self._lock = threading.Lock()
+    
+    def budget(self, step):
+        """Seconds the step used to sleep (and the most it may wait now)"""
+        return self.budgets.get(step, 1.0)
+    
+    def _politeness(self):
+        """Minimum time a step takes, with jitter"""
+        return self.politeness_min + random.uniform(0, self.jitter)
+    
+    def _record(self, step, budget, actual, ready):
+        with self._lock:
+            stats = self._stats.setdefault(step, {'waits': 0, 'budget': 0.0, 'actual': 0.0, 'timeouts': 0})
+            stats['waits'] += 1
+            stats['budget'] += budget
+            stats['actual'] += actual
+            stats['timeouts'] += 0 if ready else 1
+    
+    def stats(self):
+        """Per-step totals: waits, budget and actual seconds, timeouts"""
+        with self._lock:
+            return {step: dict(values) for step, values in self._stats.items()}
+    
+    def log_summary(self):
+        """Log actual vs budgeted wait time per step"""
+        stats = self.stats()
+        if not stats:
+            return
+        
+        total_budget = sum(s['budget'] for s in stats.values())
+        total_actual = sum(s['actual'] for s in stats.values())
+        logger.info(f"Waited {total_actual:.1f}s of a {total_budget:.1f}s fixed-sleep budget "
+                    f"(saved {total_budget - total_actual:.1f}s)")
+        for step, s in sorted(stats.items()):
+            logger.info(f"   {step}: {s['waits']} waits, {s['actual']:.1f}s of {s['budget']:.1f}s"
+                        f" ({s['timeouts']} hit the budget)")
+
+
+class Waiter(_WaitBase):
+    """Adaptive waits for the sync Playwright API"""
+    
+    def _settle(self, started):
+        """Sleep out whatever is left of the politeness floor"""
+        remaining = self._politeness() - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+    
+    def _wait(self, step, budget, signal):
+        """Run signal(timeout_ms) within budget, then apply politeness
+        
+        Returns:
+            bool: True if the signal fired before the budget ran out
+        """
+        budget = self.budget(step) if budget is None else budget
+        started = time.monotonic()
+        
+        if not self.adaptive:
+            time.sleep(budget)
+            self._record(step, budget, time.monotonic() - started, True)
+            return True
+        
+        try:
+            signal(max(1, int(budget * 1000)))
+            ready = True
+        except PlaywrightTimeoutError:
+            ready = False
+        self._settle(started)
+        
+        self._record(step, budget, time.monotonic() - started, ready)
+        return ready
+    
+    def pause(self, step, min_seconds, max_seconds):
+        """A human-like pause with no readiness signal to wait on"""
+        started = time.monotonic()
+        if self.adaptive:
+            self._settle(started)
+        else:
+            time.sleep(random.uniform(min_seconds, max_seconds))
+        self._record(step, (min_seconds + max_seconds) / 2, time.monotonic() - started, True)
+    
+    def for_selector(self, page, step, selector, state="visible", budget=None):
+        """Wait until selector reaches state"""
+        return self._wait(step, budget, lambda ms: page.wait_for_selector(selector, state=state, timeout=ms))
+    
+    def for_load(self, page, step, state="networkidle", budget=None):
+        """Wait for a page load state after a navigation"""
+        return self._wait(step, budget, lambda ms: page.wait_for_load_state(state, timeout=ms))
+    
+    def for_count_growth(self, page, step, selector, previous, budget=None):
+        """Wait until more than `previous` elements match selector"""
+        return self._wait(step, budget, lambda ms: page.wait_for_function(COUNT_GREW_JS, arg=[selector, previous], timeout=ms))
+    
+    def for_count_growth_many(self, pages, step, selector, previous, budget=None):
+        """Wait for growth on several pages under one shared budget
+        
+        Args:
+            pages: Pages to watch
+            previous: Match counts per page, in the same order
+        
+        Returns:
+            list: True/False per page
+        """
+        budget = self.budget(step) if budget is None else budget
+        started = time.monotonic()
+        
+        if not self.adaptive:
+            time.sleep(budget)
+            self._record(step, budget, time.monotonic() - started, True)
+            return [True] * len(pages)
+        
+        deadline = started + budget
+        grown = []
+        for page, count in zip(pages, previous):
+            remaining = max(1, int((deadline - time.monotonic()) * 1000))
+            try:
+                page.wait_for_function(COUNT_GREW_JS, arg=[selector, count], timeout=remaining)
+                grown.append(True)
+            except PlaywrightTimeoutError:
+                grown.append(False)
+        self._settle(started)
+        
+        self._record(step, budget, time.monotonic() - started, all(grown))
+        return grown
+    
+    def snapshot(self, page, selector):
+        """Text of the first element matching selector (None if absent)"""
+        return page.evaluate(SNAPSHOT_JS, selector)
+    
+    def for_content_change(self, page, step, selector, before, budget=None):
+        """Wait until the text of selector differs from a snapshot()"""
+        return self._wait(step, budget, lambda ms: page.wait_for_function(CHANGED_JS, arg=[selector, before], timeout=ms))
+
+
+class AsyncWaiter(_WaitBase):
+    """Adaptive waits for the async Playwright API"""
+    
+    async def _settle(self, started):
+        remaining = self._politeness() - (time.monotonic() - started)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+    
+    async def _wait(self, step, budget, signal):
+        budget = self.budget(step) if budget is None else budget
+        started = time.monotonic()
+        
+        if not self.adaptive:
+            await asyncio.sleep(budget)
+            self._record(step, budget, time.monotonic() - started, True)
+            return True
+        
+        try:
+            await signal(max(1, int(budget * 1000)))
+            ready = True
+        except PlaywrightTimeoutError:
+            ready = False
+        await self._settle(started)
+        
+        self._record(step, budget, time.monotonic() - started, ready)
+        return ready
+    
+    async def pause(self, step, min_seconds, max_seconds):
+        started = time.monotonic()
+        if self.adaptive:
+            await self._settle(started)
+        else:
+            await asyncio.sleep(random.uniform(min_seconds, max_seconds))
+        self._record(step, (min_seconds + max_seconds) / 2, time.monotonic() - started, True)
+    
+    async def for_selector(self, page, step, selector, state="visible", budget=None):
+        return await self._wait(step, budget, lambda ms: page.wait_for_selector(selector, state=state, timeout=ms))
+    
+    async def for_load(self, page, step, state="networkidle", budget=None):
+        return await self._wait(step, budget, lambda ms: page.wait_for_load_state(state, timeout=ms))
+    
+    async def for_count_growth(self, page, step, selector, previous, budget=None):
+        return await self._wait(step, budget, lambda ms: page.wait_for_function(COUNT_GREW_JS, arg=[selector, previous], timeout=ms))
+    
+    async def snapshot(self, page, selector):
+        return await page.evaluate(SNAPSHOT_JS, selector)
+    
+    async def for_content_change(self, page, step, selector, before, budget=None):
+        return await self._wait(step, budget, lambda ms: page.wait_for_function(CHANGED_JS, arg=[selector, before], timeout=ms))